@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Binary game archives.
+
+    MAGIC
+    game records
+    index: one little-endian uint64 offset per game record
+    footer: uint64 index offset, uint64 game count, MAGIC
+
+A game record is the variant number (1 byte), the length of the initial FEN (uint16, 0 for the start position),
+the FEN, the number of moves and then every move as its index in the sorted legal moves of its position.
+Numbers after the FEN are varints (7 bits per byte, low bits first), so most moves take one byte.
+"""
+
+import mmap
+import struct
+from .game import Game, IllegalMoveError
+
+MAGIC = b'DRARC\x00\x00\x01'
+
+VARIANTS = ('standard', 'frisian', 'frysk!', 'russian', 'brazilian', 'breakthrough')
+
+RECORD_HEADER = struct.Struct('<BH')
+OFFSET = struct.Struct('<Q')
+FOOTER = struct.Struct('<QQ8s')
+
+def encode_varint(value, output):
+    while value >= 0x80:
+        output.append(value & 0x7f | 0x80)
+        value >>= 7
+    output.append(value)
+
+
+def decode_varint(data, position):
+    value = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def get_move_key(move, captures):
+    return (move[0][0],) + tuple(semi_move[1] for semi_move in move), tuple(captures)
+
+
+def sorted_legal_moves(game):
+    """
+    Legal moves in an order that does not depend on the move generator, (moves, captures).
+    """
+    moves, captures = game.legal_moves()
+    order = sorted(range(len(moves)), key=lambda index: get_move_key(moves[index], captures[index]))
+    return [moves[index] for index in order], [captures[index] for index in order]
+
+
+def encode_game(game):
+    """
+    The archive record of the completed moves of a game.
+    """
+    fen = b'' if game.initial_fen == 'startpos' else game.initial_fen.encode()
+    record = bytearray(RECORD_HEADER.pack(VARIANTS.index(game.variant), len(fen)))
+    record += fen
+    encode_varint(len(game.move_stack), record)
+    replay = Game(game.variant, game.initial_fen)
+    for ply, (li_move, captures) in enumerate(zip(game.move_stack, game.capture_stack)):
+        move = replay.li_to_steps(li_move)
+        moves, possible_captures = sorted_legal_moves(replay)
+        keys = [get_move_key(possible_move, possible_capture) for possible_move, possible_capture in zip(moves, possible_captures)]
+        key = get_move_key(move, captures)
+        if key not in keys:
+            raise IllegalMoveError(f'The move {li_move} at ply {ply} is not possible', ply)
+        encode_varint(keys.index(key), record)
+        replay.push_trusted_move(move)
+    return bytes(record)
+
+
+def decode_record(data, position=0):
+    """
+    (variant, initial fen, move indices) of the record starting at position.
+    """
+    variant, fen_length = RECORD_HEADER.unpack_from(data, position)
+    position += RECORD_HEADER.size
+    fen = bytes(data[position:position + fen_length]).decode() if fen_length else 'startpos'
+    position += fen_length
+    count, position = decode_varint(data, position)
+    indices = []
+    for _ in range(count):
+        index, position = decode_varint(data, position)
+        indices.append(index)
+    return VARIANTS[variant], fen, indices
+
+
+def decode_game(variant, fen, indices, move_cache=None):
+    game = Game(variant, fen, move_cache)
+    for index in indices:
+        game.push_trusted_move(sorted_legal_moves(game)[0][index])
+    return game
+
+
+class ArchiveWriter:
+    """
+    Appends games to a new archive, the index is written by close.
+
+        with ArchiveWriter('games.drarc') as writer:
+            writer.add(game)
+    """
+
+    def __init__(self, path):
+        self.file = open(path, 'wb')
+        self.file.write(MAGIC)
+        self.offsets = []
+        self.position = len(MAGIC)
+
+    def add(self, game):
+        if game.not_added_move:
+            raise ValueError('A capture sequence is in progress')
+        record = encode_game(game)
+        self.offsets.append(self.position)
+        self.file.write(record)
+        self.position += len(record)
+
+    def close(self):
+        if self.file.closed:
+            return
+        index = bytearray()
+        for offset in self.offsets:
+            index += OFFSET.pack(offset)
+        self.file.write(index)
+        self.file.write(FOOTER.pack(self.position, len(self.offsets), MAGIC))
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write_archive(path, games):
+    """
+    Writes the games to a new archive and returns how many were written.
+    """
+    with ArchiveWriter(path) as writer:
+        for game in games:
+            writer.add(game)
+    return len(writer.offsets)
+
+
+class ArchiveReader:
+    """
+    Memory-maps an archive, archive[n] replays game n after one lookup in the index.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as file:
+            self.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.mmap) < len(MAGIC) + FOOTER.size or self.mmap[:len(MAGIC)] != MAGIC:
+            self.mmap.close()
+            raise ValueError(f'{path} is not a game archive')
+        self.index_offset, self.count, magic = FOOTER.unpack_from(self.mmap, len(self.mmap) - FOOTER.size)
+        if magic != MAGIC:
+            self.mmap.close()
+            raise ValueError(f'{path} was not closed properly')
+
+    def __len__(self):
+        return self.count
+
+    def get_record(self, number):
+        """
+        (variant, initial fen, move indices) of game number, without replaying it.
+        """
+        if number < 0:
+            number += self.count
+        if not 0 <= number < self.count:
+            raise IndexError('Game number out of range')
+        offset = OFFSET.unpack_from(self.mmap, self.index_offset + number * OFFSET.size)[0]
+        return decode_record(self.mmap, offset)
+
+    def get_game(self, number, move_cache=None):
+        return decode_game(*self.get_record(number), move_cache)
+
+    def __getitem__(self, number):
+        return self.get_game(number)
+
+    def __iter__(self):
+        for number in range(self.count):
+            yield self.get_game(number)
+
+    def close(self):
+        self.mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
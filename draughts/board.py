@@ -22,14 +22,325 @@ from copy import deepcopy
 from functools import reduce
 from .board_searcher import BoardSearcher
 from .board_initializer import BoardInitializer
+from .zobrist import PIECE_KEYS, WHITE_TO_MOVE_KEY, CONTINUATION_KEYS, get_pieces_key
+from .geometry import get_geometry, DIAGONAL_DIRECTIONS, DOWN_LEFT, DOWN_RIGHT, UP_LEFT, UP_RIGHT, LEFT, RIGHT, DOWN, UP
+from collections import namedtuple
 import pickle
 
 WHITE = 2
 BLACK = 1
 
+UndoInfo = namedtuple('UndoInfo', ['move', 'piece', 'was_king', 'became_king', 'captured_piece', 'captured_position', 'piece_requiring_further_capture_moves', 'previous_move_was_capture', 'player_turn'])
+
+class BitBoardLayout:
+    """
+    Square to bit mapping, step masks and rays shared by every bitboard of the same size and variant.
+
+    Squares are mapped to bits with one ghost bit after every two rows, so a
+    diagonal step is always the same shift (width or width + 1) and steps that
+    would leave the board land on a ghost or outside the mask.
+    """
+
+    def __init__(self, width, height, variant='standard'):
+        geometry = get_geometry(width, height, variant)
+        self.width = width
+        self.height = height
+        self.variant = variant
+        self.bits = {}
+        self.squares = {}
+        for position in geometry.positions:
+            index = position - 1 + (position - 1) // (2 * width)
+            self.bits[position] = 1 << index
+            self.squares[index] = position
+        self.board_mask = sum(self.bits.values())
+
+        shifts = {
+            DOWN_LEFT: width,
+            DOWN_RIGHT: width + 1,
+            UP_LEFT: -width - 1,
+            UP_RIGHT: -width,
+            LEFT: -1,
+            RIGHT: 1,
+            DOWN: 2 * width + 1,
+            UP: -2 * width - 1,
+        }
+        self.forward_directions = {BLACK: (shifts[DOWN_LEFT], shifts[DOWN_RIGHT]), WHITE: (shifts[UP_LEFT], shifts[UP_RIGHT])}
+        self.move_directions = tuple(shifts[direction] for direction in DIAGONAL_DIRECTIONS)
+        self.capture_directions = tuple(shifts[direction] for direction in geometry.capture_directions)
+        self.promotion_masks = {}
+        for player, row in geometry.promotion_rows.items():
+            self.promotion_masks[player] = sum(self.bits[position] for position in geometry.positions if geometry.rows[position] == row)
+        self.promotes_during_capture = variant == 'russian'
+
+        self.step_sources = dict.fromkeys(shifts.values(), 0)
+        self.jump_sources = dict.fromkeys(shifts.values(), 0)
+        self.rays = {}
+        for position in geometry.positions:
+            index = self.bits[position].bit_length() - 1
+            self.rays[index] = {}
+            for direction, amount in shifts.items():
+                ray = geometry.rays[direction][position]
+                self.rays[index][amount] = tuple(self.bits[target].bit_length() - 1 for target in ray)
+                if len(ray) >= 1:
+                    self.step_sources[amount] |= 1 << index
+                if len(ray) >= 2:
+                    self.jump_sources[amount] |= 1 << index
+
+    def __reduce__(self):
+        return get_bitboard_layout, (self.width, self.height, self.variant)
+
+
+bitboard_layouts = {}
+
+
+def get_bitboard_layout(width, height, variant='standard'):
+    key = (width, height, variant)
+    if key not in bitboard_layouts:
+        bitboard_layouts[key] = BitBoardLayout(width, height, variant)
+    return bitboard_layouts[key]
+
+
+class BitBoard:
+    """
+    Integer bitmask view of a board (white men, white kings, black men, black kings) used for fast move generation.
+    """
+
+    __slots__ = ('layout', 'white_men', 'white_kings', 'black_men', 'black_kings')
+
+    def __init__(self, width, height, variant='standard'):
+        self.layout = get_bitboard_layout(width, height, variant)
+        self.white_men = 0
+        self.white_kings = 0
+        self.black_men = 0
+        self.black_kings = 0
+
+    def build(self, pieces):
+        bits = self.layout.bits
+        self.white_men = 0
+        self.white_kings = 0
+        self.black_men = 0
+        self.black_kings = 0
+        for piece in pieces:
+            if piece.captured:
+                continue
+            bit = bits[piece.position]
+            if piece.player == WHITE:
+                if piece.king:
+                    self.white_kings |= bit
+                else:
+                    self.white_men |= bit
+            else:
+                if piece.king:
+                    self.black_kings |= bit
+                else:
+                    self.black_men |= bit
+
+    def toggle_piece(self, player, king, position):
+        bit = self.layout.bits[position]
+        if player == WHITE:
+            if king:
+                self.white_kings ^= bit
+            else:
+                self.white_men ^= bit
+        else:
+            if king:
+                self.black_kings ^= bit
+            else:
+                self.black_men ^= bit
+
+    def move_piece(self, player, start, was_king, end, king):
+        self.toggle_piece(player, was_king, start)
+        self.toggle_piece(player, king, end)
+
+    @property
+    def empty(self):
+        return self.layout.board_mask & ~(self.white_men | self.white_kings | self.black_men | self.black_kings)
+
+    def get_men(self, player):
+        return self.white_men if player == WHITE else self.black_men
+
+    def get_kings(self, player):
+        return self.white_kings if player == WHITE else self.black_kings
+
+    def get_player_pieces(self, player):
+        return self.get_men(player) | self.get_kings(player)
+
+    def get_captures_mask(self, captures):
+        mask = 0
+        for position in captures:
+            if position is not None:
+                mask |= self.layout.bits[position]
+        return mask
+
+    def iter_indexes(self, mask):
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+
+    def get_positional_moves(self, player, position=None):
+        return list(self.iter_positional_moves(player, position))
+
+    def iter_positional_moves(self, player, position=None):
+        """
+        Yields [from, to] positional moves ordered by starting position, then by destination.
+        """
+        layout = self.layout
+        squares = layout.squares
+        selection = layout.board_mask if position is None else layout.bits[position]
+        men = self.get_men(player) & selection
+        kings = self.get_kings(player) & selection
+        empty = self.empty
+        steps = [(direction, men & layout.step_sources[direction] & shift(empty, -direction)) for direction in layout.forward_directions[player]]
+        movers = kings
+        for _, mask in steps:
+            movers |= mask
+
+        for index in self.iter_indexes(movers):
+            if kings >> index & 1:
+                rays = layout.rays[index]
+                targets = []
+                for direction in layout.move_directions:
+                    for target in rays[direction]:
+                        if not empty >> target & 1:
+                            break
+                        targets.append(target)
+                targets.sort()
+                for target in targets:
+                    yield [squares[index], squares[target]]
+            else:
+                for direction, mask in steps:
+                    if mask >> index & 1:
+                        yield [squares[index], squares[index + direction]]
+
+    def get_capture_moves(self, player, captures, position=None):
+        return list(self.iter_capture_moves(player, captures, position))
+
+    def iter_capture_moves(self, player, captures, position=None):
+        """
+        Yields [from, to] capture steps ordered by starting position, then by destination.
+        """
+        layout = self.layout
+        squares = layout.squares
+        selection = layout.board_mask if position is None else layout.bits[position]
+        men = self.get_men(player) & selection
+        kings = self.get_kings(player) & selection
+        enemies = self.get_player_pieces(BLACK if player == WHITE else WHITE)
+        blocked = self.get_captures_mask(captures)
+        empty = self.empty & ~blocked
+        jumps = self.get_jumps(men, enemies, empty)
+        jumpers = kings
+        for _, mask in jumps:
+            jumpers |= mask
+
+        for index in self.iter_indexes(jumpers):
+            targets = []
+            if kings >> index & 1:
+                rays = layout.rays[index]
+                for direction in layout.capture_directions:
+                    ray = rays[direction]
+                    for distance, target in enumerate(ray):
+                        if not empty >> target & 1:
+                            break
+                    else:
+                        continue
+                    if blocked >> target & 1 or not enemies >> target & 1:
+                        continue
+                    for landing in ray[distance + 1:]:
+                        if not empty >> landing & 1:
+                            break
+                        targets.append(landing)
+            else:
+                for direction, mask in jumps:
+                    if mask >> index & 1:
+                        targets.append(index + 2 * direction)
+            targets.sort()
+            for target in targets:
+                yield [squares[index], squares[target]]
+
+    def get_jumps(self, men, enemies, empty):
+        """
+        (direction, mask of the men that can jump an enemy in that direction) for every capture direction.
+        """
+        layout = self.layout
+        return [(direction, men & layout.jump_sources[direction] & shift(enemies, -direction) & shift(empty, -2 * direction)) for direction in layout.capture_directions]
+
+    def get_capture_sequences(self, player, captures, position=None):
+        return list(self.iter_capture_sequences(player, captures, position))
+
+    def iter_capture_sequences(self, player, captures, position=None):
+        """
+        Depth-first search over complete capture sequences, yielded as sorted (steps, captured positions) pairs
+        one starting piece at a time. Captured pieces stay on the board until the sequence ends, so they block
+        the capturing piece but can't be captured twice.
+        """
+        layout = self.layout
+        squares = layout.squares
+        rays = layout.rays
+        directions = layout.capture_directions
+        promotion_mask = layout.promotion_masks[player] if layout.promotes_during_capture else 0
+        selection = layout.board_mask if position is None else layout.bits[position]
+        blocked = self.get_captures_mask(captures)
+        enemies = self.get_player_pieces(BLACK if player == WHITE else WHITE) & ~blocked
+        empty = self.empty & ~blocked
+        kings = self.get_kings(player)
+        sequences = []
+        steps = []
+        captured = []
+
+        def search(index, king, free, capturable):
+            found = False
+            for direction in directions:
+                ray = rays[index][direction]
+                if king:
+                    for distance, target in enumerate(ray):
+                        if not free >> target & 1:
+                            break
+                    else:
+                        continue
+                    if not capturable >> target & 1:
+                        continue
+                    landings = []
+                    for landing in ray[distance + 1:]:
+                        if not free >> landing & 1:
+                            break
+                        landings.append(landing)
+                else:
+                    if len(ray) < 2 or not capturable >> ray[0] & 1 or not free >> ray[1] & 1:
+                        continue
+                    target = ray[0]
+                    landings = ray[1:2]
+                for landing in landings:
+                    found = True
+                    steps.append([squares[index], squares[landing]])
+                    captured.append(squares[target])
+                    search(landing, king or bool(promotion_mask >> landing & 1), free, capturable & ~(1 << target))
+                    steps.pop()
+                    captured.pop()
+            if not found and steps:
+                sequences.append((list(steps), list(captured)))
+
+        jumpers = kings & selection
+        for _, mask in self.get_jumps(self.get_men(player) & selection, enemies, empty):
+            jumpers |= mask
+        for index in self.iter_indexes(jumpers):
+            search(index, bool(kings >> index & 1), empty | 1 << index, enemies)
+            if sequences:
+                sequences.sort()
+                yield from sequences
+                sequences = []
+
+
+def shift(mask, amount):
+    return mask << amount if amount > 0 else mask >> -amount
+
+
 class Board:
 
-    def __init__(self, variant='standard', fen='startpos'):
+    __slots__ = ('player_turn', 'width', 'height', 'position_count', 'rows_per_user_with_pieces', 'geometry', 'piece_requiring_further_capture_moves', 'previous_move_was_capture',
+                 'variant', 'fen', 'bitboard', 'state_version', 'searcher', 'pieces_key', '_pieces')
+
+    def __init__(self, variant='standard', fen='startpos', bitboard=True):
         if fen != 'startpos':
             self.player_turn = 2 if fen[0].lower() == 'w' else 1
         else:
@@ -47,17 +358,22 @@ class Board:
             self.rows_per_user_with_pieces = 3
         else:
             self.rows_per_user_with_pieces = 4
-        self.position_layout = {}
+        self.geometry = get_geometry(self.width, self.height, variant)
         self.piece_requiring_further_capture_moves = None
         self.previous_move_was_capture = False
         self.variant = variant
         self.fen = fen
+        self.bitboard = BitBoard(self.width, self.height, variant) if bitboard else None
+        self.state_version = 0
         self.searcher = BoardSearcher()
         BoardInitializer(self, self.fen).initialize()
 
     def count_movable_player_pieces(self, player_number=1, captures=None):
         if captures is None:
             captures = []
+        if self.bitboard is not None:
+            moves = self.bitboard.get_capture_moves(player_number, captures) + self.bitboard.get_positional_moves(player_number)
+            return len(set(move[0] for move in moves))
         return reduce((lambda count, piece: count + (1 if piece.is_movable(captures) else 0)), self.searcher.get_pieces_by_player(player_number), 0)
 
     def get_possible_moves(self, captures):
@@ -65,82 +381,240 @@ class Board:
 
         return capture_moves if capture_moves else self.get_possible_positional_moves()
 
+    def iter_possible_moves(self, captures):
+        """
+        Yields the steps of get_possible_moves one at a time, in the same order.
+        """
+        has_capture = False
+        for move in self.iter_possible_capture_moves(captures):
+            has_capture = True
+            yield move
+        if not has_capture:
+            yield from self.iter_possible_positional_moves()
+
     def get_possible_capture_moves(self, captures):
-        return reduce((lambda moves, piece: moves + piece.get_possible_capture_moves(captures)), self.searcher.get_pieces_in_play(), [])
+        return list(self.iter_possible_capture_moves(captures))
+
+    def iter_possible_capture_moves(self, captures):
+        if self.bitboard is not None:
+            return self.bitboard.iter_capture_moves(self.player_turn, captures, self.get_position_in_play())
+        return (move for piece in self.searcher.get_pieces_in_play() for move in piece.get_possible_capture_moves(captures))
 
     def get_possible_positional_moves(self):
-        return reduce((lambda moves, piece: moves + piece.get_possible_positional_moves()), self.searcher.get_pieces_in_play(), [])
+        return list(self.iter_possible_positional_moves())
 
-    def position_is_open(self, position):
-        return not self.searcher.get_piece_by_position(position)
+    def iter_possible_positional_moves(self):
+        if self.bitboard is not None:
+            return self.bitboard.iter_positional_moves(self.player_turn, self.get_position_in_play())
+        return (move for piece in self.searcher.get_pieces_in_play() for move in piece.get_possible_positional_moves())
 
-    def create_new_board_from_move(self, move, move_number, captures, return_captured=False):
-        new_board = pickle.loads(pickle.dumps(self, -1))  # A lot faster that deepcopy
-        enemy_position = None
+    def get_move_sequences(self, captures):
+        """
+        Complete moves for the side to move as (moves, captured_pieces) lists, where every move is a list of
+        steps and captured_pieces holds the captured positions of every step ([None] for a positional move).
+        """
+        if self.bitboard is not None:
+            sequences = self.bitboard.get_capture_sequences(self.player_turn, captures, self.get_position_in_play())
+            if sequences:
+                return [sequence[0] for sequence in sequences], [sequence[1] for sequence in sequences]
+            moves = self.get_possible_positional_moves()
+            return [[move] for move in moves], [[None] for move in moves]
 
-        if move in self.get_possible_capture_moves(captures):
-            if return_captured:
-                enemy_position = new_board.perform_capture_move(move, move_number, captures, return_captured=return_captured)
+        turn = self.player_turn
+        moves = []
+        captured_pieces = []
+        for move in self.get_possible_moves(captures):
+            undo_info = self.make(move, 0, captures)
+            captured_position = undo_info.captured_position
+            if self.player_turn == turn:
+                more_moves, more_captures = self.get_move_sequences(captures + [captured_position])
+                for semi_move, semi_capture in zip(more_moves, more_captures):
+                    moves.append([move] + semi_move)
+                    captured_pieces.append([captured_position] + semi_capture)
             else:
-                new_board.perform_capture_move(move, move_number, captures)
-        else:
-            new_board.perform_positional_move(move, move_number)
+                moves.append([move])
+                captured_pieces.append([captured_position])
+            self.unmake(undo_info)
+        return moves, captured_pieces
 
-        if return_captured:
-            return new_board, enemy_position
-        else:
-            return new_board
+    def iter_move_sequences(self, captures):
+        """
+        Yields the (move, captured_pieces) pairs of get_move_sequences one at a time, in the same order.
+        """
+        if self.bitboard is None:
+            # The piece generator plays the steps on this board, so its sequences are collected first.
+            yield from zip(*self.get_move_sequences(captures))
+            return
+        has_capture = False
+        for sequence in self.bitboard.iter_capture_sequences(self.player_turn, captures, self.get_position_in_play()):
+            has_capture = True
+            yield sequence
+        if not has_capture:
+            for move in self.iter_possible_positional_moves():
+                yield [move], [None]
+
+    def get_position_in_play(self):
+        piece = self.piece_requiring_further_capture_moves
+        return piece.position if piece is not None else None
+
+    def position_is_open(self, position):
+        return not self.searcher.get_piece_by_position(position)
 
-    def perform_capture_move(self, move, move_number, captures, return_captured=False):
-        self.previous_move_was_capture = True
+    def get_captured_position(self, move):
+        direction = self.geometry.get_direction_between(move[0], move[1])
+        if direction is None:
+            return None
+        for position in self.geometry.rays[direction][move[0]]:
+            if position == move[1]:
+                break
+            if self.searcher.get_piece_by_position(position) is not None:
+                return position
+        return None
+
+    def get_capture_moves_from(self, position, captures):
+        if self.bitboard is not None:
+            return self.bitboard.get_capture_moves(self.player_turn, captures, position)
+        return self.searcher.get_piece_by_position(position).get_possible_capture_moves(captures)
+
+    def make(self, move, move_number=0, captures=None):
+        """
+        Plays a single step (one jump of a capture sequence) in place and returns the UndoInfo needed by unmake.
+        The move is trusted to be possible, use get_possible_moves to validate it first.
+        """
+        if captures is None:
+            captures = []
         piece = self.searcher.get_piece_by_position(move[0])
-        originally_was_king = piece.king
-        enemy_piece = piece.capture_move_enemies[move[1]]
-        enemy_position = enemy_piece.position
-        enemy_piece.capture()
+        captured_position = self.get_captured_position(move)
+        captured_piece = self.searcher.get_piece_by_position(captured_position) if captured_position is not None else None
+        undo_info = UndoInfo(move, piece, piece.king, piece.became_king, captured_piece, captured_position, self.piece_requiring_further_capture_moves, self.previous_move_was_capture, self.player_turn)
+
+        self.previous_move_was_capture = captured_piece is not None
+        if captured_piece is not None:
+            self.capture_piece(captured_piece)
         self.move_piece(move, move_number)
-        if not originally_was_king and self.variant != 'russian':
-            was_king = piece.king
-            piece.king = False
-            further_capture_moves_for_piece = [capture_move for capture_move in self.get_possible_capture_moves(captures + [enemy_position]) if move[1] == capture_move[0]]
-            if not further_capture_moves_for_piece and was_king:
-                piece.king = True
-        else:
-            further_capture_moves_for_piece = [capture_move for capture_move in self.get_possible_capture_moves(captures + [enemy_position]) if move[1] == capture_move[0]]
+
+        if captured_piece is None:
+            self.piece_requiring_further_capture_moves = None
+            self.switch_turn()
+            return undo_info
+
+        promoted = piece.king and not undo_info.was_king
+        if promoted and self.variant != 'russian':
+            # A man only promotes if the capture sequence ends on the promotion row.
+            self.set_piece_king(piece, False)
+        further_capture_moves_for_piece = self.get_capture_moves_from(move[1], captures + [captured_position])
+        if promoted and self.variant != 'russian':
+            if further_capture_moves_for_piece:
+                piece.became_king = undo_info.became_king
+            else:
+                self.set_piece_king(piece, True)
 
         if further_capture_moves_for_piece:
-            self.piece_requiring_further_capture_moves = self.searcher.get_piece_by_position(move[1])
+            self.piece_requiring_further_capture_moves = piece
         else:
             self.piece_requiring_further_capture_moves = None
             self.switch_turn()
-        if return_captured:
-            return enemy_position
+        return undo_info
 
-    def perform_positional_move(self, move, move_number):
-        self.previous_move_was_capture = False
-        self.move_piece(move, move_number)
-        self.switch_turn()
+    def unmake(self, undo_info):
+        piece = undo_info.piece
+        start, end = undo_info.move
+        king = piece.king
+        piece.position = start
+        piece.king = undo_info.was_king
+        piece.became_king = undo_info.became_king
+        self.searcher.move_piece(piece, end, start, king)
+        if self.bitboard is not None:
+            self.bitboard.move_piece(piece.player, end, king, start, piece.king)
+        self.pieces_key ^= PIECE_KEYS[piece.player][king][end] ^ PIECE_KEYS[piece.player][piece.king][start]
+        if undo_info.captured_piece is not None:
+            self.restore_piece(undo_info.captured_piece, undo_info.captured_position)
+        self.piece_requiring_further_capture_moves = undo_info.piece_requiring_further_capture_moves
+        self.previous_move_was_capture = undo_info.previous_move_was_capture
+        self.player_turn = undo_info.player_turn
+        self.state_version += 1
+
+    def create_new_board_from_move(self, move, move_number, captures, return_captured=False):
+        new_board = pickle.loads(pickle.dumps(self, -1))  # A lot faster that deepcopy
+        undo_info = new_board.make(move, move_number, captures)
+
+        if return_captured:
+            return new_board, undo_info.captured_position
+        else:
+            return new_board
 
     def switch_turn(self):
         self.player_turn = BLACK if self.player_turn == WHITE else WHITE
 
     def move_piece(self, move, move_number):
-        self.searcher.get_piece_by_position(move[0]).move(move[1], move_number)
-        self.pieces = sorted(self.pieces, key=lambda piece: piece.position if piece.position else 0)
+        piece = self.searcher.get_piece_by_position(move[0])
+        was_king = piece.king
+        piece.move(move[1], move_number)
+        self.searcher.move_piece(piece, move[0], move[1], was_king)
+        if self.bitboard is not None:
+            self.bitboard.move_piece(piece.player, move[0], was_king, move[1], piece.king)
+        self.pieces_key ^= PIECE_KEYS[piece.player][was_king][move[0]] ^ PIECE_KEYS[piece.player][piece.king][move[1]]
+        self.state_version += 1
+
+    def capture_piece(self, piece):
+        position = piece.position
+        piece.capture()
+        self.searcher.remove_piece(piece, position)
+        if self.bitboard is not None:
+            self.bitboard.toggle_piece(piece.player, piece.king, position)
+        self.pieces_key ^= PIECE_KEYS[piece.player][piece.king][position]
+        self.state_version += 1
+
+    def restore_piece(self, piece, position):
+        piece.captured = False
+        piece.position = position
+        self.searcher.add_piece(piece)
+        if self.bitboard is not None:
+            self.bitboard.toggle_piece(piece.player, piece.king, position)
+        self.pieces_key ^= PIECE_KEYS[piece.player][piece.king][position]
+        self.state_version += 1
+
+    def set_piece_king(self, piece, king):
+        was_king = piece.king
+        piece.king = king
+        self.searcher.move_piece(piece, piece.position, piece.position, was_king)
+        if self.bitboard is not None:
+            self.bitboard.move_piece(piece.player, piece.position, was_king, piece.position, king)
+        self.pieces_key ^= PIECE_KEYS[piece.player][was_king][piece.position] ^ PIECE_KEYS[piece.player][king][piece.position]
+        self.state_version += 1
 
     def is_valid_row_and_column(self, row, column):
-        if row < 0 or row >= self.height:
-            return False
+        return column in self.position_layout.get(row, {})
+
+    @property
+    def position_layout(self):
+        return self.geometry.position_layout
 
-        if column < 0 or column >= self.width:
-            return False
+    @property
+    def zobrist_key(self):
+        """
+        64-bit Zobrist key of the pieces, the side to move and the piece that has to continue capturing.
+        """
+        key = self.pieces_key
+        if self.player_turn == WHITE:
+            key ^= WHITE_TO_MOVE_KEY
+        if self.piece_requiring_further_capture_moves is not None:
+            key ^= CONTINUATION_KEYS[self.piece_requiring_further_capture_moves.position]
+        return key
 
-        return True
+    def update_bitboard(self):
+        if self.bitboard is not None:
+            self.bitboard.build(self.pieces)
 
-    def __setattr__(self, name, value):
-        super(Board, self).__setattr__(name, value)
+    @property
+    def pieces(self):
+        return self._pieces
 
-        if name == 'pieces':
-            [piece.reset_for_new_board() for piece in self.pieces]
+    @pieces.setter
+    def pieces(self, pieces):
+        self._pieces = pieces
+        [piece.reset_for_new_board() for piece in self.pieces]
 
-            self.searcher.build(self)
\ No newline at end of file
+        self.searcher.build(self)
+        self.update_bitboard()
+        self.pieces_key = get_pieces_key(self.pieces)
\ No newline at end of file
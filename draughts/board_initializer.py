@@ -32,20 +32,8 @@ class BoardInitializer:
         self.fen = fen
 
     def initialize(self):
-        self.build_position_layout()
         self.set_starting_pieces()
 
-    def build_position_layout(self):
-        self.board.position_layout = {}
-        position = 1
-
-        for row in range(self.board.height):
-            self.board.position_layout[row] = {}
-
-            for column in range(self.board.width):
-                self.board.position_layout[row][column] = position
-                position += 1
-
     def set_starting_pieces(self):
         pieces = []
         if self.fen != 'startpos':
@@ -17,6 +17,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
+from bisect import bisect_left, insort
 from math import ceil
 from functools import reduce
 import pickle
@@ -24,52 +25,86 @@ import pickle
 WHITE = 2
 BLACK = 1
 
+def remove_sorted(positions, position):
+    del positions[bisect_left(positions, position)]
+
+
 class BoardSearcher:
 
+    __slots__ = ('board', 'position_pieces', 'sorted_positions', 'player_sorted_positions', 'piece_counts', 'king_counts')
+
     def build(self, board):
         self.board = board
-        self.uncaptured_pieces = list(filter(lambda piece: not piece.captured, board.pieces))
-        self.open_positions = []
-        self.filled_positions = []
-        self.player_positions = {}
-        self.player_pieces = {}
         self.position_pieces = {}
+        # Kept sorted by add_piece, remove_piece and move_piece, so reads never sort.
+        self.sorted_positions = []
+        self.player_sorted_positions = {BLACK: [], WHITE: []}
+        self.piece_counts = {BLACK: 0, WHITE: 0}
+        self.king_counts = {BLACK: 0, WHITE: 0}
+
+        for piece in board.pieces:
+            if not piece.captured:
+                self.add_piece(piece)
 
-        self.build_filled_positions()
-        self.build_open_positions()
-        self.build_player_positions()
-        self.build_player_pieces()
-        self.build_position_pieces()
+    def add_piece(self, piece):
+        self.position_pieces[piece.position] = piece
+        insort(self.sorted_positions, piece.position)
+        insort(self.player_sorted_positions[piece.player], piece.position)
+        self.piece_counts[piece.player] += 1
+        if piece.king:
+            self.king_counts[piece.player] += 1
 
-    def build_filled_positions(self):
-        self.filled_positions = reduce((lambda open_positions, piece: open_positions + [piece.position]), self.uncaptured_pieces, [])
+    def remove_piece(self, piece, position):
+        del self.position_pieces[position]
+        remove_sorted(self.sorted_positions, position)
+        remove_sorted(self.player_sorted_positions[piece.player], position)
+        self.piece_counts[piece.player] -= 1
+        if piece.king:
+            self.king_counts[piece.player] -= 1
 
-    def build_open_positions(self):
-        self.open_positions = [position for position in range(1, self.board.position_count) if not position in self.filled_positions]
+    def move_piece(self, piece, start, end, was_king):
+        del self.position_pieces[start]
+        self.position_pieces[end] = piece
+        for positions in (self.sorted_positions, self.player_sorted_positions[piece.player]):
+            remove_sorted(positions, start)
+            insort(positions, end)
+        if piece.king != was_king:
+            self.king_counts[piece.player] += 1 if piece.king else -1
 
-    def build_player_positions(self):
-        self.player_positions = {
-            1: reduce((lambda positions, piece: positions + ([piece.position] if piece.player == BLACK else [])), self.uncaptured_pieces, []),
-            2: reduce((lambda positions, piece: positions + ([piece.position] if piece.player == WHITE else [])), self.uncaptured_pieces, [])
-        }
+    @property
+    def uncaptured_pieces(self):
+        return [self.position_pieces[position] for position in self.sorted_positions]
 
-    def build_player_pieces(self):
-        self.player_pieces = {
-            1: reduce((lambda pieces, piece: pieces + ([piece] if piece.player == BLACK else [])), self.uncaptured_pieces, []),
-            2: reduce((lambda pieces, piece: pieces + ([piece] if piece.player == WHITE else [])), self.uncaptured_pieces, [])
-        }
+    @property
+    def filled_positions(self):
+        return list(self.sorted_positions)
 
-    def build_position_pieces(self):
-        self.position_pieces = {piece.position: piece for piece in self.uncaptured_pieces}
+    @property
+    def open_positions(self):
+        return [position for position in range(1, self.board.position_count + 1) if position not in self.position_pieces]
+
+    @property
+    def player_positions(self):
+        return {player: self.get_positions_by_player(player) for player in (BLACK, WHITE)}
+
+    @property
+    def player_pieces(self):
+        return {player: self.get_pieces_by_player(player) for player in (BLACK, WHITE)}
 
     def get_pieces_by_player(self, player_number):
-        return self.player_pieces[player_number]
+        return [self.position_pieces[position] for position in self.player_sorted_positions[player_number]]
 
     def get_positions_by_player(self, player_number):
-        return self.player_positions[player_number]
+        return list(self.player_sorted_positions[player_number])
+
+    def get_piece_count(self, player_number):
+        return self.piece_counts[player_number]
+
+    def get_king_count(self, player_number):
+        return self.king_counts[player_number]
 
     def get_pieces_in_play(self):
-        return self.player_pieces[self.board.player_turn] if not self.board.piece_requiring_further_capture_moves else [self.board.piece_requiring_further_capture_moves]
+        return self.get_pieces_by_player(self.board.player_turn) if not self.board.piece_requiring_further_capture_moves else [self.board.piece_requiring_further_capture_moves]
 
     def get_piece_by_position(self, position):
-        return self.position_pieces.get(position)
\ No newline at end of file
+        return self.position_pieces.get(position)
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from .board import BitBoard, get_bitboard_layout
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed to encode positions
+    np = None
+
+WHITE = 2
+BLACK = 1
+
+WHITE_MEN_PLANE = 0
+WHITE_KINGS_PLANE = 1
+BLACK_MEN_PLANE = 2
+BLACK_KINGS_PLANE = 3
+WHITE_TO_MOVE_PLANE = 4
+CAPTURING_PIECE_PLANE = 5
+PLANE_COUNT = 6
+
+def get_board_size(variant):
+    return (4, 8) if variant == 'brazilian' or variant == 'russian' else (5, 10)
+
+def get_square_count(variant):
+    width, height = get_board_size(variant)
+    return width * height
+
+def require_numpy():
+    if np is None:
+        raise ImportError('numpy is needed to encode positions (pip install numpy)')
+
+def empty_batch(count, variant='standard', dtype=None):
+    """
+    Zeroed array of shape (count, PLANE_COUNT, squares) to be filled by encode_batch.
+    """
+    require_numpy()
+    return np.zeros((count, PLANE_COUNT, get_square_count(variant)), dtype=np.float32 if dtype is None else dtype)
+
+def encode_batch(positions, variant='standard', out=None, dtype=None):
+    """
+    Encodes Game objects and/or hub FENs of one board size into out[i, plane, position - 1].
+
+    Planes are white men, white kings, black men, black kings, white to move (all ones when white is
+    to move) and the piece that has to continue a capture sequence (hub FENs never have one).
+    """
+    require_numpy()
+    positions = list(positions)
+    if out is None:
+        out = empty_batch(len(positions), variant, dtype)
+    square_count = get_square_count(variant)
+    if out.shape != (len(positions), PLANE_COUNT, square_count):
+        raise ValueError(f'out must have shape {(len(positions), PLANE_COUNT, square_count)}, not {out.shape}')
+
+    fen_indexes = [index for index, position in enumerate(positions) if isinstance(position, str)]
+    game_indexes = [index for index, position in enumerate(positions) if not isinstance(position, str)]
+    if fen_indexes:
+        encode_hub_fens([positions[index] for index in fen_indexes], variant, out, fen_indexes if game_indexes else None)
+    if game_indexes:
+        encode_games([positions[index] for index in game_indexes], variant, out, game_indexes if fen_indexes else None)
+    return out
+
+def encode_hub_fens(fens, variant, out, indexes=None):
+    square_count = get_square_count(variant)
+    data = ''.join(fens).encode('ascii')
+    if len(data) != len(fens) * (square_count + 1) or any(len(fen) != square_count + 1 for fen in fens):
+        raise ValueError(f'Every hub FEN of {variant} must have {square_count + 1} characters')
+    letters = np.frombuffer(data, dtype=np.uint8).reshape(len(fens), square_count + 1)
+    squares = letters[:, 1:]
+    target = out if indexes is None else np.empty((len(fens),) + out.shape[1:], dtype=out.dtype)
+    target[:, WHITE_MEN_PLANE] = squares == ord('w')
+    target[:, WHITE_KINGS_PLANE] = squares == ord('W')
+    target[:, BLACK_MEN_PLANE] = squares == ord('b')
+    target[:, BLACK_KINGS_PLANE] = squares == ord('B')
+    target[:, WHITE_TO_MOVE_PLANE] = (letters[:, :1] == ord('W'))
+    target[:, CAPTURING_PIECE_PLANE] = 0
+    if indexes is not None:
+        out[indexes] = target
+
+def encode_games(games, variant, out, indexes=None):
+    width, height = get_board_size(variant)
+    layout = get_bitboard_layout(width, height, variant)
+    square_count = width * height
+    shifts = np.array([layout.bits[position].bit_length() - 1 for position in range(1, square_count + 1)], dtype=np.uint64)
+
+    masks = np.empty((len(games), 4), dtype=np.uint64)
+    turns = np.empty(len(games), dtype=bool)
+    capturing = np.zeros(len(games), dtype=np.intp)
+    for row, game in enumerate(games):
+        board = game.board
+        if board.position_count != square_count:
+            raise ValueError(f'A {board.variant} game can\'t be encoded as {variant}')
+        bitboard = board.bitboard
+        if bitboard is None:
+            bitboard = BitBoard(board.width, board.height, board.variant)
+            bitboard.build(board.pieces)
+        masks[row] = (bitboard.white_men, bitboard.white_kings, bitboard.black_men, bitboard.black_kings)
+        turns[row] = board.player_turn == WHITE
+        position = board.get_position_in_play()
+        if position is not None:
+            capturing[row] = position
+
+    rows = np.arange(len(games)) if indexes is None else np.asarray(indexes, dtype=np.intp)
+    out[rows, :4] = (masks[:, :, None] >> shifts[None, None, :]) & np.uint64(1)
+    out[rows, WHITE_TO_MOVE_PLANE] = turns[:, None]
+    out[rows, CAPTURING_PIECE_PLANE] = 0
+    continuing = capturing > 0
+    out[rows[continuing], CAPTURING_PIECE_PLANE, capturing[continuing] - 1] = 1
+
+def encode_game(game, dtype=None):
+    """
+    Array of shape (PLANE_COUNT, squares) for one game, see encode_batch.
+    """
+    return encode_batch([game], game.variant, dtype=dtype)[0]
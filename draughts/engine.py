@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import time
+from .perft import push_move, pop_move
+
+WHITE = 2
+BLACK = 1
+
+MAN_VALUE = 100
+KING_VALUE = 300
+ADVANCEMENT_VALUE = 3
+MATE_SCORE = 100000
+MAX_PLY = 100
+
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+class SearchStopped(Exception):
+    pass
+
+
+def get_move_id(move):
+    return (move[0][0],) + tuple(step[1] for step in move)
+
+
+def count_bits(mask):
+    return bin(mask).count('1')
+
+
+def evaluate(game):
+    """
+    Material and advancement of the men, in hundredths of a man, from the point of view of the side to move.
+    """
+    board = game.board
+    searcher = board.searcher
+    score = 0
+    for player, sign in ((WHITE, 1), (BLACK, -1)):
+        kings = searcher.get_king_count(player)
+        men = searcher.get_piece_count(player) - kings
+        score += sign * (men * MAN_VALUE + kings * KING_VALUE)
+    if board.bitboard is not None:
+        layout = board.bitboard.layout
+        for row, row_mask in enumerate(get_row_masks(layout)):
+            score += ADVANCEMENT_VALUE * (board.height - 1 - row) * count_bits(board.bitboard.white_men & row_mask)
+            score -= ADVANCEMENT_VALUE * row * count_bits(board.bitboard.black_men & row_mask)
+    else:
+        for piece in board.searcher.uncaptured_pieces:
+            if not piece.king:
+                row = board.geometry.get_row(piece.position)
+                score += ADVANCEMENT_VALUE * (board.height - 1 - row if piece.player == WHITE else -row)
+    return score if game.whose_turn() == WHITE else -score
+
+
+row_masks = {}
+
+
+def get_row_masks(layout):
+    key = (layout.width, layout.height)
+    if key not in row_masks:
+        masks = [0] * layout.height
+        for position, bit in layout.bits.items():
+            masks[(position - 1) // layout.width] |= bit
+        row_masks[key] = tuple(masks)
+    return row_masks[key]
+
+
+class SearchResult:
+
+    def __init__(self, move, captures, score, depth, nodes, seconds, pv, pv_hub, pv_pdn):
+        self.move = move
+        self.captures = captures
+        self.score = score
+        self.depth = depth
+        self.nodes = nodes
+        self.seconds = seconds
+        self.pv = pv
+        self.pv_hub = pv_hub
+        self.pv_pdn = pv_pdn
+
+    @property
+    def hub_move(self):
+        return self.pv_hub[0] if self.pv_hub else None
+
+    @property
+    def pdn_move(self):
+        return self.pv_pdn[0] if self.pv_pdn else None
+
+    @property
+    def is_mate_score(self):
+        return abs(self.score) >= MATE_SCORE - MAX_PLY
+
+    def __repr__(self):
+        return f'SearchResult(move={self.hub_move}, score={self.score}, depth={self.depth}, nodes={self.nodes}, pv={" ".join(self.pv_hub)})'
+
+
+class Engine:
+    """
+    Iterative deepening principal variation search with a quiescence search over forced captures,
+    a transposition table and hash move, killer and history move ordering.
+    """
+
+    def __init__(self, hash_size=1 << 18, evaluate=evaluate):
+        self.hash_size = hash_size
+        self.evaluate = evaluate
+        self.new_game()
+
+    def new_game(self):
+        self.table = [None] * self.hash_size
+        self.history = {}
+        self.killers = [[None, None] for _ in range(MAX_PLY + 1)]
+
+    def search(self, game, depth=None, nodes=None, movetime=None, callback=None):
+        """
+        Searches until depth (plies), nodes or movetime (seconds) is reached, whichever comes first, and returns
+        the SearchResult of the deepest completed iteration. The game is left as it was.
+        callback(result) is called after every completed iteration.
+        """
+        if depth is None and nodes is None and movetime is None:
+            raise ValueError('Give at least one of depth, nodes and movetime')
+        self.game = game
+        self.nodes = 0
+        self.max_nodes = nodes
+        self.start = time.perf_counter()
+        self.deadline = None if movetime is None else self.start + movetime
+        self.pv_table = [[] for _ in range(MAX_PLY + 2)]
+
+        moves, captures = game.legal_moves()
+        if not moves:
+            return self.make_result([], -MATE_SCORE, 0)
+        result = None
+        max_depth = MAX_PLY if depth is None else min(depth, MAX_PLY)
+        for iteration_depth in range(1, max_depth + 1):
+            try:
+                score = self.search_node(iteration_depth, -MATE_SCORE - 1, MATE_SCORE + 1, 0)
+            except SearchStopped:
+                break
+            result = self.make_result(self.pv_table[0], score, iteration_depth)
+            if callback is not None:
+                callback(result)
+            if abs(score) >= MATE_SCORE - MAX_PLY or len(moves) == 1 and movetime is not None:
+                break
+        if result is None:
+            # Not even depth 1 finished, play the first ordered move.
+            move_id = self.order_moves(moves, captures, 0, None)[0][0]
+            result = self.make_result([(moves[move_id], captures[move_id])], 0, 0)
+        return result
+
+    def check_limits(self):
+        if self.max_nodes is not None and self.nodes >= self.max_nodes:
+            raise SearchStopped()
+        if self.deadline is not None and self.nodes & 1023 == 0 and time.perf_counter() >= self.deadline:
+            raise SearchStopped()
+
+    def get_terminal_score(self, ply):
+        game = self.game
+        if game.variant == 'breakthrough':
+            king_owner = game.get_king_owner()
+            if king_owner is not None:
+                return MATE_SCORE - ply if king_owner == game.whose_turn() else -MATE_SCORE + ply
+        return None
+
+    def search_node(self, depth, alpha, beta, ply):
+        self.nodes += 1
+        self.check_limits()
+        self.pv_table[ply] = []
+        game = self.game
+
+        terminal_score = self.get_terminal_score(ply)
+        if terminal_score is not None:
+            return terminal_score
+        moves, captures = game.legal_moves()
+        if not moves:
+            return -MATE_SCORE + ply
+        if len(moves) == 1 and ply < MAX_PLY:
+            # Forced moves do not use up depth.
+            depth += 1
+        if depth <= 0 or ply >= MAX_PLY:
+            return self.quiescence(alpha, beta, ply, moves, captures)
+
+        key = game.get_move_cache_key()
+        slot = hash(key) % self.hash_size
+        entry = self.table[slot]
+        hash_move = None
+        if entry is not None and entry[0] == key:
+            _, entry_depth, entry_score, entry_flag, hash_move = entry
+            if ply > 0 and entry_depth >= depth:
+                entry_score = self.score_from_table(entry_score, ply)
+                if entry_flag == EXACT or entry_flag == LOWER_BOUND and entry_score >= beta or entry_flag == UPPER_BOUND and entry_score <= alpha:
+                    return entry_score
+
+        original_alpha = alpha
+        best_score = -MATE_SCORE - 1
+        best_move = None
+        for index, (move_index, move_id) in enumerate(self.order_moves(moves, captures, ply, hash_move)):
+            move = moves[move_index]
+            captured = captures[move_index]
+            pushed = push_move(game, move, captured)
+            try:
+                if index == 0:
+                    score = -self.search_node(depth - 1, -beta, -alpha, ply + 1)
+                else:
+                    score = -self.search_node(depth - 1, -alpha - 1, -alpha, ply + 1)
+                    if alpha < score < beta:
+                        score = -self.search_node(depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                pop_move(game, pushed)
+            if score > best_score:
+                best_score = score
+                best_move = move_id
+                if score > alpha:
+                    alpha = score
+                    self.pv_table[ply] = [(move, captured)] + self.pv_table[ply + 1]
+            if alpha >= beta:
+                if captured[0] is None:
+                    killers = self.killers[ply]
+                    if killers[0] != move_id:
+                        killers[1] = killers[0]
+                        killers[0] = move_id
+                    self.history[move_id] = self.history.get(move_id, 0) + depth * depth
+                break
+
+        if best_score <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self.table[slot] = (key, depth, self.score_to_table(best_score, ply), flag, best_move)
+        return best_score
+
+    def quiescence(self, alpha, beta, ply, moves, captures):
+        """
+        Captures are compulsory, so a position with captures is searched until it is quiet.
+        """
+        if captures[0][0] is None or ply >= MAX_PLY:
+            return self.evaluate(self.game)
+        game = self.game
+        best_score = -MATE_SCORE - 1
+        for move, captured in zip(moves, captures):
+            pushed = push_move(game, move, captured)
+            try:
+                self.nodes += 1
+                self.check_limits()
+                terminal_score = self.get_terminal_score(ply + 1)
+                if terminal_score is not None:
+                    score = -terminal_score
+                else:
+                    next_moves, next_captures = game.legal_moves()
+                    if not next_moves:
+                        score = MATE_SCORE - ply - 1
+                    else:
+                        score = -self.quiescence(-beta, -alpha, ply + 1, next_moves, next_captures)
+            finally:
+                pop_move(game, pushed)
+            if score > best_score:
+                best_score = score
+                if score > alpha:
+                    alpha = score
+            if alpha >= beta:
+                break
+        return best_score
+
+    def order_moves(self, moves, captures, ply, hash_move):
+        """
+        Returns (index in moves, move id) pairs, best candidates first.
+        """
+        killers = self.killers[ply]
+        ordered = []
+        for index, (move, captured) in enumerate(zip(moves, captures)):
+            move_id = get_move_id(move)
+            if move_id == hash_move:
+                priority = 1 << 40
+            elif captured[0] is not None:
+                priority = (1 << 30) + len(captured)
+            elif move_id == killers[0]:
+                priority = 1 << 29
+            elif move_id == killers[1]:
+                priority = 1 << 28
+            else:
+                priority = self.history.get(move_id, 0)
+            ordered.append((-priority, index, move_id))
+        ordered.sort()
+        return [(index, move_id) for _, index, move_id in ordered]
+
+    def score_to_table(self, score, ply):
+        if score >= MATE_SCORE - MAX_PLY:
+            return score + ply
+        if score <= -MATE_SCORE + MAX_PLY:
+            return score - ply
+        return score
+
+    def score_from_table(self, score, ply):
+        if score >= MATE_SCORE - MAX_PLY:
+            return score - ply
+        if score <= -MATE_SCORE + MAX_PLY:
+            return score + ply
+        return score
+
+    def make_result(self, pv, score, depth):
+        game = self.game
+        pv_hub = []
+        pv_pdn = []
+        pushed_moves = []
+        try:
+            for move, captured in pv:
+                pv_hub.append(game.li_to_hub(game.board_to_li(game.not_added_move + move), game.not_added_capture + captured))
+                pv_pdn.append(game.board_to_pdn(move))
+                pushed_moves.append(push_move(game, move, captured))
+        finally:
+            for pushed in reversed(pushed_moves):
+                pop_move(game, pushed)
+        move, captures = pv[0] if pv else (None, None)
+        return SearchResult(move, captures, score, depth, self.nodes, time.perf_counter() - self.start, list(pv), pv_hub, pv_pdn)
+
+
+def search(game, depth=None, nodes=None, movetime=None):
+    """
+    Searches with a fresh Engine, see Engine.search.
+    """
+    return Engine(hash_size=1 << 16).search(game, depth, nodes, movetime)
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import argparse
+import re
+import timeit
+
+WHITE = 2
+BLACK = 1
+
+PIECE_LETTERS = {WHITE: ('w', 'W'), BLACK: ('b', 'B')}
+
+# Fields such as the halfmove clock (H0) and the move number (F1) that lidraughts may append.
+COUNTER_FIELD = re.compile(r'[HF]\d+$')
+
+def get_position_count(variant):
+    return 32 if variant == 'brazilian' or variant == 'russian' else 50
+
+def get_starting_hub_fen(variant='standard'):
+    """
+    Hub FENs are the side to move followed by one letter per square: w/b for men, W/B for kings and e for empty.
+    """
+    if variant == 'frysk!':
+        return 'W' + 'b' * 5 + 'e' * 40 + 'w' * 5
+    elif variant == 'brazilian' or variant == 'russian':
+        return 'W' + 'b' * 12 + 'e' * 8 + 'w' * 12
+    return 'W' + 'b' * 20 + 'e' * 10 + 'w' * 20
+
+def li_fen_to_hub_fen(li_fen, variant='standard'):
+    """
+    Converts a lidraughts FEN such as 'W:W31-50:B1-20' or 'B:WK4,34:B7,K8' to a hub FEN in one pass over
+    the pieces. Squares can be single squares or ranges, K marks kings ('K31-35' or 'K31-K35').
+    Raises ValueError for malformed FENs, squares outside the board and squares given twice.
+    """
+    if li_fen == 'startpos':
+        return get_starting_hub_fen(variant)
+    position_count = get_position_count(variant)
+    fields = li_fen.strip().split(':')
+    turn = fields[0].upper()
+    if turn != 'W' and turn != 'B':
+        raise ValueError(f'Invalid FEN {li_fen!r}: the side to move must be W or B')
+    letters = ['e'] * (position_count + 1)
+    letters[0] = turn
+    for field in fields[1:]:
+        color = field[:1]
+        if color == 'W':
+            man, king = 'w', 'W'
+        elif color == 'B':
+            man, king = 'b', 'B'
+        elif COUNTER_FIELD.match(field):
+            continue
+        else:
+            raise ValueError(f'Invalid FEN {li_fen!r}: unknown field {field!r}')
+        if len(field) == 1:
+            continue
+        for token in field[1:].split(','):
+            letter = man
+            if token[:1] == 'K':
+                letter = king
+                token = token[1:]
+            if token.isdigit() and 0 < int(token) <= position_count and letters[int(token)] == 'e':
+                letters[int(token)] = letter
+                continue
+            start, dash, end = token.strip().partition('-')
+            if end[:1] == 'K':
+                end = end[1:]
+            if not start.isdigit() or dash and not end.isdigit():
+                raise ValueError(f'Invalid FEN {li_fen!r}: invalid square {token!r}')
+            first = int(start)
+            last = int(end) if dash else first
+            if not 1 <= first <= last <= position_count:
+                raise ValueError(f'Invalid FEN {li_fen!r}: square {token!r} is not on a board of {position_count} squares')
+            for square in range(first, last + 1):
+                if letters[square] != 'e':
+                    raise ValueError(f'Invalid FEN {li_fen!r}: square {square} is given twice')
+                letters[square] = letter
+    return ''.join(letters)
+
+def hub_fen_to_li_fen(hub_fen, ranges=False):
+    """
+    Converts a hub FEN to a lidraughts FEN. With ranges, runs of at least three men or three kings on
+    consecutive squares are written as ranges ('W:W31-50:B1-20').
+    """
+    turn = hub_fen[:1]
+    if turn != 'W' and turn != 'B':
+        raise ValueError(f'Invalid hub FEN {hub_fen!r}: the side to move must be W or B')
+    white_pieces = []
+    black_pieces = []
+    for square, letter in enumerate(hub_fen[1:], 1):
+        if letter == 'e':
+            continue
+        elif letter == 'w':
+            white_pieces.append((square, False))
+        elif letter == 'W':
+            white_pieces.append((square, True))
+        elif letter == 'b':
+            black_pieces.append((square, False))
+        elif letter == 'B':
+            black_pieces.append((square, True))
+        else:
+            raise ValueError(f'Invalid hub FEN {hub_fen!r}: unknown piece {letter!r}')
+    return turn + ':W' + format_pieces(white_pieces, ranges) + ':B' + format_pieces(black_pieces, ranges)
+
+def format_pieces(pieces, ranges=False):
+    """
+    Comma separated squares of (square, king) pairs sorted by square.
+    """
+    if not ranges:
+        return ','.join(f'K{square}' if king else str(square) for square, king in pieces)
+    tokens = []
+    index = 0
+    while index < len(pieces):
+        square, king = pieces[index]
+        end = index
+        while end + 1 < len(pieces) and pieces[end + 1] == (pieces[end][0] + 1, king):
+            end += 1
+        if end - index >= 2:
+            token = f'{square}-{pieces[end][0]}'
+            index = end + 1
+        else:
+            token = str(square)
+            index += 1
+        tokens.append('K' + token if king else token)
+    return ','.join(tokens)
+
+def board_to_hub_fen(board):
+    """
+    Hub FEN of a board, filled from the occupied squares only.
+    """
+    letters = ['e'] * (board.position_count + 1)
+    letters[0] = 'W' if board.player_turn == WHITE else 'B'
+    for position, piece in board.searcher.position_pieces.items():
+        letters[position] = PIECE_LETTERS[piece.player][piece.king]
+    return ''.join(letters)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measure the cost of one FEN conversion.')
+    parser.add_argument('--variant', default='standard')
+    parser.add_argument('--fen', default='W:W31-50:B1-20', help='lidraughts FEN')
+    parser.add_argument('--number', type=int, default=10000, help='calls per measurement')
+    args = parser.parse_args(argv)
+
+    hub_fen = li_fen_to_hub_fen(args.fen, args.variant)
+    li_fen = hub_fen_to_li_fen(hub_fen)
+    benchmarks = [
+        ('lidraughts to hub', lambda: li_fen_to_hub_fen(li_fen, args.variant)),
+        ('lidraughts ranges to hub', lambda: li_fen_to_hub_fen(args.fen, args.variant)),
+        ('hub to lidraughts', lambda: hub_fen_to_li_fen(hub_fen)),
+        ('hub to lidraughts ranges', lambda: hub_fen_to_li_fen(hub_fen, ranges=True)),
+    ]
+    for name, function in benchmarks:
+        seconds = min(timeit.repeat(function, number=args.number, repeat=3))
+        print(f'{name}: {seconds / args.number * 1e6:.2f} us per call')
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
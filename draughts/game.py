@@ -19,16 +19,36 @@
 
 from math import ceil
 from functools import reduce
+from itertools import chain
+from types import FunctionType, ModuleType
+import gc
 import pickle
-from .board import Board
+import re
+import sys
+from .board import Board, BitBoardLayout
+from .geometry import Geometry, DIAGONAL_DIRECTIONS
+from .zobrist import CAPTURED_KEYS
+from .fen import li_fen_to_hub_fen, hub_fen_to_li_fen, board_to_hub_fen
+from .move import Move
+from .move_record import MoveRecords
 
 WHITE = 2
 BLACK = 1
 
+VALIDATION_MODES = ('full', 'light', 'none')
+
+class IllegalMoveError(ValueError):
+
+    def __init__(self, message, ply):
+        super().__init__(message)
+        self.ply = ply
+
+
 class Game:
 
-    def __init__(self, variant='standard', fen='startpos'):
+    def __init__(self, variant='standard', fen='startpos', move_cache=None):
         self.variant = variant
+        self.move_cache = move_cache
         self.initial_fen = fen
         self.initial_hub_fen = self.li_fen_to_hub_fen(self.initial_fen)
         self.board = Board(self.variant, self.initial_hub_fen)
@@ -38,19 +58,155 @@ class Game:
         self.not_added_move = []
         self.not_added_capture = []
         self.hub_move_stack = []
+        self.undo_stack = []
         self.consecutive_noncapture_move_limit = 1000  # The original was 40
         self.moves_since_last_capture = 0
+        self.terminal_state = None
+        self.records_state = None
+
+    @classmethod
+    def from_moves(cls, moves, variant='standard', fen='startpos', validate='full', move_cache=None):
+        """
+        Replays a list of complete moves in one call. Moves can be Move objects, lists of steps such as
+        [[28, 19], [19, 8]] or li strings such as '281908' (the form of Game.move_stack).
+
+        validate='full' checks every move against the legal moves, 'light' only checks every step with
+        is_possible_step and that the turn passes exactly at the end of the move, 'none' trusts the moves.
+        An illegal move raises IllegalMoveError, whose ply is the index of the move in moves.
+        """
+        if validate not in VALIDATION_MODES:
+            raise ValueError(f'validate must be one of {", ".join(VALIDATION_MODES)}, not {validate!r}')
+        game = cls(variant, fen, move_cache)
+        for ply, move in enumerate(moves):
+            if isinstance(move, str):
+                steps = game.li_to_steps(move)
+            elif isinstance(move, Move):
+                steps = move.steps
+            else:
+                steps = move
+            if validate == 'full':
+                if steps not in game.legal_moves()[0]:
+                    raise IllegalMoveError(f'The move {move} at ply {ply} is not possible', ply)
+                game.push_trusted_move(steps)
+            elif validate == 'light':
+                if not steps or not game.push_trusted_move(steps, check=True):
+                    raise IllegalMoveError(f'The move {move} at ply {ply} is not possible', ply)
+            else:
+                game.push_trusted_move(steps)
+        return game
+
+    def push_trusted_move(self, steps, check=False):
+        """
+        Plays the steps of a complete move without generating the legal moves. With check, every step must pass
+        is_possible_step and the turn must pass exactly after the last step, otherwise the steps already played
+        are taken back and False is returned.
+        """
+        board = self.board
+        turn = board.player_turn
+        for index, step in enumerate(steps):
+            if check and not self.is_possible_step(step):
+                for _ in range(index):
+                    self.pop()
+                return False
+            self.play_step(step)
+            if check and (board.player_turn == turn) != (index < len(steps) - 1):
+                for _ in range(index + 1):
+                    self.pop()
+                return False
+        return True
+
+    def is_possible_step(self, step):
+        """
+        Checks a step against the shape of the moves of its piece without generating the legal moves: a man moves
+        one square forward or jumps over an adjacent piece, a king goes any distance along a line, a capture jumps
+        over exactly one piece of the opponent that was not captured before, and a capture sequence in progress
+        goes on with captures of its piece. Whether a capture is forced or the longest one is not checked.
+        """
+        board = self.board
+        geometry = board.geometry
+        start, end = step
+        piece = board.searcher.get_piece_by_position(start)
+        if piece is None or piece.player != board.player_turn or not board.position_is_open(end):
+            return False
+        capturing_piece = board.piece_requiring_further_capture_moves
+        if capturing_piece is not None and capturing_piece is not piece:
+            return False
+        direction = geometry.get_direction_between(start, end)
+        if direction is None:
+            return False
+        jumped = []
+        for position in geometry.rays[direction][start]:
+            if position in self.not_added_capture:
+                return False
+            if position == end:
+                break
+            if not board.position_is_open(position):
+                jumped.append(position)
+        if not jumped:
+            if capturing_piece is not None or direction not in DIAGONAL_DIRECTIONS:
+                return False
+            return piece.king or (end == geometry.neighbours[direction][start] and direction in geometry.get_directions(piece.player, True)[2:])
+        if len(jumped) > 1 or board.searcher.get_piece_by_position(jumped[0]).player == piece.player:
+            return False
+        return piece.king or geometry.jump_landings[start].get(jumped[0]) == end
 
     def copy(self):
         # At least 6 times faster than deepcopy
-        return pickle.loads(pickle.dumps(self, -1))
+        move_cache, self.move_cache = self.move_cache, None
+        try:
+            game = pickle.loads(pickle.dumps(self, -1))
+        finally:
+            self.move_cache = move_cache
+        game.move_cache = move_cache
+        return game
+
+    def memory_footprint(self):
+        """
+        Approximate number of bytes used by this game, not counting the geometry and bitboard tables
+        that are shared by every game of the same variant.
+        """
+        shared = (type, ModuleType, FunctionType, Geometry, BitBoardLayout)
+        seen = set()
+        size = 0
+        objects = [self]
+        while objects:
+            obj = objects.pop()
+            if id(obj) in seen or isinstance(obj, shared):
+                continue
+            seen.add(id(obj))
+            size += sys.getsizeof(obj)
+            objects.extend(gc.get_referents(obj))
+        return size
 
     def move(self, move, return_captured=False):
+        """
+        Plays a step such as [32, 28], or a complete Move. Returning the captured position of a Move returns
+        its captured positions.
+        """
+        if isinstance(move, Move):
+            if move not in self.move_records().by_move:
+                raise ValueError('The provided move is not possible')
+            for step in move.steps:
+                self.play_step(step)
+            return (self, move.captured) if return_captured else self
         if move not in self.get_possible_moves():
             raise ValueError('The provided move is not possible')
+        enemy_position = self.play_step(move)
+
+        if return_captured:
+            return self, enemy_position
+        else:
+            return self
+
+    def play_step(self, move):
+        """
+        Plays a step that is known to be possible and returns the captured position.
+        """
         turn = self.whose_turn()
 
-        self.board, enemy_position = self.board.create_new_board_from_move(move, len(self.move_stack) + 1, self.not_added_capture, return_captured=True)
+        undo_info = self.board.make(move, len(self.move_stack) + 1, self.not_added_capture)
+        enemy_position = undo_info.captured_position
+        self.undo_stack.append((undo_info, self.moves_since_last_capture))
         self.moves.append(move)
         self.moves_since_last_capture = 0 if self.board.previous_move_was_capture else self.moves_since_last_capture + 1
 
@@ -64,94 +220,248 @@ class Game:
             self.hub_move_stack.append(self.li_to_hub(li_move, self.not_added_capture + [enemy_position]))
             self.not_added_move = []
             self.not_added_capture = []
+        return enemy_position
 
-        if return_captured:
-            return self, enemy_position
+    def pop(self):
+        """
+        Takes back the last step, also in the middle of a capture sequence, and returns it.
+        """
+        if not self.undo_stack:
+            raise IndexError('There is no move to take back')
+        undo_info, self.moves_since_last_capture = self.undo_stack.pop()
+        if self.not_added_move:
+            self.not_added_move.pop()
+            self.not_added_capture.pop()
         else:
-            return self
+            captures = self.capture_stack.pop()
+            self.move_stack.pop()
+            self.hub_move_stack.pop()
+            self.not_added_move = self.moves[len(self.moves) - len(captures):-1]
+            self.not_added_capture = captures[:-1]
+        self.moves.pop()
+        self.board.unmake(undo_info)
+        return undo_info.move
+
+    def pop_full_move(self):
+        """
+        Takes back the steps played of a capture sequence in progress or else the last complete move,
+        and returns the steps taken back.
+        """
+        if self.not_added_move:
+            count = len(self.not_added_move)
+        elif self.capture_stack:
+            count = len(self.capture_stack[-1])
+        else:
+            raise IndexError('There is no move to take back')
+        steps = [self.pop() for _ in range(count)]
+        steps.reverse()
+        return steps
 
     def move_limit_reached(self):
         return self.moves_since_last_capture >= self.consecutive_noncapture_move_limit
 
     def is_over(self):
-        if self.variant == 'breakthrough':
-            has_king = False
-            for loc in range(1, self.board.position_count + 1):
-                piece = self.board.searcher.get_piece_by_position(loc)
-                if piece is not None:
-                    if piece.king:
-                        has_king = True
-            return self.move_limit_reached() or not self.legal_moves() or has_king
-        return self.move_limit_reached() or not self.legal_moves()
+        return self.move_limit_reached() or self.get_terminal_state()[0]
 
     def get_winner(self):
-        if self.whose_turn() == BLACK and not self.board.count_movable_player_pieces(BLACK, self.not_added_capture):
+        return self.get_terminal_state()[1]
+
+    def get_terminal_state(self):
+        """
+        (over, winner) of the position, not counting the move limit. The result is kept until the board changes,
+        so is_over and get_winner can be called after every move without generating moves twice.
+        """
+        board = self.board
+        terminal_state = self.terminal_state
+        if terminal_state is not None and terminal_state[0] is board and terminal_state[1] == board.state_version:
+            return terminal_state[2]
+
+        if not self.has_legal_move():
+            state = True, BLACK if self.whose_turn() == WHITE else WHITE
+        elif self.variant == 'breakthrough':
+            king_owner = self.get_king_owner()
+            state = king_owner is not None, king_owner
+        else:
+            state = False, None
+        self.terminal_state = board, board.state_version, state
+        return state
+
+    def get_king_owner(self):
+        """
+        Player owning the first king on the board, used by breakthrough where the first king wins.
+        """
+        white_kings = self.board.searcher.get_king_count(WHITE)
+        black_kings = self.board.searcher.get_king_count(BLACK)
+        if not white_kings and not black_kings:
+            return None
+        elif not black_kings:
             return WHITE
-        elif self.whose_turn() == WHITE and not self.board.count_movable_player_pieces(WHITE, self.not_added_capture):
+        elif not white_kings:
             return BLACK
-        else:
-            if self.variant == 'breakthrough':
-                for loc in range(1, self.board.position_count + 1):
-                    piece = self.board.searcher.get_piece_by_position(loc)
-                    if piece is not None:
-                        if piece.player == WHITE and piece.king:
-                            return WHITE
-                        elif piece.player == BLACK and piece.king:
-                            return BLACK
-                return None
-            else:
-                return None
+        for loc in range(1, self.board.position_count + 1):
+            piece = self.board.searcher.get_piece_by_position(loc)
+            if piece is not None and piece.king:
+                return piece.player
+
+    def has_legal_move(self):
+        """
+        True if the side to move has a legal move. Stops at the first move found.
+        """
+        if next(self.board.iter_possible_capture_moves(self.not_added_capture), None) is not None:
+            return True
+        piece_not_allowed = self.get_restricted_king() if self.variant == 'frisian' or self.variant == 'frysk!' else None
+        for move in self.board.iter_possible_positional_moves():
+            if move[0] != piece_not_allowed:
+                return True
+        return False
+
+    def position_key(self):
+        """
+        64-bit Zobrist key of the position, including the pieces already captured by a capture sequence in progress.
+        """
+        key = self.board.zobrist_key
+        for position in self.not_added_capture:
+            if position is not None:
+                key ^= CAPTURED_KEYS[position]
+        return key
 
     def get_possible_moves(self):
         return self.board.get_possible_moves(self.not_added_capture)
 
+    def to_array(self, dtype=None):
+        """
+        NumPy feature planes of shape (6, squares), see draughts.encoding.encode_batch.
+        """
+        # Imported here, so games that are never encoded don't import numpy.
+        from .encoding import encode_game
+        return encode_game(self, dtype)
+
     def whose_turn(self):
         return self.board.player_turn
 
     def get_fen(self):
-        playing = 'W' if self.board.player_turn == WHITE else 'B'
-        fen = ''
+        return board_to_hub_fen(self.board)
 
-        for loc in range(1, self.board.position_count + 1):
-            piece = self.board.searcher.get_piece_by_position(loc)
-            letter = 'e'
-            if piece is not None:
-                if piece.player == WHITE:
-                    letter = 'w'
-                else:
-                    letter = 'b'
-                if piece.king:
-                    letter = letter.capitalize()
-            fen += letter
-
-        final_fen = playing + fen
-        return final_fen
+    def get_li_fen(self, ranges=False):
+        """
+        lidraughts FEN of the position, with ranges of consecutive squares if ranges is True.
+        """
+        return hub_fen_to_li_fen(board_to_hub_fen(self.board), ranges)
 
     def get_moves(self):
         """
         Moves are only pseudo-legal. Use legal_moves for legal moves.
         """
-        turn = self.whose_turn()
-        moves = []
-        captured_pieces = []
-        for move in self.get_possible_moves():
-            game_2 = self.copy()
-            _, captures = game_2.move(move, return_captured=True)
-            if game_2.whose_turn() == turn:
-                more_moves, more_captures = game_2.get_moves()
-                for semi_move, semi_capture in zip(more_moves, more_captures):
-                    moves.append([move] + semi_move)
-                    captured_pieces.append([captures] + semi_capture)
-            else:
-                moves.append([move])
-                captured_pieces.append([captures])
-        return moves, captured_pieces
+        return self.board.get_move_sequences(self.not_added_capture)
+
+    def get_move_cache_key(self):
+        """
+        Everything legal_moves depends on: the position, the variant and, in frisian, the king that may not move.
+        """
+        if self.variant == 'frisian' or self.variant == 'frysk!':
+            return self.position_key(), self.variant, self.get_restricted_king()
+        return self.position_key(), self.variant
 
     def legal_moves(self):
+        if self.move_cache is None:
+            return self.generate_legal_moves()
+        key = self.get_move_cache_key()
+        entry = self.move_cache.get(key)
+        if entry is None:
+            entry = self.generate_legal_moves()
+            self.move_cache.put(key, *entry)
+        return entry
+
+    def move_records(self):
+        """
+        MoveRecords of the legal moves, with every notation of every move. The records are kept until the
+        board changes, so translating moves between notations generates the legal moves once per position.
+        """
+        board = self.board
+        records_state = self.records_state
+        if records_state is not None and records_state[0] is board and records_state[1] == board.state_version:
+            return records_state[2]
+        records = MoveRecords(*self.legal_moves())
+        self.records_state = board, board.state_version, records
+        return records
+
+    def legal_move_set(self):
+        """
+        Set-like view of the legal moves as Move objects, for constant-time membership tests.
+        """
+        return self.move_records().by_move.keys()
+
+    def is_legal(self, move):
+        """
+        True if a Move or a list of steps such as [[32, 23], [23, 14]] is a legal move of the position.
+        """
+        return self.move_records().from_move(move) is not None
+
+    def get_restricted_king(self):
+        """
+        In frisian a king may not make more than 3 consecutive non-capturing moves while its player still has men.
+        Returns the position of the king that has to stop, or None.
+        """
+        if len(self.move_stack) < 6:
+            return None
+        has_man = False
+        for loc in range(1, self.board.position_count + 1):
+            piece = self.board.searcher.get_piece_by_position(loc)
+            if piece and not piece.king and piece.player == self.whose_turn():
+                has_man = True
+        if not has_man:
+            return None
+
+        last_3_moves = [self.move_stack[-6], self.move_stack[-4], self.move_stack[-2]]
+        last_3_moves_same_piece = last_3_moves[0][-2:] == last_3_moves[1][:2] and last_3_moves[1][-2:] == last_3_moves[2][:2]
+        was_a_capture = bool(list(filter(lambda captures: captures[0] is not None, [self.capture_stack[-6], self.capture_stack[-4], self.capture_stack[-2]])))
+        piece = self.board.searcher.get_piece_by_position(int(last_3_moves[-1][-2:]))
+        if piece is None:  # It is None when the piece was captured
+            is_king = False
+            is_king_for_at_least_3_moves = True
+        else:
+            is_king = piece.king
+            is_king_for_at_least_3_moves = len(self.move_stack) - piece.became_king >= 6
+        if is_king and last_3_moves_same_piece and not was_a_capture and is_king_for_at_least_3_moves:
+            return int(last_3_moves[2][-2:])
+        return None
+
+    def iter_legal_moves(self):
+        """
+        Yields the (move, captures) pairs of legal_moves one at a time, in the same order, so callers can stop early.
+        Positional moves and russian captures are generated lazily, other captures are compared with each other first.
+        The game must not be changed while iterating.
+        """
+        if self.move_cache is not None:
+            yield from zip(*self.legal_moves())
+            return
+        sequences = self.board.iter_move_sequences(self.not_added_capture)
+        first = next(sequences, None)
+        if first is None:
+            return
+        if first[1][0] is not None and self.variant != 'russian':
+            moves = [first[0]]
+            captures = [first[1]]
+            for move, capture in sequences:
+                moves.append(move)
+                captures.append(capture)
+            yield from zip(*self.filter_legal_moves(moves, captures))
+            return
+        piece_not_allowed = self.get_restricted_king() if self.variant == 'frisian' or self.variant == 'frysk!' else None
+        for move, capture in chain([first], sequences):
+            if move[0][0] != piece_not_allowed or capture[0] is not None:
+                yield move, capture
+
+    def generate_legal_moves(self):
+        return self.filter_legal_moves(*self.get_moves())
+
+    def filter_legal_moves(self, moves, captures):
+        """
+        Applies the capture rules of the variant to pseudo-legal moves.
+        """
         if self.variant == 'frisian' or self.variant == 'frysk!':
             king_value = 1.501
             man_value = 1
-            moves, captures = self.get_moves()
             if not moves:
                 return moves, captures
             values = []
@@ -182,41 +492,20 @@ class Game:
                 moves_pseudo_legal_2 = moves_pseudo_legal
                 captures_pseudo_legal_2 = captures_pseudo_legal
 
-            has_man = False
-            for loc in range(1, self.board.position_count + 1):
-                piece = self.board.searcher.get_piece_by_position(loc)
-                if piece and not piece.king and piece.player == self.whose_turn():
-                    has_man = True
-
-            if has_man and len(self.move_stack) >= 6:
-                last_3_moves = [self.move_stack[-6], self.move_stack[-4], self.move_stack[-2]]
-                last_3_moves_same_piece = last_3_moves[0][-2:] == last_3_moves[1][:2] and last_3_moves[1][-2:] == last_3_moves[2][:2]
-                was_a_capture = bool(list(filter(lambda captures: captures[0] is not None, [self.capture_stack[-6], self.capture_stack[-4], self.capture_stack[-2]])))
-                piece = self.board.searcher.get_piece_by_position(int(last_3_moves[-1][-2:]))
-                if piece is None:  # It is None when the piece was captured
-                    is_king = False
-                    is_king_for_at_least_3_moves = True
-                else:
-                    is_king = piece.king
-                    is_king_for_at_least_3_moves = len(self.move_stack) - piece.became_king >= 6
-                if is_king and last_3_moves_same_piece and not was_a_capture and is_king_for_at_least_3_moves:
-                    piece_not_allowed = int(last_3_moves[2][-2:])
-                    moves_legal = []
-                    captures_legal = []
-                    for move, capture in zip(moves_pseudo_legal_2, captures_pseudo_legal_2):
-                        if move[0][0] != piece_not_allowed or capture[0] is not None:
-                            moves_legal.append(move)
-                            captures_legal.append(capture)
-                else:
-                    moves_legal = moves_pseudo_legal_2
-                    captures_legal = captures_pseudo_legal_2
+            piece_not_allowed = self.get_restricted_king()
+            if piece_not_allowed is not None:
+                moves_legal = []
+                captures_legal = []
+                for move, capture in zip(moves_pseudo_legal_2, captures_pseudo_legal_2):
+                    if move[0][0] != piece_not_allowed or capture[0] is not None:
+                        moves_legal.append(move)
+                        captures_legal.append(capture)
             else:
                 moves_legal = moves_pseudo_legal_2
                 captures_legal = captures_pseudo_legal_2
         elif self.variant == 'russian':
-            return self.get_moves()
+            return moves, captures
         else:
-            moves, captures = self.get_moves()
             if not moves:
                 return moves, captures
             max_len_key = max(list(map(len, moves)))
@@ -243,6 +532,13 @@ class Game:
             final_move += self.make_len_2(semi_move[1])
         return final_move
 
+    def li_to_steps(self, move):
+        """
+        The steps of a li move, the inverse of board_to_li ('281908' is [[28, 19], [19, 8]]).
+        """
+        squares = [int(move[index:index + 2]) for index in range(0, len(move), 2)]
+        return [[squares[index], squares[index + 1]] for index in range(len(squares) - 1)]
+
     def push_move(self, move):
         self.move([int(move[:2]), int(move[2:4])])
 
@@ -257,18 +553,8 @@ class Game:
         return captures
 
     def hub_to_li_board(self, move):
-        possible_moves, possible_captures = self.legal_moves()
-        moves_li_board = {}
-        for possible_move, possible_capture in zip(possible_moves, possible_captures):
-            if possible_capture[0] is None:
-                possible_capture = []
-            li_move = self.board_to_li_old(possible_move) + self.sort_captures(possible_capture)
-            moves_li_board[li_move] = possible_move
-        board_move = moves_li_board[move]
-        api_move = []
-        for semi_move in board_move:
-            api_move.append(self.board_to_li([semi_move]))
-        return api_move, board_move
+        record = self.move_records().by_hub[move]
+        return list(record.li_api), record.move
 
     def li_to_hub(self, move, captures):
         if captures[0] is None:
@@ -292,60 +578,34 @@ class Game:
             new_move += semi_move[2:]
         return new_move
 
+    def get_move_record(self, move):
+        record = self.move_records().from_move(move)
+        if record is None:
+            raise ValueError('The provided move is not possible')
+        return record
+
     def board_to_pdn(self, move):
-        possible_moves, possible_captures = self.legal_moves()
-        starts_endings = []
-        for possible_move in possible_moves:
-            starts_endings.append(self.make_len_4(possible_move[0][0], possible_move[-1][1]))
-        if starts_endings.count(self.make_len_4(move[0][0], move[-1][1])) == 1:
-            index = possible_moves.index(move)
-            captures = possible_captures[index]
-            if captures[0] is not None:
-                return self.make_len_2(str(move[0][0])) + 'x' + self.make_len_2(str(move[-1][1]))
-            else:
-                return self.make_len_2(str(move[0][0])) + '-' + self.make_len_2(str(move[-1][1]))
-        else:
-            li_move = self.board_to_li(move)
-            li_move = [li_move[i:i + 2] for i in range(0, len(li_move), 2)]
-            return 'x'.join(li_move)
+        return self.get_move_record(move).pdn_short
+
+    def pdn_to_board(self, move):
+        """
+        Finds the legal move written in PDN, either as start and end square ('32x21') or,
+        when that is ambiguous, with every square the piece lands on ('27x18x9').
+        """
+        records = self.move_records()
+        record = records.from_pdn(move)
+        if record is not None:
+            return record.move
+        squares = [int(square) for square in re.split('[-x]', move)]
+        if len(squares) == 2 and any(record.path[0] == squares[0] and record.path[-1] == squares[1] for record in records):
+            raise ValueError(f'The move {move} is ambiguous')
+        raise ValueError(f'The move {move} is not possible')
 
     def board_to_hub(self, move):
-        possible_moves, possible_captures = self.legal_moves()
-        li_move = self.board_to_li(move)
-        moves_to_captures = {}
-        for possible_move, possible_capture in zip(possible_moves, possible_captures):
-            moves_to_captures[self.board_to_li(possible_move)] = possible_capture
-        captures = moves_to_captures[li_move]
-        return self.li_to_hub(li_move, captures)
+        return self.get_move_record(move).hub
 
     def li_fen_to_hub_fen(self, li_fen):
-        if li_fen == 'startpos' and self.variant == 'frysk!':
-            return 'Wbbbbbeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeewwwww'
-        elif li_fen == 'startpos' and (self.variant == 'brazilian' or self.variant == 'russian'):
-            return 'Wbbbbbbbbbbbbeeeeeeeewwwwwwwwwwww'
-        elif li_fen == 'startpos':
-            return 'Wbbbbbbbbbbbbbbbbbbbbeeeeeeeeeewwwwwwwwwwwwwwwwwwww'
-        fen = ''
-        li_fen = li_fen.split(':')
-        fen += li_fen[0]
-        white_pieces = li_fen[1][1:].split(',')
-        black_pieces = li_fen[2][1:].split(',')
-
-        if self.variant == 'brazilian' or self.variant == 'russian':
-            position_count = 32
-        else:
-            position_count = 50
-
-        for index in range(1, position_count + 1):
-            str_index = str(index)
-            if str_index in white_pieces:
-                fen += 'w'
-            elif 'K' + str_index in white_pieces:
-                fen += 'W'
-            elif str_index in black_pieces:
-                fen += 'b'
-            elif 'K' + str_index in black_pieces:
-                fen += 'B'
-            else:
-                fen += 'e'
-        return fen
\ No newline at end of file
+        return li_fen_to_hub_fen(li_fen, self.variant)
+
+    def hub_fen_to_li_fen(self, hub_fen):
+        return hub_fen_to_li_fen(hub_fen)
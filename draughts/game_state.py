@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from .game import Game
+from .move import Move
+
+class GameState:
+    """
+    Immutable node of a tree of games. A state only holds its parent and the Move played from it, so a child
+    is made in constant time and every branch shares the states before it. The board is only built when
+    asked for, with to_game or a GameCursor.
+    """
+
+    __slots__ = ('parent', 'move', 'depth', 'variant', 'fen')
+
+    def __init__(self, variant='standard', fen='startpos', parent=None, move=None):
+        object.__setattr__(self, 'parent', parent)
+        object.__setattr__(self, 'move', move)
+        object.__setattr__(self, 'depth', 0 if parent is None else parent.depth + 1)
+        object.__setattr__(self, 'variant', variant)
+        object.__setattr__(self, 'fen', fen)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('GameState is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('GameState is immutable')
+
+    def play(self, move):
+        """
+        The state after a legal Move of this state. The move is not checked, use children to get legal states.
+        """
+        if not isinstance(move, Move):
+            raise TypeError(f'Expected a Move, not {type(move).__name__}')
+        return GameState(self.variant, self.fen, self, move)
+
+    @property
+    def root(self):
+        state = self
+        while state.parent is not None:
+            state = state.parent
+        return state
+
+    def moves(self):
+        """
+        The Moves played from the root to this state.
+        """
+        moves = []
+        state = self
+        while state.parent is not None:
+            moves.append(state.move)
+            state = state.parent
+        moves.reverse()
+        return moves
+
+    def to_game(self):
+        """
+        A new Game of this state, replayed from the root.
+        """
+        game = Game(self.variant, self.fen)
+        for move in self.moves():
+            game.push_trusted_move(move.steps)
+        return game
+
+    def children(self, cursor=None):
+        """
+        The states after every legal move, in legal move order. The position is built with the given
+        GameCursor of the same tree, or a new one.
+        """
+        if cursor is None:
+            cursor = GameCursor(self)
+        return [self.play(move) for move in cursor.goto(self).legal_move_set()]
+
+    def __repr__(self):
+        return f'GameState({self.variant!r}, {self.fen!r}, depth={self.depth}, move={self.move!r})'
+
+
+class GameCursor:
+    """
+    A single Game that is moved between the states of one tree. Going to another state takes back the moves
+    down to their common ancestor and plays the moves from there, so walking a tree never replays it from the root.
+    """
+
+    def __init__(self, state):
+        self.state = state
+        self.game = state.to_game()
+
+    def goto(self, state):
+        """
+        Moves the game to the given state and returns it. The game must not be changed by the caller in between.
+        """
+        current = self.state
+        target = state
+        moves = []
+        while target.depth > current.depth:
+            moves.append(target.move)
+            target = target.parent
+        pops = 0
+        while current.depth > target.depth:
+            current = current.parent
+            pops += 1
+        while current is not target:
+            if current.parent is None:
+                raise ValueError('The state is not in the tree of the cursor')
+            moves.append(target.move)
+            target = target.parent
+            current = current.parent
+            pops += 1
+        for _ in range(pops):
+            self.game.pop_full_move()
+        for move in reversed(moves):
+            self.game.push_trusted_move(move.steps)
+        self.state = state
+        return self.game
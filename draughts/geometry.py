@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+WHITE = 2
+BLACK = 1
+
+DOWN_LEFT = 0
+DOWN_RIGHT = 1
+UP_LEFT = 2
+UP_RIGHT = 3
+LEFT = 4
+RIGHT = 5
+DOWN = 6
+UP = 7
+
+DIAGONAL_DIRECTIONS = (DOWN_LEFT, DOWN_RIGHT, UP_LEFT, UP_RIGHT)
+ORTHOGONAL_DIRECTIONS = (LEFT, RIGHT, DOWN, UP)
+
+# Steps on the full (2 * width) x height grid, of which only the dark squares are numbered.
+OFFSETS = {
+    DOWN_LEFT: (-1, 1),
+    DOWN_RIGHT: (1, 1),
+    UP_LEFT: (-1, -1),
+    UP_RIGHT: (1, -1),
+    LEFT: (-2, 0),
+    RIGHT: (2, 0),
+    DOWN: (0, 2),
+    UP: (0, -2),
+}
+
+class Geometry:
+    """
+    Board geometry for one (width, height, variant), built once and shared by every board.
+
+    Tables indexed by position have an unused entry at index 0 so that positions 1 to
+    width * height can be looked up directly.
+    """
+
+    def __init__(self, width, height, variant='standard'):
+        self.width = width
+        self.height = height
+        self.variant = variant
+        self.position_count = width * height
+        self.positions = tuple(range(1, self.position_count + 1))
+        self.rows = (None,) + tuple((position - 1) // width for position in self.positions)
+        self.columns = (None,) + tuple((position - 1) % width for position in self.positions)
+        self.position_layout = {row: {column: row * width + column + 1 for column in range(width)} for row in range(height)}
+        self.promotion_rows = {WHITE: 0, BLACK: height - 1}
+
+        self.has_orthogonal_captures = variant == 'frisian' or variant == 'frysk!'
+        self.capture_directions = DIAGONAL_DIRECTIONS + (ORTHOGONAL_DIRECTIONS if self.has_orthogonal_captures else ())
+
+        # (vertical, horizontal, left diagonal, right diagonal) for each player moving forward or backward.
+        self.directions = {
+            (BLACK, True): (DOWN, RIGHT, DOWN_LEFT, DOWN_RIGHT),
+            (BLACK, False): (UP, LEFT, UP_LEFT, UP_RIGHT),
+            (WHITE, True): (UP, LEFT, UP_LEFT, UP_RIGHT),
+            (WHITE, False): (DOWN, RIGHT, DOWN_LEFT, DOWN_RIGHT),
+        }
+
+        coordinates = {}
+        for position in self.positions:
+            row = self.rows[position]
+            coordinates[(2 * self.columns[position] + (1 if row % 2 == 0 else 0), row)] = position
+        self.coordinates = (None,) + tuple(sorted(coordinates, key=coordinates.get))
+
+        rays = {}
+        for direction, (dx, dy) in OFFSETS.items():
+            direction_rays = [()]
+            for position in self.positions:
+                x, y = self.coordinates[position]
+                ray = []
+                while (x + dx, y + dy) in coordinates:
+                    x, y = x + dx, y + dy
+                    ray.append(coordinates[(x, y)])
+                direction_rays.append(tuple(ray))
+            rays[direction] = tuple(direction_rays)
+        self.rays = rays
+        self.neighbours = {direction: tuple(ray[0] if ray else None for ray in direction_rays) for direction, direction_rays in rays.items()}
+
+        man_jumps = [()]
+        for position in self.positions:
+            man_jumps.append(tuple((position, rays[direction][position][0], rays[direction][position][1]) for direction in self.capture_directions if len(rays[direction][position]) >= 2))
+        self.man_jumps = tuple(man_jumps)
+        self.jump_landings = (None,) + tuple({over: to for _, over, to in man_jumps[position]} for position in self.positions)
+
+    def get_row(self, position):
+        return self.rows[position]
+
+    def get_column(self, position):
+        return self.columns[position]
+
+    def get_directions(self, player, forward):
+        return self.directions[(player, forward)]
+
+    def get_ray(self, position, direction):
+        return self.rays[direction][position]
+
+    def get_direction_between(self, start, end):
+        for direction in self.capture_directions:
+            if end in self.rays[direction][start]:
+                return direction
+        return None
+
+    def __reduce__(self):
+        return get_geometry, (self.width, self.height, self.variant)
+
+
+geometries = {}
+
+
+def get_geometry(width, height, variant='standard'):
+    key = (width, height, variant)
+    if key not in geometries:
+        geometries[key] = Geometry(width, height, variant)
+    return geometries[key]
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import re
+
+# Variant names used by Hub engines such as Scan.
+HUB_VARIANTS = {
+    'standard': 'normal',
+    'frisian': 'frisian',
+    'breakthrough': 'bt',
+}
+
+TOKEN = re.compile(r'([\w-]+)(?:=("[^"]*"|\S+))?')
+
+class HubEngineError(Exception):
+    pass
+
+
+class HubEngineTimeout(HubEngineError):
+    pass
+
+
+def parse_hub_line(line):
+    """
+    Splits a Hub protocol line into its command and a dict of its arguments, e.g.
+    'info depth=3 pv="32-28 19-23"' -> ('info', {'depth': '3', 'pv': '32-28 19-23'}).
+    """
+    tokens = TOKEN.findall(line)
+    if not tokens:
+        return '', {}
+    arguments = {}
+    for name, value in tokens[1:]:
+        arguments[name] = value[1:-1] if value.startswith('"') else value
+    return tokens[0][0], arguments
+
+
+def format_hub_value(value):
+    value = str(value)
+    return f'"{value}"' if ' ' in value else value
+
+
+class HubResult:
+
+    def __init__(self, move, ponder, info, board_move=None):
+        self.move = move
+        self.ponder = ponder
+        self.info = info
+        self.board_move = board_move
+
+    @property
+    def pv(self):
+        return self.info.get('pv', '').split()
+
+    def __repr__(self):
+        return f'HubResult(move={self.move}, ponder={self.ponder}, info={self.info})'
+
+
+class HubEngine:
+    """
+    One long-lived Hub engine process. Searches are run one after the other, callers wait on a lock.
+    """
+
+    def __init__(self, command, variant='standard', options=None, startup_timeout=10):
+        if variant not in HUB_VARIANTS:
+            raise ValueError(f'Hub engines don\'t play {variant}, only {", ".join(HUB_VARIANTS)}')
+        self.command = list(command)
+        self.variant = variant
+        self.options = dict(options or {})
+        self.startup_timeout = startup_timeout
+        self.process = None
+        self.id = {}
+        self.params = []
+        self.lock = asyncio.Lock()
+        self.pending = 0
+
+    async def start(self):
+        self.process = await asyncio.create_subprocess_exec(*self.command, stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL)
+        self.id = {}
+        self.params = []
+        self.send('hub')
+        while True:
+            command, arguments = await self.read(self.startup_timeout)
+            if command == 'id':
+                self.id = arguments
+            elif command == 'param':
+                self.params.append(arguments)
+            elif command == 'wait':
+                break
+        lines = []
+        if self.variant != 'standard':
+            lines.append(f'set-param name=variant value={HUB_VARIANTS[self.variant]}')
+        for name, value in self.options.items():
+            lines.append(f'set-param name={name} value={format_hub_value(value)}')
+        self.send(*lines, 'init')
+        while (await self.read(self.startup_timeout))[0] != 'ready':
+            pass
+
+    async def restart(self):
+        await self.kill()
+        await self.start()
+
+    async def kill(self):
+        if self.process is not None and self.process.returncode is None:
+            try:
+                self.process.kill()
+            except ProcessLookupError:
+                pass
+            await self.process.wait()
+
+    async def quit(self, timeout=2):
+        if self.process is None or self.process.returncode is not None:
+            return
+        try:
+            self.send('quit')
+            await asyncio.wait_for(self.process.wait(), timeout)
+        except (asyncio.TimeoutError, ConnectionError):
+            await self.kill()
+
+    @property
+    def alive(self):
+        return self.process is not None and self.process.returncode is None
+
+    def send(self, *lines):
+        # Lines of one request are written together, so the engine never waits for the next command.
+        self.process.stdin.write(''.join(line + '\n' for line in lines).encode())
+
+    async def read(self, timeout=None):
+        try:
+            line = await asyncio.wait_for(self.process.stdout.readline(), timeout)
+        except asyncio.TimeoutError:
+            raise HubEngineTimeout(f'{self.command[0]} did not answer in time')
+        if not line:
+            raise HubEngineError(f'{self.command[0]} exited')
+        return parse_hub_line(line.decode().strip())
+
+    async def analyse(self, position, moves=None, time=None, depth=None, nodes=None, timeout=None, new_game=False):
+        """
+        Searches the hub FEN position after the hub moves and returns a HubResult.
+        If the engine gives no answer within timeout seconds it is stopped, and killed if it still doesn't answer.
+        """
+        lines = ['new-game'] if new_game else []
+        lines.append(f'pos pos={position}' + (f' moves="{" ".join(moves)}"' if moves else ''))
+        if time is not None:
+            lines.append(f'level move-time={time}')
+        if depth is not None:
+            lines.append(f'level depth={depth}')
+        if nodes is not None:
+            lines.append(f'level nodes={nodes}')
+        if time is None and depth is None and nodes is None:
+            lines.append('level infinite')
+        lines.append('go think')
+        if timeout is None and time is not None:
+            timeout = time + 5
+
+        async with self.lock:
+            if not self.alive:
+                await self.start()
+            try:
+                return await self.search(lines, timeout)
+            except BaseException:
+                # A cancelled request leaves the engine searching, and its answer would be read by the next request.
+                await self.kill()
+                raise
+
+    async def search(self, lines, timeout):
+        self.send(*lines)
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        info = {}
+        stopped = False
+        while True:
+            remaining = None if deadline is None else max(0, deadline - loop.time())
+            try:
+                command, arguments = await self.read(remaining)
+            except HubEngineTimeout:
+                if stopped:
+                    raise
+                # Ask for the best move so far and give the engine a second to answer.
+                self.send('stop')
+                stopped = True
+                deadline = loop.time() + 1
+                continue
+            if command == 'info':
+                info.update(arguments)
+            elif command == 'done':
+                return HubResult(arguments.get('move'), arguments.get('ponder'), info)
+
+
+class HubEnginePool:
+    """
+    A pool of Hub engine processes that are reused across games. Requests go to the least busy engine
+    and wait in line there, a crashed engine is restarted and the request retried.
+
+        async with HubEnginePool(['scan', 'hub'], size=4) as pool:
+            result = await pool.analyse(game, time=1.0)
+    """
+
+    def __init__(self, command, size=1, variant='standard', options=None, retries=1):
+        if size < 1:
+            raise ValueError('The pool needs at least one engine')
+        if variant not in HUB_VARIANTS:
+            raise ValueError(f'Hub engines don\'t play {variant}, only {", ".join(HUB_VARIANTS)}')
+        self.variant = variant
+        self.retries = retries
+        self.engines = [HubEngine(command, variant, options) for _ in range(size)]
+
+    async def start(self):
+        await asyncio.gather(*(engine.start() for engine in self.engines))
+
+    async def close(self):
+        await asyncio.gather(*(engine.quit() for engine in self.engines))
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def analyse(self, game, time=None, depth=None, nodes=None, timeout=None, new_game=False):
+        """
+        Searches a Game or a hub FEN. For a game the result's board_move is the move as a list of steps.
+        """
+        if isinstance(game, str):
+            position, moves = game, None
+        else:
+            if game.variant != self.variant:
+                raise ValueError(f'The pool plays {self.variant}, not {game.variant}')
+            if game.not_added_move:
+                raise ValueError('A capture sequence is in progress')
+            position, moves = game.initial_hub_fen, game.hub_move_stack
+
+        engine = min(self.engines, key=lambda engine: engine.pending)
+        engine.pending += 1
+        try:
+            for attempt in range(self.retries + 1):
+                try:
+                    result = await engine.analyse(position, moves, time, depth, nodes, timeout, new_game)
+                    break
+                except HubEngineTimeout:
+                    raise
+                except (HubEngineError, ConnectionError):
+                    if attempt == self.retries:
+                        raise HubEngineError(f'{engine.command[0]} keeps crashing')
+        finally:
+            engine.pending -= 1
+
+        if not isinstance(game, str) and result.move is not None:
+            result.board_move = game.hub_to_li_board(result.move.replace('-', '').replace('x', ''))[1]
+        return result
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from collections import OrderedDict
+
+# The most recently used Moves, keyed by (path, captured). The least recently used one is dropped past
+# INTERN_CAPACITY, so long runs over many positions and variants don't keep every move ever made.
+INTERN_CAPACITY = 65536
+interned_moves = OrderedDict()
+
+class Move(tuple):
+    """
+    Immutable, hashable complete move: the (path, captured) tuple of the squares the piece stands on and the
+    captured squares, in capture order. Recently used moves are interned, so equal moves are usually the same
+    object, but they compare and hash as tuples, so nothing depends on it.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, path, captured=()):
+        key = (tuple(path), tuple(captured))
+        move = interned_moves.get(key)
+        if move is None:
+            move = interned_moves[key] = tuple.__new__(cls, key)
+            while len(interned_moves) > INTERN_CAPACITY:
+                interned_moves.popitem(last=False)
+        else:
+            interned_moves.move_to_end(key)
+        return move
+
+    @classmethod
+    def from_steps(cls, move, captures=None):
+        """
+        The Move of a list of steps such as [[32, 23], [23, 14]] and the captured positions of every step
+        ([None] or None for a positional move).
+        """
+        path = (move[0][0],) + tuple(semi_move[1] for semi_move in move)
+        captured = () if captures is None else tuple(position for position in captures if position is not None)
+        return cls(path, captured)
+
+    def __reduce__(self):
+        return Move, tuple(self)
+
+    @property
+    def path(self):
+        return self[0]
+
+    @property
+    def captured(self):
+        return self[1]
+
+    @property
+    def start(self):
+        return self[0][0]
+
+    @property
+    def end(self):
+        return self[0][-1]
+
+    @property
+    def is_capture(self):
+        return bool(self[1])
+
+    @property
+    def steps(self):
+        """
+        The move as a list of [from, to] steps, as used by Game.move and Game.legal_moves.
+        """
+        path = self[0]
+        return [[path[index], path[index + 1]] for index in range(len(path) - 1)]
+
+    @property
+    def captures(self):
+        """
+        The captured positions of every step, [None] for a positional move, as used by Game.legal_moves.
+        """
+        return list(self[1]) if self[1] else [None]
+
+    def __repr__(self):
+        return f'Move({self[0]!r}, {self[1]!r})'
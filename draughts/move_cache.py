@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from collections import OrderedDict
+
+class MoveCache:
+    """
+    Size-bounded LRU cache of (moves, captures), shared by any number of games.
+
+    Entries are keyed by Game.get_move_cache_key(), so games of different variants can share one cache.
+    They are stored as nested tuples and every hit gets new lists, so a caller changing its moves can't
+    change what other games get from the cache.
+    """
+
+    def __init__(self, capacity=4096):
+        if capacity < 1:
+            raise ValueError('The capacity must be at least 1')
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        moves, captures = entry
+        return [[list(step) for step in move] for move in moves], [list(captured) for captured in captures]
+
+    def put(self, key, moves, captures):
+        self.entries[key] = (tuple(tuple(tuple(step) for step in move) for move in moves), tuple(tuple(captured) for captured in captures))
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self.entries),
+            'capacity': self.capacity,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __reduce__(self):
+        # A pickled cache comes back empty, so pickling a game does not copy every cached position.
+        return MoveCache, (self.capacity,)
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import re
+from .move import Move
+
+class MoveRecord:
+    """
+    A legal move with every notation it is written in.
+
+    move is the list of steps and captures the captured positions of every step ([None] for a positional move).
+    path holds every square the piece stands on and captured the captured squares, both as tuples.
+    Squares are written with two digits: li '322314', hub '32x14x23' (captures sorted, as hub engines write them),
+    hub_key '321423' (hub without separators), pdn_short '32x14' (the full path when the ends are ambiguous),
+    pdn_long '32x23x14' and li_api ('3223', '2314'). key is the interned Move of the path and captured squares.
+    """
+
+    __slots__ = ('move', 'captures', 'path', 'captured', 'key', 'li', 'hub', 'hub_key', 'pdn_short', 'pdn_long', 'li_api')
+
+    def __init__(self, move, captures, ambiguous=False):
+        self.move = move
+        self.captures = captures
+        self.path = (move[0][0],) + tuple(semi_move[1] for semi_move in move)
+        self.captured = tuple(position for position in captures if position is not None)
+        self.key = Move(self.path, self.captured)
+        squares = [f'{square:02d}' for square in self.path]
+        ends = squares[0] + squares[-1]
+        sorted_captured = sorted(f'{square:02d}' for square in self.captured)
+        self.li = ''.join(squares)
+        self.hub_key = ends + ''.join(sorted_captured)
+        self.li_api = tuple(squares[index] + squares[index + 1] for index in range(len(squares) - 1))
+        if self.captured:
+            self.hub = 'x'.join([squares[0], squares[-1]] + sorted_captured)
+            self.pdn_long = 'x'.join(squares)
+            self.pdn_short = self.pdn_long if ambiguous else squares[0] + 'x' + squares[-1]
+        else:
+            self.hub = squares[0] + '-' + squares[-1]
+            self.pdn_long = self.hub
+            self.pdn_short = self.hub
+
+    def __repr__(self):
+        return f'MoveRecord({self.hub!r})'
+
+
+class MoveRecords:
+    """
+    The MoveRecords of the legal moves of a position, built from one legal move generation, in legal move order.
+    """
+
+    __slots__ = ('records', 'by_move', 'by_li', 'by_hub', 'by_pdn')
+
+    def __init__(self, moves, captures):
+        ends = {}
+        for move in moves:
+            key = move[0][0], move[-1][1]
+            ends[key] = ends.get(key, 0) + 1
+        self.records = [MoveRecord(move, captured, ends[move[0][0], move[-1][1]] > 1) for move, captured in zip(moves, captures)]
+        self.by_move = {}
+        self.by_li = {}
+        self.by_hub = {}
+        self.by_pdn = {}
+        for record in self.records:
+            self.by_move[record.key] = record
+            self.by_li[record.li] = record
+            self.by_hub[record.hub] = record
+            self.by_hub[record.hub_key] = record
+            self.by_pdn[record.pdn_long] = record
+            self.by_pdn.setdefault(record.pdn_short, record)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __getitem__(self, index):
+        return self.records[index]
+
+    def from_move(self, move):
+        """
+        The record of a Move, or of a list of steps such as [[32, 23], [23, 14]], or None if it is not legal.
+        """
+        if isinstance(move, Move):
+            return self.by_move.get(move)
+        return self.by_li.get(''.join(f'{square:02d}' for square in [move[0][0]] + [semi_move[1] for semi_move in move]))
+
+    def from_li(self, li_move):
+        return self.by_li.get(li_move)
+
+    def from_hub(self, hub_move):
+        return self.by_hub.get(hub_move)
+
+    def from_pdn(self, pdn_move):
+        """
+        Squares may be written with one or two digits ('5-10' or '05-10').
+        """
+        record = self.by_pdn.get(pdn_move)
+        if record is None:
+            separator = 'x' if 'x' in pdn_move else '-'
+            record = self.by_pdn.get(separator.join(square.zfill(2) for square in re.split('[-x]', pdn_move)))
+        return record
+
+    def find(self, notation):
+        """
+        The record of a move in li, hub or PDN notation, or None if no legal move is written that way.
+        """
+        return self.from_li(notation) or self.from_hub(notation) or self.from_pdn(notation)
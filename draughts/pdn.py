@@ -0,0 +1,413 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+import re
+from .game import Game
+
+WHITE = 2
+BLACK = 1
+
+# Magic bytes of the compressed formats that are opened transparently.
+COMPRESSIONS = (
+    (b'\x1f\x8b', gzip),
+    (b'BZh', bz2),
+    (b'\xfd7zXZ\x00', lzma),
+)
+
+# First field of the GameType tag.
+GAME_TYPES = {
+    '20': 'standard',
+    '25': 'russian',
+    '26': 'brazilian',
+    '40': 'frisian',
+}
+
+VARIANTS = {
+    'international': 'standard',
+    'standard': 'standard',
+    'frisian': 'frisian',
+    'frysk!': 'frysk!',
+    'frysk': 'frysk!',
+    'russian': 'russian',
+    'brazilian': 'brazilian',
+    'breakthrough': 'breakthrough',
+}
+
+RESULTS = ('2-0', '0-2', '1-1', '0-0', '1-0', '0-1', '1/2-1/2', '*')
+
+# Tags written first and in this order, '?' when unknown.
+ROSTER = ('Event', 'Site', 'Date', 'Round', 'White', 'Black', 'Result')
+
+EXTENSIONS = {
+    '.gz': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'xz',
+}
+
+COMPRESSION_MODULES = {
+    'gzip': gzip,
+    'bz2': bz2,
+    'xz': lzma,
+}
+
+HEADER = re.compile(r'\[(\w+)\s+"((?:[^"\\]|\\.)*)"\s*\]')
+MOVETEXT_TOKEN = re.compile(r'\{([^}]*)\}|([()])|;[^\n]*|(2-0|0-2|1-1|0-0|1-0|0-1|1/2-1/2|\*)(?![\dx-])|(\d+(?:[-x]\d+)+)')
+COMMAND = re.compile(r'\[%(\w+)\s*([^\]]*)\]')
+
+def open_pdn(fileobj, encoding='utf-8-sig'):
+    """
+    Returns a text stream over a binary or text file object. gzip, bz2 and xz data is decompressed on the fly.
+    """
+    if isinstance(fileobj, io.TextIOBase):
+        return fileobj
+    if hasattr(fileobj, 'peek'):
+        magic = fileobj.peek(6)[:6]
+    else:
+        position = fileobj.tell()
+        magic = fileobj.read(6)
+        fileobj.seek(position)
+    for prefix, module in COMPRESSIONS:
+        if magic.startswith(prefix):
+            return module.open(fileobj, 'rt', encoding=encoding, errors='replace')
+    return io.TextIOWrapper(fileobj, encoding=encoding, errors='replace')
+
+
+def read_games(source, headers_only=False, encoding='utf-8-sig'):
+    """
+    Yields a PdnGame for every game of a path or file object, reading one line at a time so
+    memory use does not grow with the size of the file. With headers_only the movetext is skipped.
+    """
+    owned = isinstance(source, (str, bytes, os.PathLike))
+    fileobj = open(source, 'rb') if owned else source
+    stream = open_pdn(fileobj, encoding)
+    try:
+        headers = {}
+        movetext = []
+        in_movetext = False
+        for line in stream:
+            if line.startswith('['):
+                match = HEADER.match(line)
+                if match is not None:
+                    if in_movetext:
+                        yield PdnGame(headers, None if headers_only else ''.join(movetext))
+                        headers = {}
+                        movetext = []
+                        in_movetext = False
+                    headers[match.group(1)] = re.sub(r'\\(.)', r'\1', match.group(2))
+                    continue
+            if not line.strip():
+                # The blank line after the tags ends them even if the game has no movetext.
+                in_movetext = in_movetext or bool(headers)
+                continue
+            in_movetext = True
+            if not headers_only:
+                movetext.append(line)
+        if headers or movetext:
+            yield PdnGame(headers, None if headers_only else ''.join(movetext))
+    finally:
+        if owned:
+            stream.close()
+            fileobj.close()
+        elif stream is not fileobj and getattr(stream, 'buffer', None) is fileobj:
+            # Do not let the wrapper close the caller's file.
+            stream.detach()
+
+
+def parse_clock(value):
+    """
+    '[%clock w0:01:58 B0:02:00]' -> {WHITE: 118.0, BLACK: 120.0}
+    """
+    clock = {}
+    for part in value.split():
+        player = WHITE if part[0] in 'wW' else BLACK
+        seconds = 0.0
+        for field in part[1:].split(':'):
+            seconds = seconds * 60 + float(field)
+        clock[player] = seconds
+    return clock
+
+
+class PdnGame:
+    """
+    Tags and movetext of one game. Moves, comments and clocks are parsed when first asked for.
+    """
+
+    def __init__(self, headers, movetext=None):
+        self.headers = headers
+        self.movetext = movetext
+        self.parsed = None
+
+    @property
+    def variant(self):
+        if 'Variant' in self.headers:
+            variant = self.headers['Variant'].lower()
+            return VARIANTS.get(variant, variant)
+        return GAME_TYPES.get(self.headers.get('GameType', '20').split(',')[0], 'standard')
+
+    @property
+    def fen(self):
+        return self.headers.get('FEN', 'startpos')
+
+    @property
+    def result(self):
+        if 'Result' in self.headers:
+            return self.headers['Result']
+        return self.parse()[4]
+
+    @property
+    def moves(self):
+        return self.parse()[0]
+
+    @property
+    def comments(self):
+        """
+        The comment after every move, without [%...] commands, or None.
+        """
+        return self.parse()[1]
+
+    @property
+    def clocks(self):
+        """
+        The [%clock] times after every move as {WHITE: seconds, BLACK: seconds}, or None.
+        """
+        return self.parse()[2]
+
+    @property
+    def initial_comment(self):
+        return self.parse()[3]
+
+    def parse(self):
+        if self.parsed is not None:
+            return self.parsed
+        if self.movetext is None:
+            raise ValueError('The movetext was skipped, read the games without headers_only')
+        moves = []
+        comments = []
+        clocks = []
+        initial_comment = None
+        result = None
+        depth = 0
+        for match in MOVETEXT_TOKEN.finditer(self.movetext):
+            comment, parenthesis, result_token, move = match.groups()
+            if parenthesis is not None:
+                depth += 1 if parenthesis == '(' else -1
+            elif depth:
+                # Variations are skipped.
+                continue
+            elif move is not None:
+                moves.append(move)
+                comments.append(None)
+                clocks.append(None)
+            elif result_token is not None:
+                result = result_token
+            elif comment is not None:
+                for name, value in COMMAND.findall(comment):
+                    if name == 'clock' and moves:
+                        clocks[-1] = parse_clock(value)
+                text = ' '.join(COMMAND.sub('', comment).split())
+                if not text:
+                    continue
+                if not moves:
+                    initial_comment = text if initial_comment is None else initial_comment + ' ' + text
+                else:
+                    comments[-1] = text if comments[-1] is None else comments[-1] + ' ' + text
+        self.parsed = moves, comments, clocks, initial_comment, result
+        return self.parsed
+
+    def replay(self, plies=None, move_cache=None):
+        """
+        Returns a Game with the first plies moves (all by default) played.
+        """
+        game = Game(self.variant, self.fen, move_cache)
+        for move in self.moves[:plies]:
+            for semi_move in game.pdn_to_board(move):
+                game.move(semi_move)
+        return game
+
+    def __repr__(self):
+        return f'PdnGame(white={self.headers.get("White", "?")}, black={self.headers.get("Black", "?")}, result={self.headers.get("Result", "*")})'
+
+
+def format_clock_time(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f'{hours}:{minutes:02}:{seconds:02}'
+
+
+def format_clock(clock, player):
+    """
+    {WHITE: 118, BLACK: 120} -> '[%clock w0:01:58 B0:02:00]' when white just moved.
+    """
+    parts = []
+    for clock_player, letter in ((WHITE, 'w'), (BLACK, 'b')):
+        if clock_player in clock:
+            parts.append((letter if clock_player == player else letter.upper()) + format_clock_time(clock[clock_player]))
+    return '[%clock ' + ' '.join(parts) + ']'
+
+
+def pdn_moves(game):
+    """
+    The completed moves of a game in the shortest unambiguous PDN, found in one replay of the game.
+
+    A man's or king's move without captures and a single capture are the only ones between their two squares,
+    so legal moves are only generated before multiple captures, to see whether the full path is needed.
+    """
+    replay = Game(game.variant, game.initial_fen)
+    moves = []
+    for li_move, captures in zip(game.move_stack, game.capture_stack):
+        board_move = replay.li_to_steps(li_move)
+        squares = [board_move[0][0]] + [semi_move[1] for semi_move in board_move]
+        separator = '-' if captures[0] is None else 'x'
+        if len(captures) > 1:
+            possible_moves = replay.legal_moves()[0]
+            same_ends = sum(1 for possible_move in possible_moves if possible_move[0][0] == squares[0] and possible_move[-1][1] == squares[-1])
+            if same_ends > 1:
+                separator = None
+        if separator is None:
+            moves.append('x'.join(map(str, squares)))
+        else:
+            moves.append(f'{squares[0]}{separator}{squares[-1]}')
+        replay.push_trusted_move(board_move)
+    return moves
+
+
+def get_result(game):
+    if not game.move_stack or not game.is_over():
+        return '*'
+    winner = game.get_winner()
+    if winner is None:
+        # The move limit was reached
+        return '1-1'
+    return '2-0' if winner == WHITE else '0-2'
+
+
+def get_variant_headers(variant):
+    for game_type, game_type_variant in GAME_TYPES.items():
+        if game_type_variant == variant:
+            return {'GameType': game_type}
+    return {'GameType': '20', 'Variant': variant.capitalize()}
+
+
+def render_game(headers, moves, first_player=WHITE, clocks=None, comments=None, result='*'):
+    """
+    PDN text of one game: the tags, a blank line and the movetext on one line, as lidraughts writes it.
+    """
+    lines = []
+    for name in ROSTER:
+        value = headers.get(name, result if name == 'Result' else '?')
+        lines.append(f'[{name} "{escape(value)}"]')
+    for name, value in headers.items():
+        if name not in ROSTER:
+            lines.append(f'[{name} "{escape(value)}"]')
+
+    tokens = []
+    player = first_player
+    move_number = 1
+    for ply, move in enumerate(moves):
+        if player == WHITE:
+            tokens.append(f'{move_number}.')
+        elif ply == 0:
+            tokens.append(f'{move_number}...')
+        tokens.append(move)
+        comment = []
+        if clocks is not None and clocks[ply] is not None:
+            comment.append(format_clock(clocks[ply], player))
+        if comments is not None and comments[ply] is not None:
+            comment.append(comments[ply])
+        if comment:
+            tokens.append('{' + ' '.join(comment) + '}')
+        if player == BLACK:
+            move_number += 1
+        player = BLACK if player == WHITE else WHITE
+    tokens.append(result)
+    return '\n'.join(lines) + '\n\n' + ' '.join(tokens) + '\n\n'
+
+
+def escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"')
+
+
+def render(item):
+    """
+    PDN text of a Game, a PdnGame or a (Game, headers) or (Game, headers, clocks) tuple.
+    """
+    if isinstance(item, PdnGame):
+        first_player = BLACK if item.fen.startswith('B') else WHITE
+        return render_game(item.headers, item.moves, first_player, item.clocks, item.comments, item.result or '*')
+    game, headers, clocks = (item, {}, None) if isinstance(item, Game) else (tuple(item) + (None,))[:3]
+    result = get_result(game)
+    full_headers = dict(headers)
+    full_headers.setdefault('Result', result)
+    for name, value in get_variant_headers(game.variant).items():
+        full_headers.setdefault(name, value)
+    if game.initial_fen != 'startpos':
+        full_headers.setdefault('FEN', game.initial_fen)
+    first_player = BLACK if game.initial_hub_fen[0] == 'B' else WHITE
+    return render_game(full_headers, pdn_moves(game), first_player, clocks, None, full_headers['Result'])
+
+
+def write_games(destination, games, compression=None, buffer_size=1 << 20):
+    """
+    Writes games (see render) to a path or file object and returns how many were written.
+    compression is 'gzip', 'bz2' or 'xz', for paths it is taken from the extension by default.
+    Text is collected in memory and written buffer_size characters at a time.
+    """
+    owned = isinstance(destination, (str, bytes, os.PathLike))
+    if owned and compression is None:
+        compression = EXTENSIONS.get(os.path.splitext(os.fsdecode(destination))[1])
+    if compression is not None and compression not in COMPRESSION_MODULES:
+        raise ValueError(f'Unknown compression {compression}')
+    if owned:
+        module = COMPRESSION_MODULES[compression] if compression is not None else io
+        stream = module.open(destination, 'wt', encoding='utf-8')
+    elif compression is not None:
+        stream = COMPRESSION_MODULES[compression].open(destination, 'wt', encoding='utf-8')
+    elif isinstance(destination, io.TextIOBase):
+        stream = destination
+    else:
+        stream = io.TextIOWrapper(destination, encoding='utf-8')
+
+    count = 0
+    pending = []
+    pending_size = 0
+    try:
+        for item in games:
+            text = render(item)
+            pending.append(text)
+            pending_size += len(text)
+            count += 1
+            if pending_size >= buffer_size:
+                stream.write(''.join(pending))
+                pending = []
+                pending_size = 0
+        stream.write(''.join(pending))
+    finally:
+        if owned or compression is not None:
+            # Closing a compressed stream writes its trailer, the caller's file object stays open.
+            stream.close()
+        elif stream is not destination:
+            stream.flush()
+            stream.detach()
+        else:
+            stream.flush()
+    return count
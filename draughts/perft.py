@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import time
+from .game import Game
+
+# Node counts of the legal move tree (a complete capture sequence is one move), indexed by depth - 1.
+# Games are not ended early, so breakthrough counts continue after a man promotes.
+REFERENCE_COUNTS = {
+    ('standard', 'startpos'): [9, 81, 658, 4265, 27117, 167140, 1049442],
+    ('standard', 'W:WK4,34,36,46:B7,K8,11,13,23,27'): [5, 82, 564, 5496, 48238, 460097],
+    ('frisian', 'startpos'): [9, 81, 658, 3880, 21345, 103584, 550314],
+    ('frisian', 'W:WK1,36,41:B3,4,5,7,8,9,10,11,12,17,18,19,23,K44'): [2, 22, 98, 605, 4936, 32148],
+    ('frysk!', 'startpos'): [9, 81, 657, 5329, 41829, 328329, 2572197],
+    ('frysk!', 'B:WK11,12,42:B6,20,K50'): [1, 2, 26, 49, 490, 831, 7958],
+    ('brazilian', 'startpos'): [7, 49, 302, 1469, 7473, 37628, 187302, 907836],
+    ('brazilian', 'B:WK1,25,26,27,28,31,32:B4,5,7,9,20,K29'): [5, 33, 217, 1513, 9776, 66251],
+    ('russian', 'startpos'): [7, 49, 302, 1469, 7482, 37986, 190146, 929907],
+    ('russian', 'B:WK3,15,16,27,28:B12,K29'): [4, 29, 90, 691, 5011, 39180],
+    ('breakthrough', 'startpos'): [9, 81, 658, 4265, 27117, 167140, 1049442],
+    ('breakthrough', 'W:W25,26,30,33,36,41,47,50:B2,4,5,8,9,10,11,13,18,19,20,21'): [2, 2, 2, 16, 142, 990],
+}
+
+def push_move(game, move, captures):
+    """
+    Plays a complete legal move in place and returns what pop_move needs to take it back.
+    """
+    not_added = game.not_added_move, game.not_added_capture
+    board_captures = list(game.not_added_capture)
+    undo_infos = []
+    for step, captured in zip(move, captures):
+        undo_infos.append(game.board.make(step, len(game.move_stack) + 1, board_captures))
+        board_captures = board_captures + [captured]
+    game.move_stack.append(game.board_to_li(game.not_added_move + move))
+    game.capture_stack.append(game.not_added_capture + captures)
+    if game.not_added_move:
+        game.not_added_move = []
+        game.not_added_capture = []
+    return undo_infos, not_added
+
+def pop_move(game, pushed):
+    undo_infos, (game.not_added_move, game.not_added_capture) = pushed
+    game.move_stack.pop()
+    game.capture_stack.pop()
+    for undo_info in reversed(undo_infos):
+        game.board.unmake(undo_info)
+
+def perft(game, depth, bulk=True):
+    """
+    Counts the leaf nodes of the legal move tree of the given depth. With bulk counting the
+    moves at depth 1 are counted without being played.
+    """
+    if depth <= 0:
+        return 1
+    moves, captures = game.legal_moves()
+    if depth == 1 and bulk:
+        return len(moves)
+    nodes = 0
+    for move, captured in zip(moves, captures):
+        pushed = push_move(game, move, captured)
+        nodes += perft(game, depth - 1, bulk)
+        pop_move(game, pushed)
+    return nodes
+
+def perft_without_bulk(game, depth):
+    return perft(game, depth, False)
+
+def divide(game, depth, bulk=True):
+    """
+    Returns a list of (hub move, nodes) for every legal move of the position, where nodes is the perft
+    of depth - 1 after that move.
+    """
+    results = []
+    moves, captures = game.legal_moves()
+    for move, captured in zip(moves, captures):
+        hub_move = game.li_to_hub(game.board_to_li(move), captured)
+        pushed = push_move(game, move, captured)
+        results.append((hub_move, perft(game, depth - 1, bulk)))
+        pop_move(game, pushed)
+    return results
+
+def timed_perft(game, depth, bulk=True):
+    """
+    Returns (nodes, seconds, nodes per second).
+    """
+    start = time.perf_counter()
+    nodes = perft(game, depth, bulk)
+    seconds = time.perf_counter() - start
+    return nodes, seconds, nodes / seconds if seconds else float('inf')
+
+def split_tree(game, split_depth):
+    """
+    Returns (path, hub moves) for every node split_depth moves below the game's position, where path holds
+    the steps of those moves.
+    """
+    nodes = []
+
+    def visit(path, hub_moves, depth):
+        if depth == 0:
+            nodes.append((path, hub_moves))
+            return
+        moves, captures = game.legal_moves()
+        for move, captured in zip(moves, captures):
+            hub_move = game.li_to_hub(game.board_to_li(move), captured)
+            pushed = push_move(game, move, captured)
+            visit(path + move, hub_moves + [hub_move], depth - 1)
+            pop_move(game, pushed)
+
+    visit([], [], split_depth)
+    return nodes
+
+def walk_subtree(payload):
+    """
+    Runs in a worker process. The payload is (walker, variant, initial li FEN, steps played since, depth),
+    so only a few integers and strings cross the process boundary instead of a pickled Game.
+    """
+    walker, variant, fen, steps, depth = payload
+    game = Game(variant, fen)
+    for step in steps:
+        game.move(step)
+    start = time.perf_counter()
+    nodes = walker(game, depth)
+    return nodes, time.perf_counter() - start
+
+def parallel_divide(game, depth, variant='standard', split_depth=1, workers=None, walker=perft):
+    """
+    Splits the tree split_depth moves below the root and walks the subtrees in a process pool.
+
+    game is a Game or a hub FEN of the given variant. walker(game, depth) must be a module level function
+    returning the count of a subtree, perft by default. Returns a list of (hub moves, count, seconds),
+    one per subtree in legal move order, whatever the order the workers finish in.
+    """
+    if isinstance(game, str):
+        game = Game(variant, Game(variant).hub_fen_to_li_fen(game))
+    split_depth = max(0, min(split_depth, depth - 1))
+    history = list(game.moves)
+    payloads = []
+    subtrees = split_tree(game, split_depth)
+    for path, _ in subtrees:
+        payloads.append((walker, game.variant, game.initial_fen, history + path, depth - split_depth))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Subtrees differ a lot in size, so they are handed out one at a time.
+        results = list(executor.map(walk_subtree, payloads))
+    return [(' '.join(hub_moves), nodes, seconds) for (_, hub_moves), (nodes, seconds) in zip(subtrees, results)]
+
+def parallel_perft(game, depth, variant='standard', split_depth=1, workers=None, walker=perft):
+    return sum(nodes for _, nodes, _ in parallel_divide(game, depth, variant, split_depth, workers, walker))
+
+def check_reference(variant, fen, max_depth=None, bulk=True):
+    """
+    Compares perft with REFERENCE_COUNTS and returns a list of (depth, expected, nodes).
+    """
+    results = []
+    for depth, expected in enumerate(REFERENCE_COUNTS[(variant, fen)], 1):
+        if max_depth is not None and depth > max_depth:
+            break
+        results.append((depth, expected, perft(Game(variant, fen), depth, bulk)))
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Count the nodes of the legal move tree of a draughts position.')
+    parser.add_argument('depth', type=int)
+    parser.add_argument('--variant', default='standard')
+    parser.add_argument('--fen', default='startpos', help='lidraughts FEN, default: the starting position')
+    parser.add_argument('--divide', action='store_true', help='print the node count after every legal move')
+    parser.add_argument('--no-bulk', action='store_true', help='play the moves at depth 1 instead of counting them')
+    parser.add_argument('--workers', type=int, help='walk the subtrees in this many processes')
+    parser.add_argument('--split-depth', type=int, default=1, help='depth at which the tree is split between the processes')
+    args = parser.parse_args(argv)
+
+    game = Game(args.variant, args.fen)
+    bulk = not args.no_bulk
+    start = time.perf_counter()
+    if args.workers:
+        nodes = 0
+        walker = perft if bulk else perft_without_bulk
+        for hub_moves, move_nodes, move_seconds in parallel_divide(game, args.depth, args.variant, args.split_depth, args.workers, walker):
+            if args.divide:
+                print(f'{hub_moves}: {move_nodes}  {move_seconds:.3f}s')
+            nodes += move_nodes
+    elif args.divide:
+        nodes = 0
+        for hub_move, move_nodes in divide(game, args.depth, bulk):
+            print(f'{hub_move}: {move_nodes}')
+            nodes += move_nodes
+    else:
+        nodes = perft(game, args.depth, bulk)
+    seconds = time.perf_counter() - start
+    nodes_per_second = nodes / seconds if seconds else float('inf')
+    print(f'perft({args.depth}) = {nodes}  {seconds:.3f}s  {nodes_per_second:.0f} nodes/s')
+
+    expected = REFERENCE_COUNTS.get((args.variant, args.fen), [])
+    if args.depth <= len(expected) and expected[args.depth - 1] != nodes:
+        print(f'expected {expected[args.depth - 1]}')
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+An index from positions to the games (and plies) that reached them.
+
+The index is a directory of segment files. Every segment is a header followed by (position key, game id, ply)
+postings sorted by key, so a lookup is a binary search in every memory-mapped segment. New games are written
+as a new segment and compact merges all segments into one.
+"""
+
+import heapq
+import mmap
+import os
+import struct
+from .archive import sorted_legal_moves
+from .game import Game
+from .zobrist import get_hub_fen_key
+
+MAGIC = b'DRPIDX\x00\x01'
+
+# magic, variant, first game id, game count, posting count
+SEGMENT_HEADER = struct.Struct('<8s16sQQQ')
+# position key, game id, ply
+POSTING = struct.Struct('<QII')
+
+def iter_position_keys(game):
+    """
+    Yields the key of the starting position and of the position after every completed move of a Game,
+    or of an archive record (variant, initial fen, move indices).
+    """
+    if isinstance(game, Game):
+        replay = Game(game.variant, game.initial_fen)
+        yield replay.position_key()
+        for li_move in game.move_stack:
+            replay.push_trusted_move(replay.li_to_steps(li_move))
+            yield replay.position_key()
+    else:
+        variant, fen, indices = game
+        replay = Game(variant, fen)
+        yield replay.position_key()
+        for index in indices:
+            replay.push_trusted_move(sorted_legal_moves(replay)[0][index])
+            yield replay.position_key()
+
+
+def get_variant(game):
+    return game.variant if isinstance(game, Game) else game[0]
+
+
+class Segment:
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as file:
+            self.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, variant, self.first_game_id, self.game_count, self.count = SEGMENT_HEADER.unpack_from(self.mmap, 0)
+        if magic != MAGIC or len(self.mmap) != SEGMENT_HEADER.size + self.count * POSTING.size:
+            self.mmap.close()
+            raise ValueError(f'{path} is not a position index segment')
+        self.variant = variant.rstrip(b'\x00').decode()
+
+    def get_key(self, number):
+        return struct.unpack_from('<Q', self.mmap, SEGMENT_HEADER.size + number * POSTING.size)[0]
+
+    def lookup(self, key):
+        low = 0
+        high = self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self.get_key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        postings = []
+        offset = SEGMENT_HEADER.size + low * POSTING.size
+        end = len(self.mmap)
+        while offset < end:
+            posting_key, game_id, ply = POSTING.unpack_from(self.mmap, offset)
+            if posting_key != key:
+                break
+            postings.append((game_id, ply))
+            offset += POSTING.size
+        return postings
+
+    def __iter__(self):
+        return POSTING.iter_unpack(memoryview(self.mmap)[SEGMENT_HEADER.size:])
+
+    def close(self):
+        self.mmap.close()
+
+
+def write_segment(path, variant, first_game_id, game_count, postings, count):
+    """
+    Writes sorted postings to path through a temporary file, so readers never see half a segment.
+    """
+    temporary_path = path + '.tmp'
+    with open(temporary_path, 'wb') as file:
+        file.write(SEGMENT_HEADER.pack(MAGIC, variant.encode(), first_game_id, game_count, count))
+        chunk = bytearray()
+        for posting in postings:
+            chunk += POSTING.pack(*posting)
+            if len(chunk) >= 1 << 20:
+                file.write(chunk)
+                chunk = bytearray()
+        file.write(chunk)
+    os.replace(temporary_path, path)
+
+
+class PositionIndex:
+    """
+    Finds the games of a corpus that reached a position, without replaying them.
+
+        with PositionIndex('explorer', 'standard') as index:
+            index.add_games(games)
+            index.lookup(game) #[(game id, ply), ...]
+    """
+
+    def __init__(self, path, variant='standard', segment_size=1 << 21):
+        self.path = path
+        self.variant = variant
+        self.segment_size = segment_size
+        os.makedirs(path, exist_ok=True)
+        self.segments = []
+        for name in sorted(os.listdir(path)):
+            if name.startswith('segment-') and name.endswith('.idx'):
+                self.open_segment(os.path.join(path, name))
+
+    def open_segment(self, path):
+        segment = Segment(path)
+        if segment.variant != self.variant:
+            segment.close()
+            raise ValueError(f'{path} indexes {segment.variant} games, not {self.variant}')
+        self.segments.append(segment)
+
+    @property
+    def game_count(self):
+        """
+        Game ids given so far, games are numbered from 0 in the order they were added.
+        """
+        return max((segment.first_game_id + segment.game_count for segment in self.segments), default=0)
+
+    def get_next_segment_path(self):
+        number = 0
+        if self.segments:
+            number = int(os.path.basename(self.segments[-1].path)[8:-4]) + 1
+        return os.path.join(self.path, f'segment-{number:06}.idx')
+
+    def add_games(self, games):
+        """
+        Indexes Game objects or archive records, numbering them after the games already in the index.
+        Postings are sorted and written as a new segment every segment_size postings. Returns the first new game id.
+        """
+        first_game_id = game_id = segment_first_game_id = self.game_count
+        postings = []
+        for game in games:
+            if get_variant(game) != self.variant:
+                raise ValueError(f'The index holds {self.variant} games, not {get_variant(game)}')
+            for ply, key in enumerate(iter_position_keys(game)):
+                postings.append((key, game_id, ply))
+            game_id += 1
+            if len(postings) >= self.segment_size:
+                self.flush(postings, segment_first_game_id, game_id)
+                postings = []
+                segment_first_game_id = game_id
+        if postings or game_id > segment_first_game_id:
+            self.flush(postings, segment_first_game_id, game_id)
+        return first_game_id
+
+    def flush(self, postings, first_game_id, end_game_id):
+        postings.sort()
+        path = self.get_next_segment_path()
+        write_segment(path, self.variant, first_game_id, end_game_id - first_game_id, postings, len(postings))
+        self.open_segment(path)
+
+    def get_key(self, position):
+        if isinstance(position, str):
+            return get_hub_fen_key(position)
+        if position.variant != self.variant:
+            raise ValueError(f'The index holds {self.variant} games, not {position.variant}')
+        if position.not_added_move:
+            raise ValueError('A capture sequence is in progress')
+        return position.position_key()
+
+    def lookup(self, position):
+        """
+        (game id, ply) of every time a Game's position or a hub FEN was reached, ply 0 being the starting position.
+        """
+        key = self.get_key(position)
+        postings = []
+        for segment in self.segments:
+            postings.extend(segment.lookup(key))
+        postings.sort()
+        return postings
+
+    def count(self, position):
+        return len(self.lookup(position))
+
+    def compact(self):
+        """
+        Merges all segments into one, reading them in order so memory use stays flat.
+        """
+        if len(self.segments) < 2:
+            return
+        segments = self.segments
+        first_game_id = min(segment.first_game_id for segment in segments)
+        path = self.get_next_segment_path()
+        write_segment(path, self.variant, first_game_id, self.game_count - first_game_id, heapq.merge(*segments), sum(segment.count for segment in segments))
+        self.segments = []
+        self.open_segment(path)
+        for segment in segments:
+            segment.close()
+            os.remove(segment.path)
+
+    def close(self):
+        for segment in self.segments:
+            segment.close()
+        self.segments = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import random
+
+WHITE = 2
+BLACK = 1
+
+MAX_POSITION_COUNT = 50
+
+# A fixed seed keeps keys identical between processes, so they can be stored.
+_random = random.Random(20210628)
+
+def _keys():
+    return tuple(_random.getrandbits(64) for _ in range(MAX_POSITION_COUNT + 1))
+
+# PIECE_KEYS[player][king][position]
+PIECE_KEYS = {
+    BLACK: (_keys(), _keys()),
+    WHITE: (_keys(), _keys()),
+}
+WHITE_TO_MOVE_KEY = _random.getrandbits(64)
+CONTINUATION_KEYS = _keys()
+CAPTURED_KEYS = _keys()
+
+def get_piece_key(player, king, position):
+    return PIECE_KEYS[player][king][position]
+
+def get_pieces_key(pieces):
+    key = 0
+    for piece in pieces:
+        if not piece.captured:
+            key ^= PIECE_KEYS[piece.player][piece.king][piece.position]
+    return key
+
+def get_hub_fen_key(hub_fen):
+    """
+    Key of a hub FEN, equal to Board.zobrist_key of the same position when no capture is in progress.
+    """
+    key = WHITE_TO_MOVE_KEY if hub_fen[0] == 'W' else 0
+    for position, letter in enumerate(hub_fen[1:], 1):
+        if letter != 'e':
+            key ^= PIECE_KEYS[WHITE if letter in 'wW' else BLACK][letter in 'WB'][position]
+    return key
@@ -45,4 +45,7 @@ setuptools.setup(
     package_dir={"": "draughts"},
     packages=setuptools.find_packages(where="draughts"),
     python_requires=">=3",
+    extras_require={
+        "numpy": ["numpy"],
+    },
 )
\ No newline at end of file
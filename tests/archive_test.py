@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+from draughts.archive import ArchiveReader, ArchiveWriter, write_archive, encode_game, encode_varint, decode_varint
+from draughts.game import Game, IllegalMoveError
+from random_games import play_random_game
+import os
+import tempfile
+import unittest
+
+class ArchiveTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'games.drarc')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def assertSameGame(self, first, second):
+        self.assertEqual(first.variant, second.variant)
+        self.assertEqual(first.initial_fen, second.initial_fen)
+        self.assertEqual(first.moves, second.moves)
+        self.assertEqual(first.move_stack, second.move_stack)
+        self.assertEqual(first.capture_stack, second.capture_stack)
+        self.assertEqual(first.hub_move_stack, second.hub_move_stack)
+        self.assertEqual(first.get_fen(), second.get_fen())
+        self.assertEqual(first.moves_since_last_capture, second.moves_since_last_capture)
+
+    def test_round_trip(self):
+        games = [play_random_game(variant, seed=seed) for seed, variant in enumerate(('standard', 'frisian', 'frysk!', 'russian', 'brazilian', 'breakthrough'))]
+        ambiguous = Game('standard', 'W:W28:B22,23,12,13')
+        for semi_move in [[28, 19], [19, 8], [8, 17], [17, 28]]:
+            ambiguous.move(semi_move)
+        games += [ambiguous, Game('russian', 'B:W21,22,23:B9,10,12'), play_random_game('frisian', 'W:WK1,36,41:B3,4,5,7,8,9,10,11,12,17,18,19,23,K44')]
+        self.assertEqual(write_archive(self.path, games), len(games))
+
+        with ArchiveReader(self.path) as archive:
+            self.assertEqual(len(archive), len(games))
+            for number, game in enumerate(games):
+                self.assertSameGame(archive[number], game)
+            self.assertSameGame(archive[-3], ambiguous)
+            self.assertEqual(archive.get_record(-3), ('standard', 'W:W28:B22,23,12,13', [1]))
+            self.assertEqual(len(list(archive)), len(games))
+            self.assertRaises(IndexError, archive.get_record, len(games))
+
+    def test_compact(self):
+        game = play_random_game('standard', plies=100)
+        write_archive(self.path, [game] * 10)
+        self.assertLess(os.path.getsize(self.path), 10 * (len(game.move_stack) + 16) + 40)
+
+    def test_empty_and_invalid(self):
+        write_archive(self.path, [])
+        with ArchiveReader(self.path) as archive:
+            self.assertEqual(len(archive), 0)
+
+        with open(self.path, 'wb') as file:
+            file.write(b'[Event "?"]' * 10)
+        self.assertRaises(ValueError, ArchiveReader, self.path)
+
+        game = Game('standard', 'W:W15:B10,8,9')
+        game.move([15, 4])
+        with ArchiveWriter(self.path) as writer:
+            self.assertRaises(ValueError, writer.add, game)
+
+        # 28x19 is forced
+        game = Game.from_moves(['3228', '1923', '3430'], validate='none')
+        with self.assertRaises(IllegalMoveError) as context:
+            encode_game(game)
+        self.assertEqual(context.exception.ply, 2)
+
+    def test_varint(self):
+        for value in (0, 1, 127, 128, 300, 1 << 40):
+            output = bytearray()
+            encode_varint(value, output)
+            self.assertEqual(decode_varint(output, 0), (value, len(output)))
+
+
+if __name__ == '__main__':
+    unittest.main()
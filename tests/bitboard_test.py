@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2010-2018 ImparaAI https://impara.ai (MIT License)
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+from draughts.board import Board
+from draughts.game import Game
+import unittest
+
+POSITIONS = [
+    ('standard', 'startpos'),
+    ('standard', 'WeeeWeebBeebebeeeeeeeeebeeebeeeeeeweweeeeeeeeeweeee'),
+    ('frisian', 'WWebbbebbbbbbeeeebbbeeebeeeeeeeeeeeeweeeeweeBeeeeee'),
+    ('frisian', 'BeebbbeeebeeeeeeeeeebeeeeeeeeeeeweeeeeeeWeBeeeeeeee'),
+    ('russian', 'BeeWeeeeeeeebeewweeeeeeeeeewwBeee'),
+    ('brazilian', 'startpos'),
+]
+
+class BitBoardTestCase(unittest.TestCase):
+    def test_same_moves_as_pieces(self):
+        for variant, fen in POSITIONS:
+            bitboard = Board(variant, fen)
+            pieces = Board(variant, fen, bitboard=False)
+            for player in (1, 2):
+                bitboard.player_turn = player
+                pieces.player_turn = player
+                self.assertEqual(bitboard.get_possible_capture_moves([]), sorted(pieces.get_possible_capture_moves([])))
+                self.assertEqual(bitboard.get_possible_positional_moves(), sorted(pieces.get_possible_positional_moves()))
+                self.assertEqual(bitboard.count_movable_player_pieces(player), pieces.count_movable_player_pieces(player))
+
+    def test_king_capture(self):
+        board = Board('standard', 'WeeeWeebBeebebeeeeeeeeebeeebeeeeeeweweeeeeeeeeweeee')
+        self.assertEqual(board.get_possible_capture_moves([]), [[4, 18], [4, 22]])
+        self.assertEqual(board.get_captured_position([4, 22]), 13)
+
+    def test_captured_pieces_block(self):
+        board = Board('standard', 'WeeeWeebBeebebeeeeeeeeebeeebeeeeeeweweeeeeeeeeweeee')
+        self.assertEqual(board.get_possible_capture_moves([18]), [])
+
+    def test_capture_sequences_match_make_unmake(self):
+        for variant, fen in POSITIONS:
+            bitboard = Board(variant, fen)
+            pieces = Board(variant, fen, bitboard=False)
+            for player in (1, 2):
+                bitboard.player_turn = player
+                pieces.player_turn = player
+                self.assertEqual(sorted(zip(*bitboard.get_move_sequences([]))), sorted(zip(*pieces.get_move_sequences([]))))
+
+    def test_long_capture_sequence(self):
+        board = Board('frisian', 'WWebbbebbbbbbeeeebbbeeebeeeeeeeeeeeeweeeeweeBeeeeee')
+        moves, captures = board.get_move_sequences([])
+        self.assertIn([[1, 21], [21, 24], [24, 13], [13, 2], [2, 22], [22, 50]], moves)
+        for move, captured in zip(moves, captures):
+            self.assertEqual(len(captured), len(set(captured)))
+            self.assertEqual(len(move), len(captured))
+
+    def test_start_moves(self):
+        game = Game()
+        self.assertEqual(game.get_possible_moves(), [[31, 26], [31, 27], [32, 27], [32, 28], [33, 28], [33, 29], [34, 29], [34, 30], [35, 30]])
+
+if __name__ == '__main__':
+    unittest.main()
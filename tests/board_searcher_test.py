@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2010-2018 ImparaAI https://impara.ai (MIT License)
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+from draughts.board_searcher import BoardSearcher
+from draughts.game import Game
+from random_games import play_random_game
+import unittest
+
+def searcher_state(searcher):
+    return (dict(searcher.position_pieces), searcher.sorted_positions, dict(searcher.player_sorted_positions), dict(searcher.piece_counts), dict(searcher.king_counts))
+
+class BoardSearcherTestCase(unittest.TestCase):
+    def assertMatchesRebuild(self, board):
+        rebuilt = BoardSearcher()
+        rebuilt.build(board)
+        self.assertEqual(searcher_state(board.searcher), searcher_state(rebuilt))
+
+    def test_counts(self):
+        game = Game()
+        self.assertEqual(game.board.searcher.get_piece_count(1), 20)
+        self.assertEqual(game.board.searcher.get_piece_count(2), 20)
+        self.assertEqual(game.board.searcher.get_king_count(2), 0)
+        self.assertEqual(len(game.board.searcher.open_positions), 10)
+
+    def test_move_and_capture_deltas(self):
+        game = Game()
+        for move in ([32, 28], [19, 23], [28, 19], [14, 23]):
+            game.move(move)
+            self.assertMatchesRebuild(game.board)
+        self.assertEqual(game.board.searcher.get_piece_count(1), 19)
+        self.assertEqual(game.board.searcher.get_piece_count(2), 19)
+        self.assertEqual(game.board.searcher.filled_positions[-1], 50)
+
+    def test_promotion_delta(self):
+        game = Game(fen='W:W6:B30')
+        game.move([6, 1])
+        self.assertMatchesRebuild(game.board)
+        self.assertEqual(game.board.searcher.get_king_count(2), 1)
+        undo_info = game.board.make([30, 35])
+        self.assertMatchesRebuild(game.board)
+        game.board.unmake(undo_info)
+        self.assertMatchesRebuild(game.board)
+
+    def test_unmake_restores_captured_piece(self):
+        game = Game(fen='W:W28:B13,23')
+        undo_info = game.board.make([28, 19], 1, [])
+        self.assertEqual(game.board.searcher.get_piece_count(1), 1)
+        game.board.unmake(undo_info)
+        self.assertEqual(game.board.searcher.get_piece_count(1), 2)
+        self.assertMatchesRebuild(game.board)
+
+    def test_sorted_pieces(self):
+        for variant in ('standard', 'frisian', 'russian'):
+            game = play_random_game(variant, plies=120)
+            while game.moves:
+                searcher = game.board.searcher
+                self.assertMatchesRebuild(game.board)
+                self.assertEqual(searcher.filled_positions, sorted(searcher.position_pieces))
+                for player in (1, 2):
+                    self.assertEqual(searcher.get_positions_by_player(player), sorted(position for position, piece in searcher.position_pieces.items() if piece.player == player))
+                game.pop()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+from draughts.board import Board
+from draughts.game import Game
+from draughts import encoding
+import os
+import subprocess
+import sys
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def encode_slowly(game):
+    array = np.zeros((encoding.PLANE_COUNT, game.board.position_count), dtype=np.float32)
+    for loc in range(1, game.board.position_count + 1):
+        piece = game.board.searcher.get_piece_by_position(loc)
+        if piece is not None:
+            plane = encoding.WHITE_MEN_PLANE if piece.player == 2 else encoding.BLACK_MEN_PLANE
+            array[plane + piece.king, loc - 1] = 1
+    array[encoding.WHITE_TO_MOVE_PLANE] = game.whose_turn() == 2
+    position = game.board.get_position_in_play()
+    if position is not None:
+        array[encoding.CAPTURING_PIECE_PLANE, position - 1] = 1
+    return array
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class EncodingTestCase(unittest.TestCase):
+    def setUp(self):
+        self.games = [Game(), Game('standard', 'B:WK4,34,36,46:B7,K8,11,13,23,27')]
+        game = Game('standard', 'W:W15:B10,8,9')
+        game.move([15, 4])
+        self.games.append(game)
+
+    def test_to_array(self):
+        for game in self.games:
+            array = game.to_array()
+            self.assertEqual(array.shape, (6, 50))
+            self.assertEqual(array.dtype, np.float32)
+            self.assertTrue(np.array_equal(array, encode_slowly(game)))
+        self.assertEqual(self.games[2].to_array()[encoding.CAPTURING_PIECE_PLANE].nonzero()[0].tolist(), [3])
+        self.assertEqual(Game('russian').to_array(np.uint8).shape, (6, 32))
+
+    def test_batch_of_games(self):
+        out = encoding.empty_batch(len(self.games), dtype=np.uint8)
+        self.assertIs(encoding.encode_batch(self.games, out=out), out)
+        self.assertTrue(np.array_equal(out, np.stack([encode_slowly(game) for game in self.games])))
+
+    def test_batch_of_hub_fens(self):
+        fens = [game.get_fen() for game in self.games]
+        array = encoding.encode_batch(fens)
+        expected = np.stack([encode_slowly(game) for game in self.games])
+        expected[:, encoding.CAPTURING_PIECE_PLANE] = 0
+        self.assertTrue(np.array_equal(array, expected))
+
+    def test_mixed_batch(self):
+        positions = [self.games[0].get_fen(), self.games[2], self.games[1].get_fen()]
+        array = encoding.encode_batch(positions)
+        self.assertTrue(np.array_equal(array[1], encode_slowly(self.games[2])))
+        self.assertTrue(np.array_equal(array[2], encoding.encode_batch([self.games[1]])[0]))
+
+    def test_piece_generator_board(self):
+        game = Game('frisian', 'W:WK1,36,41:B3,4,5,7,8,9,10,11,12,17,18,19,23,K44')
+        expected = game.to_array()
+        game.board = Board('frisian', game.initial_hub_fen, bitboard=False)
+        self.assertTrue(np.array_equal(game.to_array(), expected))
+
+    def test_invalid_input(self):
+        self.assertRaises(ValueError, encoding.encode_batch, ['Wbbb'])
+        self.assertRaises(ValueError, encoding.encode_batch, [Game('russian')])
+        self.assertRaises(ValueError, encoding.encode_batch, [Game()], out=encoding.empty_batch(2))
+
+
+class LazyImportTestCase(unittest.TestCase):
+    def test_game_does_not_import_numpy(self):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = 'import sys, draughts.game; print("draughts.encoding" in sys.modules, "numpy" in sys.modules)'
+        output = subprocess.run([sys.executable, '-c', code], cwd=root, capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.split(), ['False', 'False'])
+
+
+if __name__ == '__main__':
+    unittest.main()
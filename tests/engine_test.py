@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+from draughts.engine import Engine, MATE_SCORE, evaluate, search
+from draughts.game import Game
+import time
+import unittest
+
+class EngineTestCase(unittest.TestCase):
+    def test_evaluate(self):
+        self.assertEqual(evaluate(Game()), 0)
+        self.assertGreater(evaluate(Game('standard', 'W:WK46,47:B1')), 0)
+        self.assertLess(evaluate(Game('standard', 'B:WK46,47:B1')), 0)
+
+    def test_winning_capture(self):
+        result = search(Game('standard', 'W:W28,45:B13,23,6'), depth=4)
+        self.assertEqual(result.move, [[28, 19], [19, 8]])
+        self.assertEqual(result.hub_move, '28x08x13x23')
+        self.assertEqual(result.pdn_move, '28x08')
+        self.assertTrue(result.is_mate_score)
+
+    def test_breakthrough(self):
+        result = search(Game('breakthrough', 'W:W10:B41'), depth=3)
+        self.assertEqual(result.hub_move, '10-04')
+        self.assertEqual(result.score, MATE_SCORE - 1)
+
+    def test_no_legal_move(self):
+        result = search(Game('standard', 'W:W46:B41,37'), depth=3)
+        self.assertIsNone(result.move)
+        self.assertEqual(result.pv, [])
+        self.assertEqual(result.score, -MATE_SCORE)
+
+    def test_game_is_restored(self):
+        for variant in ('standard', 'frisian', 'russian'):
+            game = Game(variant)
+            fen = game.get_fen()
+            key = game.position_key()
+            Engine().search(game, depth=4)
+            self.assertEqual(game.get_fen(), fen)
+            self.assertEqual(game.position_key(), key)
+            self.assertEqual(game.move_stack, [])
+
+    def test_pv_is_legal(self):
+        result = Engine().search(Game('frisian', 'W:WK1,36,41:B3,4,5,7,8,9,10,11,12,17,18,19,23,K44'), depth=4)
+        game = Game('frisian', 'W:WK1,36,41:B3,4,5,7,8,9,10,11,12,17,18,19,23,K44')
+        self.assertGreaterEqual(len(result.pv), 4)
+        for (move, captures), hub_move in zip(result.pv, result.pv_hub):
+            self.assertEqual(game.board_to_hub(move), hub_move)
+            for step in move:
+                game.move(step)
+
+    def test_limits(self):
+        game = Game()
+        result = Engine().search(game, nodes=500)
+        self.assertLessEqual(result.nodes, 500)
+        self.assertIsNotNone(result.move)
+
+        start = time.perf_counter()
+        result = Engine().search(game, movetime=0.2)
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertGreaterEqual(result.depth, 1)
+        self.assertRaises(ValueError, Engine().search, game)
+
+    def test_deterministic(self):
+        first = Engine().search(Game('russian'), depth=5)
+        second = Engine().search(Game('russian'), depth=5)
+        self.assertEqual((first.pv_hub, first.score, first.nodes), (second.pv_hub, second.score, second.nodes))
+
+    def test_callback(self):
+        depths = []
+        Engine().search(Game(), depth=3, callback=lambda result: depths.append(result.depth))
+        self.assertEqual(depths, [1, 2, 3])
+
+    def test_capture_in_progress(self):
+        game = Game('standard', 'W:W15:B10,8,9')
+        game.move([15, 4])
+        result = search(game, depth=2)
+        self.assertEqual(result.move, [[4, 13], [13, 2]])
+        self.assertEqual(result.hub_move, '15x02x08x09x10')
+        self.assertEqual(game.not_added_move, [[15, 4]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Scripted Hub engine for the tests. It answers every search with the first legal move.
+
+    python fake_hub_engine.py [--crash-after N] [--crash-file PATH] [--wait-for-stop] [--hang] [--delay SECONDS]
+
+--crash-after N exits without answering the Nth search (once per PATH if --crash-file is given),
+--wait-for-stop only answers after a stop command, --hang never answers a search and --delay waits before
+answering every search.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from draughts.game import Game
+from draughts.hub import HUB_VARIANTS, parse_hub_line
+
+def send(line):
+    sys.stdout.write(line + '\n')
+    sys.stdout.flush()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--crash-after', type=int)
+    parser.add_argument('--crash-file')
+    parser.add_argument('--wait-for-stop', action='store_true')
+    parser.add_argument('--hang', action='store_true')
+    parser.add_argument('--delay', type=float, default=0)
+    args = parser.parse_args()
+
+    variants = {value: key for key, value in HUB_VARIANTS.items()}
+    variant = 'standard'
+    params = {}
+    position = None
+    moves = []
+    searches = 0
+    for line in sys.stdin:
+        command, arguments = parse_hub_line(line.strip())
+        if command == 'hub':
+            send('id name=Fake version=1.0 author=python-draughts')
+            send('param name=variant value=normal type=enum values="normal frisian bt"')
+            send('wait')
+        elif command == 'set-param':
+            if arguments['name'] == 'variant':
+                variant = variants[arguments['value']]
+            params[arguments['name']] = arguments['value']
+        elif command == 'init':
+            send('ready')
+        elif command == 'ping':
+            send('pong')
+        elif command == 'pos':
+            position = arguments['pos']
+            moves = arguments.get('moves', '').split()
+        elif command == 'go':
+            searches += 1
+            if args.crash_after == searches and (args.crash_file is None or not os.path.exists(args.crash_file)):
+                if args.crash_file is not None:
+                    open(args.crash_file, 'w').close()
+                sys.exit(1)
+            if args.hang:
+                while True:
+                    time.sleep(1)
+            time.sleep(args.delay)
+            if args.wait_for_stop:
+                while sys.stdin.readline().strip() != 'stop':
+                    pass
+            game = Game(variant, Game(variant).hub_fen_to_li_fen(position))
+            for move in moves:
+                for step in game.hub_to_li_board(move.replace('-', '').replace('x', ''))[1]:
+                    game.move(step)
+            legal_moves, captures = game.legal_moves()
+            move = game.li_to_hub(game.board_to_li(legal_moves[0]), captures[0])
+            send(f'info depth=1 score=0 nodes={len(legal_moves)} pid={os.getpid()} params="{" ".join(sorted(params))}" pv="{move}"')
+            send(f'done move={move}')
+        elif command == 'quit':
+            break
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2010-2018 ImparaAI https://impara.ai (MIT License)
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+from draughts.fen import li_fen_to_hub_fen, hub_fen_to_li_fen, main
+from draughts.game import Game
+import contextlib
+import io
+import unittest
+
+class FenTestCase(unittest.TestCase):
+    def test_startpos(self):
+        for variant, count in (('standard', 50), ('frysk!', 50), ('russian', 32), ('brazilian', 32)):
+            self.assertEqual(li_fen_to_hub_fen('startpos', variant), Game(variant).get_fen())
+            self.assertEqual(len(li_fen_to_hub_fen('startpos', variant)), count + 1)
+
+    def test_ranges(self):
+        self.assertEqual(li_fen_to_hub_fen('W:W31-50:B1-20'), li_fen_to_hub_fen('startpos'))
+        self.assertEqual(li_fen_to_hub_fen('W:W21-32:B1-12', 'russian'), li_fen_to_hub_fen('startpos', 'russian'))
+        hub_fen = li_fen_to_hub_fen('B:WK1-3,10:B40-42,K48-K50')
+        self.assertEqual(hub_fen[:11], 'BWWWeeeeeew')
+        self.assertEqual(hub_fen[40:], 'bbbeeeeeBBB')
+
+    def test_kings_and_counters(self):
+        hub_fen = li_fen_to_hub_fen('W:WK4,34,36,46:B7,K8,11,13,23,27:H0:F1')
+        self.assertEqual(hub_fen, Game('standard', 'W:WK4,34,36,46:B7,K8,11,13,23,27').get_fen())
+        self.assertEqual(hub_fen[4], 'W')
+        self.assertEqual(hub_fen[8], 'B')
+        self.assertEqual(li_fen_to_hub_fen('B:W:B1'), 'Bb' + 'e' * 49)
+
+    def test_invalid(self):
+        for li_fen in ('X:W1:B2', 'W:W51:B1', 'W:W33:B1', 'W:W1,1:B2', 'W:W1:B1', 'W:W5-3:B1', 'W:Wa:B1', 'W:W1:B2:Q'):
+            with self.assertRaises(ValueError, msg=li_fen):
+                li_fen_to_hub_fen(li_fen, 'russian' if '33' in li_fen else 'standard')
+        with self.assertRaises(ValueError):
+            hub_fen_to_li_fen('Wx' + 'e' * 49)
+
+    def test_round_trip(self):
+        game = Game('standard', 'W:WK4,34,36,46:B7,K8,11,13,23,27')
+        self.assertEqual(game.get_li_fen(), 'W:WK4,34,36,46:B7,K8,11,13,23,27')
+        for game in (game, Game('russian'), Game().move([34, 29])):
+            for ranges in (False, True):
+                li_fen = game.get_li_fen(ranges)
+                self.assertEqual(li_fen_to_hub_fen(li_fen, game.variant), game.get_fen())
+
+    def test_write_ranges(self):
+        self.assertEqual(Game().get_li_fen(ranges=True), 'W:W31-50:B1-20')
+        self.assertEqual(hub_fen_to_li_fen('B' + 'WWWwwbe' + 'e' * 43, ranges=True), 'B:WK1-3,4,5:B6')
+
+    def test_main(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertEqual(main(['--number', '10']), 0)
+        self.assertIn('us per call', output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+from draughts.game import Game
+import unittest
+
+WHITE = 2
+BLACK = 1
+
+class GameOverTestCase(unittest.TestCase):
+    def test_start(self):
+        game = Game()
+        self.assertTrue(game.has_legal_move())
+        self.assertFalse(game.is_over())
+        self.assertIsNone(game.get_winner())
+
+    def test_no_legal_move(self):
+        game = Game('standard', 'W:W46:B41,37')
+        self.assertFalse(game.has_legal_move())
+        self.assertTrue(game.is_over())
+        self.assertEqual(game.get_winner(), BLACK)
+
+        game = Game('standard', 'B:W31:B')
+        self.assertTrue(game.is_over())
+        self.assertEqual(game.get_winner(), WHITE)
+
+    def test_capture_in_progress(self):
+        game = Game('standard', 'W:W15:B10,8,9')
+        game.move([15, 4])
+        self.assertEqual(game.whose_turn(), WHITE)
+        self.assertTrue(game.has_legal_move())
+        self.assertFalse(game.is_over())
+
+    def test_breakthrough(self):
+        game = Game('breakthrough', 'B:W6,K3:B40')
+        self.assertTrue(game.has_legal_move())
+        self.assertTrue(game.is_over())
+        self.assertEqual(game.get_winner(), WHITE)
+
+        game = Game('breakthrough', 'W:W10:B41')
+        self.assertFalse(game.is_over())
+        game.move([10, 4])
+        game.move([41, 46])
+        self.assertTrue(game.is_over())
+        self.assertEqual(game.get_winner(), WHITE)
+
+    def test_frisian_king_rule(self):
+        game = Game('frisian', 'W:WK3,46:B41,37,K50')
+        for move in ([3, 9], [50, 44], [9, 3], [44, 50], [3, 9], [50, 44]):
+            self.assertFalse(game.is_over())
+            game.move(move)
+        self.assertEqual(game.legal_moves(), ([], []))
+        self.assertFalse(game.has_legal_move())
+        self.assertTrue(game.is_over())
+        self.assertEqual(game.get_winner(), BLACK)
+
+    def test_move_limit(self):
+        game = Game()
+        game.consecutive_noncapture_move_limit = 2
+        game.move([31, 27])
+        self.assertFalse(game.is_over())
+        game.move([20, 24])
+        self.assertTrue(game.is_over())
+        self.assertIsNone(game.get_winner())
+
+    def test_cached_until_the_board_changes(self):
+        game = Game()
+        self.assertFalse(game.is_over())
+        terminal_state = game.terminal_state
+        game.get_winner()
+        self.assertIs(game.terminal_state, terminal_state)
+        game.move([31, 27])
+        game.is_over()
+        self.assertIsNot(game.terminal_state, terminal_state)
+        self.assertFalse(game.copy().is_over())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2010-2018 ImparaAI https://impara.ai (MIT License)
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+from draughts.game import Game
+from draughts.game_state import GameState, GameCursor
+from draughts.move import Move
+from draughts.perft import perft
+import sys
+import unittest
+
+def count_leaves(state, depth, cursor):
+    if depth == 0:
+        return 1
+    return sum(count_leaves(child, depth - 1, cursor) for child in state.children(cursor))
+
+class GameStateTestCase(unittest.TestCase):
+    def test_children_share_parent(self):
+        root = GameState()
+        children = root.children()
+        self.assertEqual(len(children), 9)
+        for child in children:
+            self.assertIs(child.parent, root)
+            self.assertEqual(child.depth, 1)
+            self.assertIs(child.root, root)
+        self.assertEqual([child.move for child in children], list(Game().legal_move_set()))
+
+    def test_to_game(self):
+        state = GameState('russian')
+        game = Game('russian')
+        for hub_move in ('22-18', '11-15', '18x11x15'):
+            move = game.move_records().from_hub(hub_move).key
+            game.move(move)
+            state = state.play(move)
+        self.assertEqual(state.moves(), [Move((22, 18)), Move((11, 15)), Move((18, 11), (15,))])
+        replay = state.to_game()
+        self.assertEqual(replay.get_fen(), game.get_fen())
+        self.assertEqual(replay.hub_move_stack, game.hub_move_stack)
+
+    def test_cursor_walks_tree(self):
+        for variant, fen in (('standard', 'startpos'), ('frisian', 'W:WK1,36,41:B3,4,5,7,8,9,10,11,12,17,18,19,23,K44')):
+            root = GameState(variant, fen)
+            cursor = GameCursor(root)
+            self.assertEqual(count_leaves(root, 3, cursor), perft(Game(variant, fen), 3))
+            leaf = root.children(cursor)[-1].children(cursor)[0]
+            other = root.children(cursor)[0]
+            self.assertEqual(cursor.goto(leaf).get_fen(), leaf.to_game().get_fen())
+            self.assertEqual(cursor.goto(other).get_fen(), other.to_game().get_fen())
+            self.assertEqual(cursor.goto(root).get_fen(), Game(variant, fen).get_fen())
+
+    def test_other_tree(self):
+        cursor = GameCursor(GameState())
+        with self.assertRaises(ValueError):
+            cursor.goto(GameState().children()[0])
+
+    def test_immutable(self):
+        state = GameState().children()[0]
+        with self.assertRaises(AttributeError):
+            state.move = Move((32, 28))
+        with self.assertRaises(TypeError):
+            state.play([[19, 23]])
+
+    def test_small(self):
+        root = GameState()
+        children = root.children()
+        self.assertLess(sys.getsizeof(children[0]), 100)
+        self.assertLess(sum(sys.getsizeof(child) for child in children) * 10, Game().memory_footprint())
+
+
+if __name__ == '__main__':
+    unittest.main()
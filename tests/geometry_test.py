@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2010-2018 ImparaAI https://impara.ai (MIT License)
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+from draughts import geometry
+from draughts.board import Board
+import pickle
+import unittest
+
+class GeometryTestCase(unittest.TestCase):
+    def test_shared(self):
+        self.assertIs(geometry.get_geometry(5, 10), geometry.get_geometry(5, 10))
+        self.assertIsNot(geometry.get_geometry(5, 10), geometry.get_geometry(5, 10, 'frisian'))
+        board = Board()
+        self.assertIs(pickle.loads(pickle.dumps(board, -1)).geometry, board.geometry)
+
+    def test_rows_and_columns(self):
+        table = geometry.get_geometry(5, 10)
+        self.assertEqual((table.rows[1], table.columns[1]), (0, 0))
+        self.assertEqual((table.rows[28], table.columns[28]), (5, 2))
+        self.assertEqual((table.rows[50], table.columns[50]), (9, 4))
+
+    def test_neighbours(self):
+        table = geometry.get_geometry(5, 10)
+        self.assertEqual(table.neighbours[geometry.DOWN_LEFT][1], 6)
+        self.assertEqual(table.neighbours[geometry.DOWN_RIGHT][1], 7)
+        self.assertEqual(table.neighbours[geometry.UP_LEFT][1], None)
+        self.assertEqual(table.neighbours[geometry.DOWN_LEFT][6], None)
+        self.assertEqual(table.neighbours[geometry.UP_RIGHT][6], 1)
+        self.assertEqual(table.get_directions(geometry.WHITE, True)[2:], (geometry.UP_LEFT, geometry.UP_RIGHT))
+
+    def test_rays(self):
+        table = geometry.get_geometry(5, 10)
+        self.assertEqual(table.rays[geometry.DOWN_LEFT][5], (10, 14, 19, 23, 28, 32, 37, 41, 46))
+        self.assertEqual(table.rays[geometry.UP_LEFT][50], (44, 39, 33, 28, 22, 17, 11, 6))
+        self.assertEqual(table.get_direction_between(46, 5), geometry.UP_RIGHT)
+        self.assertEqual(table.get_direction_between(1, 2), None)
+
+    def test_man_jumps(self):
+        table = geometry.get_geometry(5, 10)
+        self.assertEqual(table.man_jumps[1], ((1, 7, 12),))
+        self.assertEqual(sorted(table.man_jumps[28]), [(28, 22, 17), (28, 23, 19), (28, 32, 37), (28, 33, 39)])
+        small = geometry.get_geometry(4, 8, 'russian')
+        self.assertEqual(sorted(small.man_jumps[1]), [(1, 6, 10)])
+
+    def test_frisian_lines(self):
+        table = geometry.get_geometry(5, 10, 'frisian')
+        self.assertEqual(table.rays[geometry.RIGHT][26], (27, 28, 29, 30))
+        self.assertEqual(table.rays[geometry.UP][28], (18, 8))
+        self.assertIn((28, 29, 30), table.man_jumps[28])
+        self.assertIn((28, 18, 8), table.man_jumps[28])
+        self.assertNotIn(geometry.RIGHT, geometry.get_geometry(5, 10).capture_directions)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+from draughts.game import Game
+from draughts.hub import HubEngine, HubEnginePool, HubEngineError, HubEngineTimeout, parse_hub_line
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+
+FAKE_ENGINE = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fake_hub_engine.py')]
+
+class ParseHubLineTestCase(unittest.TestCase):
+    def test_parse(self):
+        self.assertEqual(parse_hub_line('info depth=3 score=-12 pv="32-28 19-23"'), ('info', {'depth': '3', 'score': '-12', 'pv': '32-28 19-23'}))
+        self.assertEqual(parse_hub_line('done move=28x19x23'), ('done', {'move': '28x19x23'}))
+        self.assertEqual(parse_hub_line('ready'), ('ready', {}))
+        self.assertEqual(parse_hub_line(''), ('', {}))
+
+
+class HubEnginePoolTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_analyse(self):
+        async with HubEnginePool(FAKE_ENGINE, size=2) as pool:
+            game = Game()
+            result = await pool.analyse(game, time=1)
+            self.assertEqual(result.move, '31-26')
+            self.assertEqual(result.board_move, [[31, 26]])
+            self.assertEqual(result.pv, ['31-26'])
+            self.assertEqual(pool.engines[0].id['name'], 'Fake')
+
+            game.move([32, 28])
+            game.move([19, 23])
+            result = await pool.analyse(game, depth=3)
+            self.assertEqual(result.move, '28x19x23')
+            self.assertEqual(result.board_move, [[28, 19]])
+
+            result = await pool.analyse(Game('standard', 'B:W28:B23').get_fen(), nodes=100)
+            self.assertEqual(result.move, '23x32x28')
+            self.assertIsNone(result.board_move)
+
+    async def test_engines_are_reused(self):
+        async with HubEnginePool(FAKE_ENGINE, size=2) as pool:
+            results = await asyncio.gather(*(pool.analyse(Game(), depth=1) for _ in range(8)))
+            pids = set(result.info['pid'] for result in results)
+            self.assertEqual(pids, set(str(engine.process.pid) for engine in pool.engines))
+
+    async def test_variant_and_options(self):
+        async with HubEnginePool(FAKE_ENGINE, variant='frisian', options={'threads': 1, 'book': 'true'}) as pool:
+            result = await pool.analyse(Game('frisian'), depth=1)
+            self.assertEqual(result.info['params'], 'book threads variant')
+            with self.assertRaises(ValueError):
+                await pool.analyse(Game(), depth=1)
+
+    async def test_unsupported_variant(self):
+        for variant in ('brazilian', 'russian', 'frysk!'):
+            with self.assertRaises(ValueError):
+                HubEnginePool(FAKE_ENGINE, variant=variant)
+            with self.assertRaises(ValueError):
+                HubEngine(FAKE_ENGINE, variant=variant)
+
+    async def test_crash_recovery(self):
+        with tempfile.TemporaryDirectory() as directory:
+            command = FAKE_ENGINE + ['--crash-after', '2', '--crash-file', os.path.join(directory, 'crashed')]
+            async with HubEnginePool(command) as pool:
+                first = await pool.analyse(Game(), depth=1)
+                second = await pool.analyse(Game(), depth=1)
+                self.assertEqual(second.move, '31-26')
+                self.assertNotEqual(first.info['pid'], second.info['pid'])
+
+        async with HubEnginePool(FAKE_ENGINE + ['--crash-after', '1'], retries=2) as pool:
+            with self.assertRaises(HubEngineError):
+                await pool.analyse(Game(), depth=1)
+
+    async def test_timeout(self):
+        async with HubEnginePool(FAKE_ENGINE + ['--wait-for-stop']) as pool:
+            result = await pool.analyse(Game(), timeout=0.2)
+            self.assertEqual(result.move, '31-26')
+
+        async with HubEnginePool(FAKE_ENGINE + ['--hang']) as pool:
+            with self.assertRaises(HubEngineTimeout):
+                await pool.analyse(Game(), timeout=0.2)
+            self.assertFalse(pool.engines[0].alive)
+
+    async def test_cancelled_request(self):
+        async with HubEnginePool(FAKE_ENGINE + ['--delay', '0.5']) as pool:
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(pool.analyse(Game(), depth=1), 0.1)
+            result = await pool.analyse(Game('standard', 'B:W28:B23').get_fen(), depth=1)
+            self.assertEqual(result.move, '23x32x28')
+
+            task = asyncio.ensure_future(pool.analyse(Game(), depth=1))
+            await asyncio.sleep(0.1)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            result = await pool.analyse(Game('standard', 'B:W28:B23').get_fen(), depth=1)
+            self.assertEqual(result.move, '23x32x28')
+
+    async def test_capture_in_progress(self):
+        game = Game('standard', 'W:W15:B10,8,9')
+        game.move([15, 4])
+        pool = HubEnginePool(FAKE_ENGINE)
+        with self.assertRaises(ValueError):
+            await pool.analyse(game, depth=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+from draughts.board import Board
+from draughts.game import Game
+from draughts.move_cache import MoveCache
+from draughts.perft import push_move, pop_move
+import random
+import unittest
+
+POSITIONS = [
+    ('standard', 'startpos'),
+    ('standard', 'W:WK4,34,36,46:B7,K8,11,13,23,27'),
+    ('standard', 'W:W28,45:B13,23,6'),
+    ('frisian', 'W:WK1,36,41:B3,4,5,7,8,9,10,11,12,17,18,19,23,K44'),
+    ('frysk!', 'B:WK11,12,42:B6,20,K50'),
+    ('brazilian', 'B:WK1,25,26,27,28,31,32:B4,5,7,9,20,K29'),
+    ('russian', 'B:WK3,15,16,27,28:B12,K29'),
+    ('breakthrough', 'W:W25,26,30,33,36,41,47,50:B2,4,5,8,9,10,11,13,18,19,20,21'),
+]
+
+def iter_perft(game, depth):
+    if depth == 0:
+        return 1
+    nodes = 0
+    for move, captures in list(game.iter_legal_moves()):
+        undo_infos = push_move(game, move, captures)
+        nodes += iter_perft(game, depth - 1)
+        pop_move(game, undo_infos)
+    return nodes
+
+class IterMovesTestCase(unittest.TestCase):
+    def test_same_order_as_lists(self):
+        for variant, fen in POSITIONS:
+            game = Game(variant, fen)
+            moves, captures = game.legal_moves()
+            self.assertEqual(list(game.iter_legal_moves()), list(zip(moves, captures)), variant)
+            board = game.board
+            self.assertEqual(list(board.iter_possible_moves([])), board.get_possible_moves([]), variant)
+
+    def test_piece_generator(self):
+        for variant, fen in POSITIONS:
+            game = Game(variant, fen)
+            board = Board(variant, game.initial_hub_fen, bitboard=False)
+            self.assertEqual(sorted(board.iter_possible_moves([])), game.board.get_possible_moves([]), variant)
+            self.assertEqual(sorted(board.iter_move_sequences([])), list(game.board.iter_move_sequences([])), variant)
+
+    def test_perft(self):
+        for variant, fen in POSITIONS:
+            game = Game(variant, fen)
+            expected = len(game.legal_moves()[0])
+            self.assertEqual(iter_perft(game, 1), expected)
+        game = Game('frisian', 'W:WK1,36,41:B3,4,5,7,8,9,10,11,12,17,18,19,23,K44')
+        self.assertEqual(iter_perft(game, 5), 4936)
+
+    def test_early_stop(self):
+        game = Game()
+        moves = game.iter_legal_moves()
+        self.assertEqual(next(moves), ([[31, 26]], [None]))
+        self.assertEqual(next(moves), ([[31, 27]], [None]))
+        self.assertEqual(any(True for _ in Game('standard', 'W:W46:B41,37').iter_legal_moves()), False)
+
+    def test_random_move(self):
+        game = Game('russian')
+        rng = random.Random(1)
+        for _ in range(40):
+            legal = list(game.iter_legal_moves())
+            if not legal:
+                break
+            move, _ = rng.choice(legal)
+            for step in move:
+                game.move(step)
+
+    def test_move_cache(self):
+        game = Game(move_cache=MoveCache())
+        self.assertEqual(list(game.iter_legal_moves()), list(zip(*Game().legal_moves())))
+        self.assertEqual(game.move_cache.stats()['misses'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2010-2018 ImparaAI https://impara.ai (MIT License)
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+from draughts.game import Game
+import unittest
+
+def board_state(board):
+    pieces = sorted((piece.position, piece.player, piece.king, piece.captured, piece.became_king) for piece in board.pieces if not piece.captured)
+    bitboard = board.bitboard
+    return (pieces, board.player_turn, board.piece_requiring_further_capture_moves, board.previous_move_was_capture,
+            bitboard.white_men, bitboard.white_kings, bitboard.black_men, bitboard.black_kings)
+
+class MakeTestCase(unittest.TestCase):
+    def test_make_unmake_positional(self):
+        game = Game()
+        before = board_state(game.board)
+        undo_info = game.board.make([32, 28])
+        self.assertEqual(game.whose_turn(), 1)
+        self.assertIsNone(undo_info.captured_position)
+        self.assertIsNotNone(game.board.searcher.get_piece_by_position(28))
+        game.board.unmake(undo_info)
+        self.assertEqual(board_state(game.board), before)
+
+    def test_make_unmake_capture_sequence(self):
+        game = Game(fen='W:W28,45:B13,23,6')
+        before = board_state(game.board)
+        self.assertEqual(game.legal_moves(), ([[[28, 19], [19, 8]]], [[23, 13]]))
+        first = game.board.make([28, 19], 1, [])
+        self.assertEqual(first.captured_position, 23)
+        self.assertEqual(game.whose_turn(), 2)
+        self.assertIs(game.board.piece_requiring_further_capture_moves, first.piece)
+        second = game.board.make([19, 8], 1, [23])
+        self.assertEqual(second.captured_position, 13)
+        self.assertEqual(game.whose_turn(), 1)
+        game.board.unmake(second)
+        game.board.unmake(first)
+        self.assertEqual(board_state(game.board), before)
+
+    def test_promotion_only_at_end_of_capture(self):
+        game = Game(fen='W:W15:B10,8,9')
+        self.assertEqual(game.legal_moves()[0], [[[15, 4], [4, 13], [13, 2]]])
+        undo_info = game.board.make([15, 4], 1, [])
+        self.assertFalse(undo_info.piece.king)
+        game.board.make([4, 13], 1, [10])
+        self.assertFalse(undo_info.piece.king)
+        game.board.make([13, 2], 1, [10, 9])
+        self.assertTrue(undo_info.piece.king)
+        self.assertEqual(undo_info.piece.became_king, 1)
+
+    def test_game_move_does_not_copy_board(self):
+        game = Game()
+        board = game.board
+        game.move([32, 28])
+        self.assertIs(game.board, board)
+        self.assertEqual(game.move_stack, ['3228'])
+
+if __name__ == '__main__':
+    unittest.main()
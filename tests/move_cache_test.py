@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+from draughts.game import Game
+from draughts.move_cache import MoveCache
+from draughts.perft import perft
+import pickle
+import unittest
+
+class MoveCacheTestCase(unittest.TestCase):
+    def test_hits_and_misses(self):
+        cache = MoveCache(16)
+        game = Game(move_cache=cache)
+        self.assertEqual(game.legal_moves(), Game().legal_moves())
+        game.legal_moves()
+        move = game.legal_moves()[0][0]
+        game.board_to_hub(move)
+        game.board_to_pdn(move)
+        stats = cache.stats()
+        # board_to_pdn reuses the move records built by board_to_hub
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hits'], 3)
+        self.assertEqual(stats['size'], 1)
+        self.assertEqual(stats['hit_rate'], 0.75)
+
+    def test_capacity(self):
+        cache = MoveCache(2)
+        game = Game(move_cache=cache)
+        for move in ([31, 27], [19, 23], [32, 28]):
+            game.legal_moves()
+            game.move(move)
+        game.legal_moves()
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats()['evictions'], 2)
+        self.assertRaises(ValueError, MoveCache, 0)
+
+    def test_returned_lists_are_copies(self):
+        game = Game(move_cache=MoveCache())
+        moves, captures = game.legal_moves()
+        moves.clear()
+        captures.clear()
+        self.assertEqual(len(game.legal_moves()[0]), 9)
+
+    def test_nested_lists_are_copies(self):
+        cache = MoveCache()
+        expected = Game().legal_moves()
+        for _ in range(2):
+            moves, captures = Game(move_cache=cache).legal_moves()
+            moves[0].append([28, 23])
+            moves[0][0][1] = 99
+            captures[0][0] = 99
+        self.assertEqual(Game(move_cache=cache).legal_moves(), expected)
+
+    def test_variants_share_a_cache(self):
+        cache = MoveCache()
+        standard = Game('standard', move_cache=cache)
+        breakthrough = Game('breakthrough', move_cache=cache)
+        standard.legal_moves()
+        breakthrough.legal_moves()
+        self.assertEqual(cache.stats()['misses'], 2)
+
+    def test_frisian_king_rule(self):
+        fen = 'W:WK1,36,41:B3,4,5,7,8,9,10,11,12,17,18,19,23,K44'
+        game = Game('frisian', fen, move_cache=MoveCache(100000))
+        self.assertEqual(perft(game, 6), perft(Game('frisian', fen), 6))
+
+    def test_copy_shares_the_cache(self):
+        cache = MoveCache()
+        game = Game(move_cache=cache)
+        game.legal_moves()
+        self.assertIs(game.copy().move_cache, cache)
+        copied = pickle.loads(pickle.dumps(game))
+        self.assertEqual(len(copied.move_cache), 0)
+        self.assertEqual(copied.move_cache.capacity, cache.capacity)
+        self.assertEqual(len(cache), 1)
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(Game().move_cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2010-2018 ImparaAI https://impara.ai (MIT License)
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+from draughts.game import Game
+from draughts.move_cache import MoveCache
+import unittest
+
+class MoveRecordTestCase(unittest.TestCase):
+    def test_positional_move(self):
+        record = Game().move_records().from_li('3228')
+        self.assertEqual(record.move, [[32, 28]])
+        self.assertEqual(record.path, (32, 28))
+        self.assertEqual(record.captured, ())
+        self.assertEqual((record.hub, record.hub_key, record.pdn_short, record.pdn_long), ('32-28', '3228', '32-28', '32-28'))
+        self.assertEqual(record.li_api, ('3228',))
+
+    def test_multi_capture(self):
+        game = Game('standard', 'W:W28:B23,13')
+        record = game.move_records()[0]
+        self.assertEqual(record.move, [[28, 19], [19, 8]])
+        self.assertEqual(record.captured, (23, 13))
+        self.assertEqual(record.li, '281908')
+        self.assertEqual(record.hub, '28x08x13x23')
+        self.assertEqual(record.hub_key, '28081323')
+        self.assertEqual(record.pdn_short, '28x08')
+        self.assertEqual(record.pdn_long, '28x19x08')
+        self.assertEqual(record.li_api, ('2819', '1908'))
+        for notation in ('281908', '28x08x13x23', '28081323', '28x08', '28x19x08', '28x8', '28x19x8'):
+            self.assertIs(game.move_records().find(notation), record, notation)
+        self.assertIsNone(game.move_records().find('28x17'))
+
+    def test_ambiguous_ends(self):
+        game = Game('standard', 'W:WK28:B6,7,17,18,23,24,29,31,32,33,34,37,38')
+        records = game.move_records()
+        for record in records:
+            self.assertEqual(game.board_to_pdn(record.move), record.pdn_short)
+            same_ends = [other for other in records if other.path[0] == record.path[0] and other.path[-1] == record.path[-1]]
+            self.assertEqual(record.pdn_short == record.pdn_long, len(same_ends) > 1 or len(record.path) == 2)
+            self.assertIs(records.from_pdn(record.pdn_long), record)
+
+    def test_notations_match_game(self):
+        game = Game('frisian', 'W:WK1,36,41:B3,4,5,7,8,9,10,11,12,17,18,19,23,K44')
+        moves, captures = game.legal_moves()
+        records = game.move_records()
+        self.assertEqual([record.move for record in records], moves)
+        for move, captured, record in zip(moves, captures, records):
+            self.assertEqual(record.li, game.board_to_li(move))
+            self.assertEqual(record.hub, game.li_to_hub(game.board_to_li(move), captured))
+            self.assertEqual(game.board_to_hub(move), record.hub)
+            self.assertEqual(game.hub_to_li_board(record.hub_key), (game.board_to_li_api(move), move))
+
+    def test_generated_once_per_position(self):
+        cache = MoveCache(16)
+        game = Game(move_cache=cache)
+        move = game.move_records()[0].move
+        game.board_to_hub(move)
+        game.board_to_pdn(move)
+        game.hub_to_li_board('3127')
+        self.assertEqual(cache.stats()['misses'] + cache.stats()['hits'], 1)
+        game.move(move[0])
+        self.assertIsNotNone(game.move_records().from_li('1923'))
+        self.assertEqual(cache.stats()['misses'], 2)
+
+    def test_illegal_move(self):
+        with self.assertRaises(ValueError):
+            Game().board_to_hub([[32, 26]])
+
+
+if __name__ == '__main__':
+    unittest.main()
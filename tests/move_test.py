@@ -20,6 +20,10 @@
 from __future__ import unicode_literals
 
 import draughts
+from draughts.game import Game
+from draughts.move import Move
+import draughts.move
+import pickle
 import unittest
 
 class MoveTestCase(unittest.TestCase):
@@ -27,5 +31,64 @@ class MoveTestCase(unittest.TestCase):
         move = draughts.Move.from_hub('9a9b')
         self.assertEqual(move.__hash__(), 9)
 
+class MoveObjectTestCase(unittest.TestCase):
+    def test_interned(self):
+        move = Move((28, 19, 8), (23, 13))
+        self.assertIs(Move([28, 19, 8], [23, 13]), move)
+        self.assertIs(Move.from_steps([[28, 19], [19, 8]], [23, 13]), move)
+        self.assertIs(pickle.loads(pickle.dumps(move, -1)), move)
+        self.assertEqual(hash(move), hash(((28, 19, 8), (23, 13))))
+        self.assertEqual({move: 1}[Move((28, 19, 8), (23, 13))], 1)
+
+    def test_intern_capacity(self):
+        capacity = draughts.move.INTERN_CAPACITY
+        draughts.move.INTERN_CAPACITY = 10
+        try:
+            first = Move((1, 7))
+            for position in range(2, 30):
+                Move((position, position + 5))
+            self.assertLessEqual(len(draughts.move.interned_moves), 10)
+            self.assertNotIn(((1, 7), ()), draughts.move.interned_moves)
+            again = Move((1, 7))
+            self.assertEqual(again, first)
+            self.assertEqual(hash(again), hash(first))
+            self.assertIn(first, {again})
+        finally:
+            draughts.move.INTERN_CAPACITY = capacity
+
+    def test_properties(self):
+        move = Move.from_steps([[28, 19], [19, 8]], [23, 13])
+        self.assertEqual((move.start, move.end, move.path, move.captured), (28, 8, (28, 19, 8), (23, 13)))
+        self.assertEqual(move.steps, [[28, 19], [19, 8]])
+        self.assertEqual(move.captures, [23, 13])
+        self.assertTrue(move.is_capture)
+        positional = Move.from_steps([[32, 28]], [None])
+        self.assertEqual(positional.captures, [None])
+        self.assertFalse(positional.is_capture)
+        with self.assertRaises(AttributeError):
+            positional.path = (32, 27)
+
+    def test_legal_move_set(self):
+        game = Game()
+        legal = game.legal_move_set()
+        self.assertEqual(len(legal), 9)
+        self.assertIn(Move((32, 28)), legal)
+        self.assertNotIn(Move((32, 26)), legal)
+        self.assertEqual(set(legal), {Move.from_steps(move, captures) for move, captures in zip(*game.legal_moves())})
+        self.assertTrue(game.is_legal(Move((32, 28))))
+        self.assertTrue(game.is_legal([[32, 28]]))
+        self.assertFalse(game.is_legal([[32, 26]]))
+
+    def test_play_move(self):
+        game = Game('standard', 'W:W28:B23,13')
+        move = Move((28, 19, 8), (23, 13))
+        _, captured = game.move(move, return_captured=True)
+        self.assertEqual(captured, (23, 13))
+        self.assertEqual(game.move_stack, ['281908'])
+        self.assertEqual(game.hub_move_stack, ['28x08x13x23'])
+        self.assertEqual(game.get_fen(), Game('standard', 'W:W28:B23,13').move([28, 19]).move([19, 8]).get_fen())
+        with self.assertRaises(ValueError):
+            Game('standard', 'W:W28:B23,13').move(Move((28, 19), (23,)))
+
 if __name__ == '__main__':
     unittest.main()
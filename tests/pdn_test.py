@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+from draughts.game import Game
+from draughts.pdn import read_games, write_games, pdn_moves, WHITE, BLACK
+import bz2
+import gzip
+import io
+import lzma
+import os
+import tempfile
+import unittest
+
+PDN_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'games', 'Sefa_vs_Dammgood.pdn')
+
+RUSSIAN_GAME = '''[Event "Casual"]
+[GameType "25"]
+[FEN "W:W21,22,23:B9,10,12"]
+[Result "*"]
+
+1. 22-18 {Opening} (1. 21-17 {[%clock w0:00:10 B0:00:10]} 9-13) 12-16 $1 2. 21-17 *
+'''
+
+def read_data():
+    with open(PDN_PATH, 'rb') as fileobj:
+        return fileobj.read()
+
+
+class ReadGamesTestCase(unittest.TestCase):
+    def test_lidraughts_game(self):
+        games = list(read_games(PDN_PATH))
+        self.assertEqual(len(games), 1)
+        game = games[0]
+        self.assertEqual(game.headers['White'], 'Sefa')
+        self.assertEqual(game.variant, 'standard')
+        self.assertEqual(game.result, '2-0')
+        self.assertEqual(len(game.moves), 99)
+        self.assertEqual(game.moves[:4], ['34-29', '19-23', '33-28', '23x34'])
+        self.assertEqual(game.clocks[0], {WHITE: 120, BLACK: 120})
+        self.assertEqual(game.clocks[3], {WHITE: 118, BLACK: 119})
+        self.assertEqual(game.comments[-1], 'White wins.')
+        self.assertIsNone(game.comments[0])
+
+        replay = game.replay()
+        self.assertTrue(replay.is_over())
+        self.assertEqual(replay.get_winner(), WHITE)
+        self.assertEqual(game.replay(2).get_fen(), Game().move([34, 29]).move([19, 23]).get_fen())
+
+    def test_compressed(self):
+        data = read_data()
+        for module in (gzip, bz2, lzma):
+            games = list(read_games(io.BytesIO(module.compress(data * 3))))
+            self.assertEqual([len(game.moves) for game in games], [99, 99, 99])
+
+    def test_headers_only(self):
+        games = list(read_games(io.BytesIO(read_data() * 2), headers_only=True))
+        self.assertEqual([game.headers['Black'] for game in games], ['Dammgood', 'Dammgood'])
+        self.assertIsNone(games[0].movetext)
+        self.assertRaises(ValueError, lambda: games[0].moves)
+
+    def test_streaming(self):
+        lines = iter(RUSSIAN_GAME.splitlines(True) * 1000)
+        read = []
+
+        class Lines(io.TextIOBase):
+            def __iter__(self):
+                return self
+
+            def __next__(self):
+                line = next(lines)
+                read.append(line)
+                return line
+
+        games = read_games(Lines())
+        next(games)
+        self.assertLess(len(read), 20)
+
+    def test_variations_and_setup(self):
+        text = io.BytesIO((RUSSIAN_GAME + '\n' + RUSSIAN_GAME).encode())
+        game = next(read_games(text))
+        self.assertEqual(game.variant, 'russian')
+        self.assertEqual(game.moves, ['22-18', '12-16', '21-17'])
+        self.assertEqual(game.comments, ['Opening', None, None])
+        self.assertEqual(game.clocks, [None, None, None])
+        replay = game.replay()
+        self.assertEqual(replay.hub_fen_to_li_fen(replay.get_fen()), 'B:W17,18,23:B9,10,16')
+
+    def test_pdn_to_board(self):
+        game = Game('standard', 'W:W28:B22,23,12,13')
+        self.assertRaises(ValueError, game.pdn_to_board, '28x28')
+        self.assertEqual(game.pdn_to_board('28x19x8x17x28'), [[28, 19], [19, 8], [8, 17], [17, 28]])
+        self.assertEqual(game.board_to_pdn(game.pdn_to_board('28x17x8x19x28')), '28x17x08x19x28')
+        self.assertRaises(ValueError, game.pdn_to_board, '28-32')
+        self.assertEqual(Game().pdn_to_board('32-28'), [[32, 28]])
+
+
+class WriteGamesTestCase(unittest.TestCase):
+    def test_round_trip(self):
+        pdn_game = next(read_games(PDN_PATH))
+        game = pdn_game.replay()
+        self.assertEqual(pdn_moves(game), pdn_game.moves)
+
+        output = io.StringIO()
+        self.assertEqual(write_games(output, [pdn_game, (game, {'White': 'Sefa'}, pdn_game.clocks), game]), 3)
+        games = list(read_games(io.StringIO(output.getvalue())))
+        self.assertEqual(games[0].headers, pdn_game.headers)
+        for written in games:
+            self.assertEqual(written.moves, pdn_game.moves)
+            self.assertEqual(written.replay().get_fen(), game.get_fen())
+        self.assertEqual(games[0].comments, pdn_game.comments)
+        self.assertEqual(games[1].clocks, pdn_game.clocks)
+        self.assertEqual(games[1].headers['White'], 'Sefa')
+        self.assertEqual(games[1].headers['Black'], '?')
+        self.assertEqual(games[2].result, '2-0')
+        self.assertEqual(games[2].clocks, [None] * 99)
+
+    def test_shortest_notation(self):
+        game = Game('standard', 'W:W28,K46:B22,23,12,13,K1')
+        for semi_move in game.pdn_to_board('28x19x8x17x28'):
+            game.move(semi_move)
+        game.move([1, 7])
+        game.move([46, 37])
+        self.assertEqual(pdn_moves(game), ['28x19x8x17x28', '1-7', '46-37'])
+
+        output = io.StringIO()
+        write_games(output, [(game, {'Event': 'Test "quoted"'})])
+        text = output.getvalue()
+        self.assertIn('[FEN "W:W28,K46:B22,23,12,13,K1"]', text)
+        self.assertIn('1. 28x19x8x17x28 1-7 2. 46-37 *', text)
+        written = next(read_games(io.StringIO(text)))
+        self.assertEqual(written.headers['Event'], 'Test "quoted"')
+        self.assertEqual(written.replay().get_fen(), game.get_fen())
+
+    def test_draw_by_move_limit(self):
+        game = Game('standard', 'W:WK50:BK1')
+        game.consecutive_noncapture_move_limit = 2
+        game.move([50, 44])
+        game.move([1, 7])
+        self.assertTrue(game.is_over())
+        self.assertIsNone(game.get_winner())
+        output = io.StringIO()
+        write_games(output, [game])
+        self.assertIn('1. 50-44 1-7 1-1', output.getvalue())
+        self.assertEqual(next(read_games(io.StringIO(output.getvalue()))).result, '1-1')
+
+    def test_variants_and_black_to_move(self):
+        game = Game('russian', 'B:W21,22,23:B9,10,12')
+        game.move([12, 16])
+        output = io.StringIO()
+        write_games(output, [game, Game('breakthrough')])
+        games = list(read_games(io.StringIO(output.getvalue())))
+        self.assertIn('1... 12-16 *', output.getvalue())
+        self.assertEqual((games[0].variant, games[0].moves), ('russian', ['12-16']))
+        self.assertEqual(games[1].variant, 'breakthrough')
+
+    def test_compressed(self):
+        game = next(read_games(PDN_PATH))
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ('games.pdn', 'games.pdn.gz', 'games.pdn.bz2', 'games.pdn.xz'):
+                path = os.path.join(directory, name)
+                self.assertEqual(write_games(path, [game] * 5, buffer_size=100), 5)
+                self.assertEqual([len(written.moves) for written in read_games(path)], [99] * 5)
+            with open(os.path.join(directory, 'games.pdn.gz'), 'rb') as fileobj:
+                self.assertEqual(fileobj.read(2), b'\x1f\x8b')
+
+            output = io.BytesIO()
+            write_games(output, [game], compression='xz')
+            self.assertFalse(output.closed)
+            self.assertEqual(len(next(read_games(io.BytesIO(output.getvalue()))).moves), 99)
+            self.assertRaises(ValueError, write_games, output, [game], compression='zip')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,60 +19,69 @@
 
 from __future__ import unicode_literals
 
-import draughts
+from draughts.game import Game
+from draughts.perft import REFERENCE_COUNTS, perft, divide, check_reference, main, parallel_perft, parallel_divide, perft_without_bulk
+import contextlib
+import io
 import unittest
 
-def perft(board, depth):
-    if depth > 1:
-        count = 0
-
-        for move in board.pseudo_legal_moves:
-            board.push(move)
-
-            if not board.was_suicide() and not board.was_check_by_dropping_pawn(move):
-                count += perft(board, depth - 1)
+class PerftTestCase(unittest.TestCase):
+    def test_reference_counts(self):
+        for variant, fen in REFERENCE_COUNTS:
+            for depth, expected, nodes in check_reference(variant, fen, max_depth=4):
+                self.assertEqual(nodes, expected, (variant, fen, depth))
 
-            board.pop()
+    def test_bulk_counting(self):
+        for variant, fen in REFERENCE_COUNTS:
+            game = Game(variant, fen)
+            self.assertEqual(perft(game, 3, bulk=False), perft(game, 3))
 
-        return count
-    else:
-        return len(board.legal_moves)
+    def test_divide(self):
+        game = Game('standard', 'W:WK4,34,36,46:B7,K8,11,13,23,27')
+        results = divide(game, 3)
+        self.assertEqual(len(results), 5)
+        self.assertEqual(sum(nodes for _, nodes in results), 564)
+        self.assertTrue(all('x' in hub_move for hub_move, _ in results))
 
-class PerftTestCase(unittest.TestCase):
-    def test_1(self):
-        board = draughts.Board()
-        self.assertEqual(perft(board, 1), 30)
-        self.assertEqual(perft(board, 2), 900)
+    def test_game_is_restored(self):
+        game = Game('frisian', 'W:WK1,36,41:B3,4,5,7,8,9,10,11,12,17,18,19,23,K44')
+        fen = game.get_fen()
+        key = game.position_key()
+        perft(game, 4)
+        self.assertEqual(game.get_fen(), fen)
+        self.assertEqual(game.position_key(), key)
+        self.assertEqual(game.move_stack, [])
+        self.assertEqual(game.capture_stack, [])
 
-    def test_2(self):
-        board = draughts.Board(draughts.STARTING_FEN)
-        self.assertEqual(perft(board, 1), 30)
-        self.assertEqual(perft(board, 2), 900)
+    def test_depth_0(self):
+        self.assertEqual(perft(Game(), 0), 1)
 
-    def test_3(self):
-        # stalemate
-        board = draughts.Board('+R+N+SGKG+S+N+R/+B+N+SG+LG+S+N+B/P+LPP+LPP+LP/1P2P2P1/9/9/9/9/4k4 b 9P 200')
-        self.assertEqual(perft(board, 1), 0)
+    def test_parallel(self):
+        for variant, fen in (('standard', 'startpos'), ('frisian', 'W:WK1,36,41:B3,4,5,7,8,9,10,11,12,17,18,19,23,K44'), ('russian', 'B:WK3,15,16,27,28:B12,K29')):
+            expected = REFERENCE_COUNTS[(variant, fen)][3]
+            self.assertEqual(parallel_perft(Game(variant, fen), 4, workers=2), expected)
+            self.assertEqual(parallel_perft(Game(variant, fen), 4, split_depth=2, workers=2, walker=perft_without_bulk), expected)
 
-    def test_4(self):
-        # max perft with depth 1
-        board = draughts.Board('R8/2K1S1SSk/4B4/9/9/9/9/9/1L1L1L3 b RBGSNLP3g3n17p 1')
-        self.assertEqual(perft(board, 1), 593)
+    def test_parallel_divide(self):
+        game = Game('frisian', 'W:WK3,46:B41,37,K50')
+        for move in ([3, 9], [50, 44], [9, 3], [44, 50]):
+            game.move(move)
+        subtrees = parallel_divide(game, 4, split_depth=2, workers=2)
+        self.assertEqual(sum(nodes for _, nodes, _ in subtrees), perft(game, 4))
+        self.assertEqual([hub_moves for hub_moves, _, _ in subtrees][:2], ['03-08 37-42', '03-08 41-47'])
+        self.assertTrue(all(seconds >= 0 for _, _, seconds in subtrees))
 
-    def test_5(self):
-        board = draughts.Board('4k4/9/9/9/9/9/9/9/9 b 16P 1')
-        # 81 - (1 king) - (8 cannot move)
-        self.assertEqual(perft(board, 1), 72)
-        # 72 * 5 - (5 suicide move) = 355
-        self.assertEqual(perft(board, 2), 355)
+        hub_subtrees = parallel_divide(Game('russian').get_fen(), 3, 'russian', workers=2)
+        self.assertEqual([(hub_moves, nodes) for hub_moves, nodes, _ in hub_subtrees], divide(Game('russian'), 3))
+        self.assertEqual(parallel_perft(Game().get_fen(), 0, workers=1), 1)
 
-    def test_6(self):
-        board = draughts.Board('r7k/6K2/7SP/4s2bb/9/9/9/9/9 b r4g2s4n4l17p 1')
-        self.assertEqual(perft(board, 1), 4)
+    def test_main(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertEqual(main(['3', '--variant', 'russian', '--divide']), 0)
+        self.assertIn('perft(3) = 302', output.getvalue())
+        self.assertIn('nodes/s', output.getvalue())
 
-    def test_7(self):
-        board = draughts.Board('l7l/5bS2/p1np5/6Sk1/4p2B1/PSpPPn1G1/1P1G2g1N/2+l6/L1KN1+r3 b R3Pgs7p 1')
-        self.assertEqual(perft(board, 1), 1)
 
 if __name__ == '__main__':
     unittest.main()
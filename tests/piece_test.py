@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2010-2018 ImparaAI https://impara.ai (MIT License)
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+from draughts.game import Game
+from draughts.piece import Piece
+import unittest
+
+class PieceTestCase(unittest.TestCase):
+    def test_other_player(self):
+        piece = Piece()
+        piece.player = 1
+        self.assertEqual(piece.other_player, 2)
+        piece.player = 2
+        self.assertEqual(piece.other_player, 1)
+
+    def test_slots(self):
+        game = Game()
+        for obj in (game.board, game.board.searcher, game.board.bitboard, game.board.pieces[0]):
+            self.assertFalse(hasattr(obj, '__dict__'))
+
+    def test_copy_keeps_state(self):
+        game = Game()
+        game.move([32, 28])
+        copy = game.copy()
+        self.assertEqual(copy.get_fen(), game.get_fen())
+        self.assertEqual(copy.position_key(), game.position_key())
+        copy.move([19, 23])
+        self.assertNotEqual(copy.get_fen(), game.get_fen())
+
+    def test_memory_footprint(self):
+        game = Game()
+        footprint = game.memory_footprint()
+        self.assertGreater(footprint, 0)
+        self.assertLess(footprint, 16 * 1024)
+        self.assertLess(Game('russian').memory_footprint(), footprint)
+
+if __name__ == '__main__':
+    unittest.main()
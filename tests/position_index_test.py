@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+from draughts.archive import ArchiveReader, write_archive
+from draughts.game import Game
+from draughts.position_index import PositionIndex
+from draughts.zobrist import get_hub_fen_key
+from random_games import play_random_game
+import os
+import tempfile
+import unittest
+
+def find_postings(games, game):
+    """
+    The postings of game's position found by replaying every game.
+    """
+    fen = game.get_fen()
+    postings = []
+    for game_id, other in enumerate(games):
+        replay = Game(other.variant, other.initial_fen)
+        if replay.get_fen() == fen:
+            postings.append((game_id, 0))
+        for ply, hub_move in enumerate(other.hub_move_stack, 1):
+            for semi_move in replay.hub_to_li_board(hub_move.replace('-', '').replace('x', ''))[1]:
+                replay.move(semi_move)
+            if replay.get_fen() == fen:
+                postings.append((game_id, ply))
+    return postings
+
+
+class PositionIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'index')
+        self.games = [play_random_game(plies=60, seed=seed) for seed in range(20)]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_lookup(self):
+        with PositionIndex(self.path, segment_size=200) as index:
+            self.assertEqual(index.add_games(self.games), 0)
+            self.assertGreater(len(index.segments), 1)
+            self.assertEqual(index.game_count, 20)
+            self.assertEqual(index.lookup(Game()), [(game_id, 0) for game_id in range(20)])
+            for game in (self.games[3], Game().move([32, 28]), Game().move([32, 28]).move([19, 23])):
+                expected = find_postings(self.games, game)
+                self.assertTrue(expected)
+                self.assertEqual(index.lookup(game), expected)
+                self.assertEqual(index.lookup(game.get_fen()), expected)
+            self.assertEqual(index.lookup('W' + 'e' * 49 + 'w'), [])
+
+    def test_incremental_and_compact(self):
+        with PositionIndex(self.path) as index:
+            index.add_games(self.games[:10])
+        with PositionIndex(self.path) as index:
+            self.assertEqual(index.game_count, 10)
+            self.assertEqual(index.add_games(self.games[10:]), 10)
+            self.assertEqual(len(index.segments), 2)
+            expected = index.lookup(self.games[15])
+            self.assertEqual(expected, find_postings(self.games, self.games[15]))
+            index.compact()
+            self.assertEqual(len(index.segments), 1)
+            self.assertEqual(len(os.listdir(self.path)), 1)
+            self.assertEqual(index.lookup(self.games[15]), expected)
+            self.assertEqual(index.game_count, 20)
+
+    def test_archive_records(self):
+        archive_path = os.path.join(self.directory.name, 'games.drarc')
+        write_archive(archive_path, self.games)
+        with ArchiveReader(archive_path) as archive, PositionIndex(self.path) as index:
+            index.add_games(archive.get_record(number) for number in range(len(archive)))
+            self.assertEqual(index.lookup(self.games[5]), find_postings(self.games, self.games[5]))
+
+    def test_variants(self):
+        with PositionIndex(self.path, 'russian') as index:
+            self.assertRaises(ValueError, index.add_games, [Game()])
+            index.add_games([play_random_game('russian', plies=60)])
+            self.assertEqual(index.lookup(Game('russian')), [(0, 0)])
+            self.assertRaises(ValueError, index.lookup, Game())
+        self.assertRaises(ValueError, PositionIndex, self.path, 'standard')
+
+    def test_hub_fen_key(self):
+        game = self.games[0]
+        self.assertEqual(get_hub_fen_key(game.get_fen()), game.position_key())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+from draughts.game import Game
+import random
+
+def play_random_game(variant='standard', fen='startpos', plies=80, seed=0):
+    """
+    A game of up to plies random legal moves, the same for the same seed.
+    """
+    generator = random.Random(seed)
+    game = Game(variant, fen)
+    for _ in range(plies):
+        moves = game.legal_moves()[0]
+        if not moves or game.is_over():
+            break
+        for semi_move in generator.choice(moves):
+            game.move(semi_move)
+    return game
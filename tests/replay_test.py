@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2010-2018 ImparaAI https://impara.ai (MIT License)
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+from draughts.game import Game, IllegalMoveError
+from draughts.move import Move
+from random_games import play_random_game
+import unittest
+
+class ReplayTestCase(unittest.TestCase):
+    def assertSameGame(self, replay, game):
+        self.assertEqual(replay.get_fen(), game.get_fen())
+        self.assertEqual(replay.moves, game.moves)
+        self.assertEqual(replay.move_stack, game.move_stack)
+        self.assertEqual(replay.capture_stack, game.capture_stack)
+        self.assertEqual(replay.hub_move_stack, game.hub_move_stack)
+        self.assertEqual(replay.moves_since_last_capture, game.moves_since_last_capture)
+        self.assertEqual(replay.position_key(), game.position_key())
+
+    def test_modes_match_move(self):
+        for variant in ('standard', 'frisian', 'frysk!', 'brazilian', 'russian', 'breakthrough'):
+            for seed in range(3):
+                game = play_random_game(variant, seed=seed)
+                for validate in ('full', 'light', 'none'):
+                    self.assertSameGame(Game.from_moves(game.move_stack, variant, validate=validate), game)
+
+    def test_move_forms(self):
+        game = Game('standard', 'W:W28,33:B23,13,1')
+        game.move([28, 19]).move([19, 8]).move([1, 7])
+        moves = [[[28, 19], [19, 8]], Move((1, 7))]
+        self.assertSameGame(Game.from_moves(moves, fen='W:W28,33:B23,13,1'), game)
+        self.assertSameGame(Game.from_moves(['281908', '0107'], fen='W:W28,33:B23,13,1', validate='none'), game)
+
+    def test_li_to_steps(self):
+        game = Game()
+        self.assertEqual(game.li_to_steps('281908'), [[28, 19], [19, 8]])
+        self.assertEqual(game.li_to_steps('0107'), [[1, 7]])
+        for li_move in play_random_game('standard').move_stack:
+            self.assertEqual(game.board_to_li(game.li_to_steps(li_move)), li_move)
+
+    def test_first_illegal_ply(self):
+        moves = play_random_game('standard').move_stack
+        with self.assertRaises(IllegalMoveError) as context:
+            Game.from_moves(moves[:5] + moves[7:])
+        self.assertEqual(context.exception.ply, 5)
+        with self.assertRaises(ValueError):
+            Game.from_moves(['3228', '1923', '3127'])
+
+    def test_light_checks(self):
+        for moves, ply in ((['3228', '3227'], 1), (['3228', '1923', '2823'], 2), (['3233'], 0), (['2823'], 0)):
+            with self.assertRaises(IllegalMoveError, msg=moves) as context:
+                Game.from_moves(moves, validate='light')
+            self.assertEqual(context.exception.ply, ply)
+        with self.assertRaises(IllegalMoveError):
+            # The capture goes on from 19
+            Game.from_moves([[[28, 19]]], fen='W:W28:B23,13', validate='light')
+
+    def test_light_piece_moves(self):
+        fen = 'W:W28,33,K45:B23,13,1'
+        for move in ([[33, 24]], [[33, 22]], [[33, 39]], [[33, 28]], [[28, 19], [19, 10]], [[28, 17]], [[28, 19], [19, 28]]):
+            game = Game('standard', fen)
+            self.assertFalse(game.push_trusted_move(move, check=True), move)
+            self.assertEqual(game.get_li_fen(), Game('standard', fen).get_li_fen())
+            self.assertEqual((game.moves, game.move_stack, game.not_added_move, game.undo_stack), ([], [], [], []))
+        for move in ([[33, 29]], [[45, 34]], [[28, 19], [19, 8]]):
+            self.assertTrue(Game('standard', fen).push_trusted_move(move, check=True), move)
+
+    def test_light_rolls_back(self):
+        game = Game('standard', 'W:W28,33:B23,13,1')
+        # The second step jumps over the piece captured by the first one
+        self.assertFalse(game.push_trusted_move([[28, 19], [19, 8], [8, 30]], check=True))
+        self.assertEqual(game.get_fen(), Game('standard', 'W:W28,33:B23,13,1').get_fen())
+        self.assertEqual(game.moves, [])
+        self.assertTrue(game.push_trusted_move([[28, 19], [19, 8]], check=True))
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            Game.from_moves([], validate='fast')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2010-2018 ImparaAI https://impara.ai (MIT License)
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+from draughts.game import Game
+import random
+import unittest
+
+def get_state(game):
+    return (game.get_fen(), game.position_key(), list(game.moves), list(game.move_stack), list(game.capture_stack), list(game.hub_move_stack),
+            list(game.not_added_move), list(game.not_added_capture), game.moves_since_last_capture,
+            sorted((piece.position, piece.king, piece.became_king) for piece in game.board.searcher.uncaptured_pieces), game.legal_moves())
+
+class UndoTestCase(unittest.TestCase):
+    def test_pop_every_step(self):
+        for variant in ('standard', 'frisian', 'frysk!', 'brazilian', 'russian', 'breakthrough'):
+            rng = random.Random(variant)
+            game = Game(variant)
+            states = []
+            for _ in range(100):
+                moves, captures = game.legal_moves()
+                if not moves:
+                    break
+                for step in rng.choice(moves):
+                    states.append(get_state(game))
+                    game.move(step)
+            while states:
+                game.pop()
+                self.assertEqual(get_state(game), states.pop(), variant)
+            with self.assertRaises(IndexError):
+                game.pop()
+
+    def test_pop_full_move(self):
+        game = Game('standard', 'W:W28,33:B23,13,1')
+        start = get_state(game)
+        game.move([28, 19])
+        self.assertEqual(game.pop_full_move(), [[28, 19]])
+        self.assertEqual(get_state(game), start)
+        game.move([28, 19]).move([19, 8])
+        after_capture = get_state(game)
+        game.move([1, 7])
+        self.assertEqual(game.pop_full_move(), [[1, 7]])
+        self.assertEqual(get_state(game), after_capture)
+        self.assertEqual(game.pop_full_move(), [[28, 19], [19, 8]])
+        self.assertEqual(get_state(game), start)
+        with self.assertRaises(IndexError):
+            game.pop_full_move()
+
+    def test_promotion(self):
+        game = Game('standard', 'W:W7:B40')
+        game.move([7, 2])
+        self.assertTrue(game.board.searcher.get_piece_by_position(2).king)
+        game.pop()
+        piece = game.board.searcher.get_piece_by_position(7)
+        self.assertFalse(piece.king)
+        self.assertEqual(piece.became_king, -100)
+        self.assertEqual(game.board.searcher.get_king_count(2), 0)
+
+    def test_after_from_moves(self):
+        game = Game()
+        for move in ([32, 28], [19, 23], [28, 19], [14, 23]):
+            game.move(move)
+        replay = Game.from_moves(game.move_stack, validate='none')
+        replay.pop_full_move()
+        replay.pop_full_move()
+        self.assertEqual(replay.move_stack, ['3228', '1923'])
+        self.assertEqual(replay.get_fen(), Game().move([32, 28]).move([19, 23]).get_fen())
+        self.assertFalse(replay.is_over())
+
+
+if __name__ == '__main__':
+    unittest.main()
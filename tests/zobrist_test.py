@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the python-draughts library.
+# Copyright (C) 2010-2018 ImparaAI https://impara.ai (MIT License)
+# Copyright (C) 2021- TheYoBots (Yohaan Seth Nathan)
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+
+from draughts.board import Board
+from draughts.game import Game
+import unittest
+
+class ZobristTestCase(unittest.TestCase):
+    def test_same_position_same_key(self):
+        self.assertEqual(Game().position_key(), Game().position_key())
+        self.assertNotEqual(Game().position_key(), Game('russian').position_key())
+
+    def test_transposition(self):
+        game_1 = Game()
+        for move in ([31, 26], [19, 23], [32, 27], [20, 24]):
+            game_1.move(move)
+        game_2 = Game()
+        for move in ([32, 27], [20, 24], [31, 26], [19, 23]):
+            game_2.move(move)
+        self.assertEqual(game_1.position_key(), game_2.position_key())
+
+    def test_incremental_matches_fresh_key(self):
+        game = Game()
+        for move in ([32, 28], [19, 23], [28, 19], [14, 23]):
+            game.move(move)
+        board = Board('standard', game.get_fen())
+        self.assertEqual(game.position_key(), board.zobrist_key)
+
+    def test_side_to_move(self):
+        self.assertNotEqual(Board('standard', 'W' + 'e' * 50).zobrist_key, Board('standard', 'B' + 'e' * 50).zobrist_key)
+
+    def test_make_unmake(self):
+        game = Game(fen='W:W15:B10,8,9')
+        key = game.position_key()
+        undo_info = game.board.make([15, 4], 1, [])
+        self.assertNotEqual(game.board.zobrist_key, key)
+        game.board.unmake(undo_info)
+        self.assertEqual(game.position_key(), key)
+
+    def test_capture_in_progress(self):
+        game = Game(fen='W:W15:B10,8,9')
+        game.move([15, 4])
+        self.assertEqual(game.not_added_capture, [10])
+        mid_sequence = game.position_key()
+        board = Board('standard', game.get_fen())
+        self.assertNotEqual(mid_sequence, board.zobrist_key)
+        game.move([4, 13])
+        game.move([13, 2])
+        self.assertEqual(game.position_key(), Board('standard', game.get_fen()).zobrist_key)
+
+if __name__ == '__main__':
+    unittest.main()